@@ -0,0 +1,43 @@
+"""
+Memo for indicators several strategies compute on the same price data
+Backtester.run hands each strategy a shallow copy of one frame, so the OHLC
+buffers are shared between runs even though the DataFrame objects differ.
+Entries are keyed on those buffers and dropped once they are freed.
+"""
+
+import weakref
+from typing import Dict, Tuple
+
+import numpy as np
+import talib
+
+_ATR_CACHE: Dict[tuple, Tuple[tuple, np.ndarray]] = {}
+
+
+def _owner(a: np.ndarray) -> np.ndarray:
+    """The array that owns a's buffer (follows view bases)"""
+    while isinstance(a.base, np.ndarray):
+        a = a.base
+    return a
+
+
+def cached_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    talib.ATR(high, low, close, period), reused while the same buffers live
+
+    Inputs are assumed not to be modified in place while cached. The result is
+    shared between callers, so it is returned read-only.
+    """
+    key = (high.ctypes.data, low.ctypes.data, close.ctypes.data, close.shape[0], period)
+    hit = _ATR_CACHE.get(key)
+    if hit is not None and all(ref() is not None for ref in hit[0]):
+        return hit[1]
+
+    atr = talib.ATR(high, low, close, timeperiod=period)
+    atr.flags.writeable = False
+
+    def evict(_, key=key):
+        _ATR_CACHE.pop(key, None)
+
+    _ATR_CACHE[key] = (tuple(weakref.ref(_owner(a), evict) for a in (high, low, close)), atr)
+    return atr
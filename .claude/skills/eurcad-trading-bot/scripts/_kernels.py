@@ -0,0 +1,256 @@
+"""
+Numba kernels for the strategy indicators in strategy_template
+Single-pass loops over float64 arrays; they run as plain Python without numba
+
+Kernels declare their signatures, so numba compiles them (or loads them from
+the on-disk cache) at import instead of on the first backtest that uses them.
+Inputs must therefore be C-contiguous float64 arrays.
+"""
+
+import numpy as np
+
+from _njit import njit
+
+
+@njit('int8[::1](float64[::1], float64[::1])', cache=True, nogil=True)
+def ema_cross_kernel(fast, slow):
+    """
+    EMA crossover per bar: 1 = fast crossed above slow, -1 = crossed below, 0 = none
+
+    NaN (indicator warm-up) never counts as a cross, matching the pandas
+    comparisons it replaces; fastmath is left off for that reason.
+    """
+    n = fast.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+
+    for i in range(1, n):
+        if fast[i] > slow[i] and fast[i - 1] <= slow[i - 1]:
+            out[i] = 1
+        elif fast[i] < slow[i] and fast[i - 1] >= slow[i - 1]:
+            out[i] = -1
+
+    return out
+
+
+@njit(
+    'int8[::1](int8[::1], float64[::1], float64[::1], float64[::1], float64)',
+    cache=True, nogil=True
+)
+def trend_signal_kernel(ema_cross, macd, macd_signal, adx, adx_threshold):
+    """
+    Trend following signal per bar: 1 = BUY, -1 = SELL, 0 = none
+
+    BUY needs a bullish EMA cross, MACD above its signal line and ADX above
+    the threshold; SELL the bearish mirror. NaN fails every comparison, so
+    warm-up bars stay 0.
+    """
+    n = ema_cross.shape[0]
+    out = np.zeros(n, dtype=np.int8)
+
+    for i in range(n):
+        if ema_cross[i] == 0 or not adx[i] > adx_threshold:
+            continue
+        if ema_cross[i] == 1 and macd[i] > macd_signal[i]:
+            out[i] = 1
+        elif ema_cross[i] == -1 and macd[i] < macd_signal[i]:
+            out[i] = -1
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def _first_valid(a):
+    """Index of the first non-NaN value (len(a) if none), where TA-Lib starts"""
+    i = 0
+    while i < a.shape[0] and np.isnan(a[i]):
+        i += 1
+    return i
+
+
+@njit(
+    'UniTuple(float64[::1], 5)(float64[::1], float64[::1], float64[::1], int64, float64, int64, int64)',
+    cache=True, nogil=True
+)
+def mean_reversion_kernel(close, high, low, bb_period, bb_std, rsi_period, atr_period):
+    """
+    Bollinger Bands, RSI and ATR in a single pass over the bars
+
+    Each indicator keeps O(1) running state: window sums for the bands,
+    Wilder-smoothed average gain / loss for RSI and Wilder-smoothed true range
+    for ATR. Warm-up lengths (NaN), seeding and smoothing follow
+    TA-Lib's BBANDS (SMA), RSI and ATR; values agree with talib to within
+    floating point rounding (~1e-15 relative).
+
+    Returns:
+        (bb_upper, bb_middle, bb_lower, rsi, atr)
+    """
+    n = close.shape[0]
+    bb_upper = np.empty(n)
+    bb_middle = np.empty(n)
+    bb_lower = np.empty(n)
+    rsi = np.empty(n)
+    atr = np.empty(n)
+
+    # Like talib, start each indicator after leading NaNs in its inputs;
+    # everything before its first value is NaN
+    close_start = _first_valid(close)
+    atr_start = max(close_start, _first_valid(high), _first_valid(low))
+
+    bb_upper[:min(close_start + bb_period - 1, n)] = np.nan
+    bb_middle[:min(close_start + bb_period - 1, n)] = np.nan
+    bb_lower[:min(close_start + bb_period - 1, n)] = np.nan
+    rsi[:min(close_start + rsi_period, n)] = np.nan
+    atr[:min(atr_start + atr_period, n)] = np.nan
+
+    # Wilder smoothing multiplies by 1/period (as TA-Lib's RSI does) rather
+    # than dividing: the running averages are a serial dependency chain
+    rsi_scale = 1.0 / rsi_period
+    atr_scale = 1.0 / atr_period
+
+    window_sum = 0.0
+    recentre_in = 0
+    shift = 0.0
+    shifted_sum = 0.0
+    shifted_sumsq = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    prev_atr = 0.0
+
+    for i in range(close_start, n):
+        x = close[i]
+
+        # Bollinger Bands: running-sum SMA middle. The variance comes from
+        # running sums of (close - shift); sum(x**2) - n * mean**2 on raw FX
+        # prices cancels badly. shift is re-centred on the middle band (sums
+        # rebuilt from the window) once per bb_period bars, so rounding can't
+        # accumulate and the rebuild costs O(1) per bar amortised.
+        k = i - close_start
+        window_sum += x
+        if k >= bb_period - 1:
+            middle = window_sum / bb_period
+            if recentre_in == 0:
+                recentre_in = bb_period
+                shift = middle
+                shifted_sum = 0.0
+                shifted_sumsq = 0.0
+                for j in range(i - bb_period + 1, i + 1):
+                    shifted_sum += close[j] - shift
+                    shifted_sumsq += (close[j] - shift) * (close[j] - shift)
+            else:
+                shifted_sum += x - shift
+                shifted_sumsq += (x - shift) * (x - shift)
+
+            recentre_in -= 1
+
+            shifted_mean = shifted_sum / bb_period
+            variance = shifted_sumsq / bb_period - shifted_mean * shifted_mean
+            std = np.sqrt(variance) if variance > 0.0 else 0.0
+
+            bb_middle[i] = middle
+            bb_upper[i] = middle + std * bb_std
+            bb_lower[i] = middle - std * bb_std
+
+            trailing = close[i - bb_period + 1]
+            window_sum -= trailing
+            shifted_sum -= trailing - shift
+            shifted_sumsq -= (trailing - shift) * (trailing - shift)
+
+        # RSI: simple average of the first rsi_period changes, then Wilder smoothing
+        if k > 0:
+            change = x - close[i - 1]
+            if k > rsi_period:
+                avg_gain *= rsi_period - 1
+                avg_loss *= rsi_period - 1
+            # max() rather than an if/else: the sign of change is a coin flip
+            # for the branch predictor, and adding 0.0 leaves a sum unchanged
+            avg_gain += max(change, 0.0)
+            avg_loss += max(-change, 0.0)
+            if k > rsi_period:
+                avg_gain *= rsi_scale
+                avg_loss *= rsi_scale
+            elif k == rsi_period:
+                avg_gain /= rsi_period
+                avg_loss /= rsi_period
+            if k >= rsi_period:
+                total = avg_gain + avg_loss
+                rsi[i] = 100.0 * (avg_gain / total) if total != 0.0 else 0.0
+
+        # ATR: simple average of the first atr_period true ranges, then Wilder smoothing
+        k = i - atr_start
+        if k > 0:
+            prev_close = close[i - 1]
+            true_range = high[i] - low[i]
+            true_range = max(true_range, abs(prev_close - high[i]))
+            true_range = max(true_range, abs(prev_close - low[i]))
+
+            if k > atr_period:
+                prev_atr = (prev_atr * (atr_period - 1) + true_range) * atr_scale
+                atr[i] = prev_atr
+            else:
+                prev_atr += true_range
+                if k == atr_period:
+                    prev_atr /= atr_period
+                    atr[i] = prev_atr
+
+    return bb_upper, bb_middle, bb_lower, rsi, atr
+
+
+@njit('UniTuple(float64[::1], 2)(float64[::1], float64[::1], int64)', cache=True, nogil=True)
+def rolling_max_min(high, low, window):
+    """
+    Rolling max of high and min of low over `window` bars, O(n) overall
+
+    Each side keeps a monotonic deque of bar indices in a ring buffer of
+    `window` slots: the front is the current extreme, and every bar is pushed
+    and popped at most once. Like pandas rolling(window).max()/.min(), the
+    first window - 1 bars are NaN, and so is any window containing a NaN
+    (high or low; both outputs go NaN together).
+
+    Returns:
+        (range_high, range_low)
+    """
+    n = high.shape[0]
+    range_high = np.empty(n)
+    range_low = np.empty(n)
+
+    high_q = np.empty(window, dtype=np.int64)
+    low_q = np.empty(window, dtype=np.int64)
+    high_head = high_len = 0
+    low_head = low_len = 0
+    last_nan = -window  # most recent bar with a NaN high or low
+
+    for i in range(n):
+        h = high[i]
+        lo = low[i]
+
+        # Drop indices that have left the window
+        if high_len and high_q[high_head] <= i - window:
+            high_head = (high_head + 1) % window
+            high_len -= 1
+        if low_len and low_q[low_head] <= i - window:
+            low_head = (low_head + 1) % window
+            low_len -= 1
+
+        if np.isnan(h) or np.isnan(lo):
+            last_nan = i
+
+        # Push, first popping every value the new bar dominates
+        if not np.isnan(h):
+            while high_len and high[high_q[(high_head + high_len - 1) % window]] <= h:
+                high_len -= 1
+            high_q[(high_head + high_len) % window] = i
+            high_len += 1
+        if not np.isnan(lo):
+            while low_len and low[low_q[(low_head + low_len - 1) % window]] >= lo:
+                low_len -= 1
+            low_q[(low_head + low_len) % window] = i
+            low_len += 1
+
+        if i < window - 1 or last_nan > i - window:
+            range_high[i] = np.nan
+            range_low[i] = np.nan
+        else:
+            range_high[i] = high[high_q[high_head]]
+            range_low[i] = low[low_q[low_head]]
+
+    return range_high, range_low
@@ -0,0 +1,51 @@
+"""
+Retry helpers for the EUR/CAD scripts
+Exponential backoff with jitter, so bot instances restarted together don't
+retry in lockstep against IBKR or the calendar feed
+"""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar('T')
+
+log = logging.getLogger(__name__)
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0, jitter: float = 0.5) -> float:
+    """
+    Seconds to wait after failed attempt number `attempt` (0-based)
+
+    min(cap, base * 2**attempt), scaled by a random factor in [1 - jitter, 1 + jitter]
+    """
+    return min(cap, base * 2 ** attempt) * (1 + random.uniform(-jitter, jitter))
+
+
+async def retry_async(fn: Callable[[], Awaitable[T]], max_retries: int = 3,
+                      base: float = 1.0, cap: float = 30.0, jitter: float = 0.5,
+                      recoverable: Callable[[Exception], bool] = lambda e: True) -> T:
+    """
+    Await fn(), retrying recoverable failures with exponential backoff
+
+    Args:
+        fn: Zero-argument coroutine function to call
+        max_retries: Retries after the first attempt
+        base, cap, jitter: See backoff_delay
+        recoverable: Returns False for errors that retrying cannot fix
+
+    Returns:
+        fn's result; the last exception is re-raised once retries run out
+    """
+    attempt = 0
+    while True:
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt >= max_retries or not recoverable(e):
+                raise
+            delay = backoff_delay(attempt, base, cap, jitter)
+            log.warning("Retrying in %.1fs after: %s", delay, e)
+            await asyncio.sleep(delay)
+            attempt += 1
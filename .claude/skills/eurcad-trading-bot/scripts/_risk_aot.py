@@ -0,0 +1,35 @@
+"""
+Ahead-of-time build of the position sizing kernels
+Run once after install to produce risk_core (a native extension next to this
+file). risk_manager imports it when present, so the first sizing of the day
+pays no JIT compile cost; otherwise it falls back to the cached numba JIT kernels.
+
+Usage:
+    python _risk_aot.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+from risk_manager import _position_size_core, _position_sizes_core, _volatility_adjust_core
+
+# (entry_price, stop_loss_price, risk_amount, pip_size, pip_value_per_unit)
+#  -> (position_size, stop_loss_pips, risk_amount)
+POSITION_SIZE_SIGNATURE = 'Tuple((i8, f8, f8))(f8, f8, f8, f8, f8)'
+POSITION_SIZES_SIGNATURE = 'Tuple((i8[:], f8[:], f8[:]))(f8[:], f8[:], f8, f8, f8)'
+
+# (position_size, stop_loss_pips, volatility_ratio, pip_value_per_unit)
+#  -> (adjusted_size, risk_amount)
+VOLATILITY_ADJUST_SIGNATURE = 'Tuple((i8, f8))(i8, f8, f8, f8)'
+
+cc = CC('risk_core')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export('position_size', POSITION_SIZE_SIGNATURE)(_position_size_core.py_func)
+cc.export('position_sizes', POSITION_SIZES_SIGNATURE)(_position_sizes_core.py_func)
+cc.export('volatility_adjust', VOLATILITY_ADJUST_SIGNATURE)(_volatility_adjust_core.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"✓ Built risk_core in {cc.output_dir}")
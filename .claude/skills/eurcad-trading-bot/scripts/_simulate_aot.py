@@ -0,0 +1,32 @@
+"""
+Ahead-of-time build of the backtest simulation kernel
+Run once after install to produce backtest_core (a native extension next to
+this file). backtesting_framework imports it when present, so backtests pay no
+JIT compile cost; otherwise it falls back to the cached numba JIT kernel.
+
+Usage:
+    python _simulate_aot.py
+"""
+
+import os
+
+from numba.pycc import CC
+
+from backtesting_framework import _simulate_njit
+
+# (high, low, close, close_q, sig, exit_long, exit_short, sl_arr, tp_arr,
+#  initial_balance, risk, pip_value, pip_size, commission_per_lot)
+#  -> (equity_curve, trades, n_trades, final_balance)
+SIMULATE_SIGNATURE = (
+    'Tuple((f8[:], f8[:, :], i8, f8))'
+    '(f4[:], f4[:], f8[:], i8[:], i1[:], b1[:], b1[:], f8[:], f8[:], f8, f8, f8, f8, f8)'
+)
+
+cc = CC('backtest_core')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export('simulate', SIMULATE_SIGNATURE)(_simulate_njit.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"✓ Built backtest_core in {cc.output_dir}")
@@ -3,13 +3,42 @@ Backtesting Framework for EUR/CAD Trading Strategies
 Validates strategies before live deployment
 """
 
+import os
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union
 from datetime import datetime
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 
+from _njit import njit
+from strategy_template import StrategyView
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+
+# Field (row) layout of the trade buffer produced by _simulate_njit
+(T_ENTRY_I, T_EXIT_I, T_SIDE, T_ENTRY_PRICE, T_EXIT_PRICE, T_SIZE,
+ T_STOP_LOSS, T_TAKE_PROFIT, T_PNL_PIPS, T_GROSS_PNL, T_COMMISSION,
+ T_NET_PNL, T_REASON, T_BALANCE_AFTER) = range(14)
+TRADE_FIELDS = 14
+
+# P&L is computed on closes quantized to pipettes (0.1 pip, the 5th decimal
+# of a EUR/CAD quote), so per-bar mark-to-market is integer arithmetic
+TICKS_PER_PIP = 10
+
+# int8 signal code for bars without a signal value (indicator warm-up)
+SIG_NONE = -128
+
+# Categories of the trades' action column (code = T_SIDE < 0)
+TRADE_ACTIONS = ('BUY', 'SELL')
+
+# Exit reason codes stored in T_REASON
+EXIT_REASONS = ('stop_loss', 'take_profit', 'strategy_signal', 'opposite_signal', 'end_of_data')
+
 
 @dataclass
 class BacktestResult:
@@ -29,8 +58,201 @@ class BacktestResult:
     max_drawdown: float
     max_drawdown_percent: float
     avg_trade_duration: float
-    trades: List[Dict]
+    trades: pd.DataFrame
     equity_curve: pd.Series
+    running_max: np.ndarray  # peak equity so far, per equity_curve point
+    drawdown_pct: np.ndarray  # % below running_max, per equity_curve point
+
+
+@njit(cache=True)
+def _record_trade(trades, k, entry_i, exit_i, side, entry_price, exit_price,
+                  pnl_ticks, size, stop_loss, take_profit, commission, reason,
+                  balance, pip_value):
+    """Write closed trade k into the trade buffer and return the new balance"""
+    pnl_pips = pnl_ticks / TICKS_PER_PIP
+    lots = size / 100000
+    gross_pnl = pnl_pips * pip_value * lots
+    net_pnl = gross_pnl - commission
+    balance += net_pnl
+
+    trades[T_ENTRY_I, k] = entry_i
+    trades[T_EXIT_I, k] = exit_i
+    trades[T_SIDE, k] = side
+    trades[T_ENTRY_PRICE, k] = entry_price
+    trades[T_EXIT_PRICE, k] = exit_price
+    trades[T_SIZE, k] = size
+    trades[T_STOP_LOSS, k] = stop_loss
+    trades[T_TAKE_PROFIT, k] = take_profit
+    trades[T_PNL_PIPS, k] = pnl_pips
+    trades[T_GROSS_PNL, k] = gross_pnl
+    trades[T_COMMISSION, k] = commission
+    trades[T_NET_PNL, k] = net_pnl
+    trades[T_REASON, k] = reason
+    trades[T_BALANCE_AFTER, k] = balance
+    return balance
+
+
+@njit(cache=True)
+def _find_exit(start, side, stop_loss, take_profit, high, low, sig, exit_flags):
+    """
+    First bar >= start on which an open position exits, and why
+
+    Prices are multiplied by side so longs and shorts share one comparison,
+    and every condition is evaluated without short-circuiting to keep the
+    scan loop branch-light. SIG_NONE bars (indicator warm-up) never trigger
+    an exit. Priority on the exit bar: stop loss, take profit, strategy
+    exit, opposite signal.
+
+    take_profit / exit_flags may be None when the strategy never sets them;
+    numba prunes the `is not None` branches at compile time, so each
+    combination gets its own specialized (and cached) scan loop.
+
+    Returns:
+        Tuple of (exit bar, reason code); (len(sig), -1) if still open at the end
+    """
+    adverse = low if side > 0 else high
+    favorable = high if side > 0 else low
+    # high/low are float32, so compare against levels rounded the same way
+    sl_level = np.float32(stop_loss) * side
+    tp_level = 0.0
+    has_tp = False
+    if take_profit is not None:
+        tp_level = np.float32(take_profit) * side
+        has_tp = take_profit == take_profit and take_profit != 0.0
+
+    for j in range(start, sig.shape[0]):
+        s = sig[j]
+        hit_sl = adverse[j] * side <= sl_level
+        hit = hit_sl | (s == -side)
+        hit_tp = False
+        if take_profit is not None:
+            hit_tp = has_tp & (favorable[j] * side >= tp_level)
+            hit = hit | hit_tp
+        hit_exit = False
+        if exit_flags is not None:
+            hit_exit = exit_flags[j]
+            hit = hit | hit_exit
+        if hit & (s != SIG_NONE):
+            if hit_sl:
+                return j, 0
+            if hit_tp:
+                return j, 1
+            if hit_exit:
+                return j, 2
+            return j, 3
+
+    return sig.shape[0], -1
+
+
+@njit(cache=True)
+def _simulate_njit(high, low, close, close_q, sig, exit_long, exit_short, sl_arr, tp_arr,
+                   initial_balance, risk, pip_value, pip_size, commission_per_lot):
+    """
+    Bar-by-bar simulation core (one position at a time)
+
+    Entries and exits fill at the bar close. high/low are float32 (only
+    compared against SL/TP levels); close and the balance stay float64.
+    sig is the int8 signal
+    (1, -1, 0 or SIG_NONE). close_q is the close in pipettes (int64) and
+    drives all P&L. sl_arr/tp_arr hold the levels for a position opened on
+    that bar (NaN take profit = none). tp_arr and the exit arrays may be
+    None when the strategy has no take profit / exit signals at all, which
+    compiles a kernel without those checks.
+
+    Returns:
+        Tuple of (equity_curve, trades, n_trades, final_balance); trades is
+        field-major (TRADE_FIELDS x capacity) so every field is contiguous
+    """
+
+    n = close.shape[0]
+    equity_curve = np.empty(n + 1)
+    equity_curve[0] = initial_balance
+    # A trade spans at least two bars, so this bound is never exceeded
+    trades = np.empty((TRADE_FIELDS, n // 2 + 1))
+    n_trades = 0
+
+    balance = initial_balance
+
+    i = 0
+    while i < n:
+        s = sig[i]
+
+        # Flat: no signal, or not enough data for indicators
+        if s == 0 or s == SIG_NONE:
+            equity_curve[i + 1] = balance
+            i += 1
+            continue
+
+        entry_price = close[i]
+        stop_pips = abs(entry_price - sl_arr[i]) / pip_size
+
+        # Unusable stop (indicator warm-up) - no trade
+        if not stop_pips > 0:
+            equity_curve[i + 1] = balance
+            i += 1
+            continue
+
+        side = 1.0 if s == 1 else -1.0
+        entry_i = i
+        stop_loss = sl_arr[i]
+
+        # Risk-based size, rounded to 1000 units (min 0.01 lot)
+        lots = (balance * risk) / (pip_value * stop_pips)
+        size = float(int(lots * 100000))
+        size = np.rint(size / 1000) * 1000
+        if size < 1000:
+            size = 1000.0
+        commission = size / 100000 * commission_per_lot
+        entry_q = close_q[i]
+        tick_value = side * pip_value * (size / 100000) / TICKS_PER_PIP
+
+        # Jump straight to the exit bar, then mark-to-market the bars in between
+        exit_flags = exit_long if side > 0 else exit_short
+        if tp_arr is None:
+            take_profit = np.nan
+            exit_i, reason = _find_exit(
+                i + 1, side, stop_loss, None, high, low, sig, exit_flags
+            )
+        else:
+            take_profit = tp_arr[i]
+            exit_i, reason = _find_exit(
+                i + 1, side, stop_loss, take_profit, high, low, sig, exit_flags
+            )
+
+        equity = balance
+        for k in range(i, exit_i):
+            if k == i or sig[k] != SIG_NONE:
+                equity = balance + (close_q[k] - entry_q) * tick_value
+            equity_curve[k + 1] = equity
+
+        if exit_i == n:
+            # Close any remaining open position
+            balance = _record_trade(
+                trades, n_trades, entry_i, n - 1, side, entry_price, close[n - 1],
+                (close_q[n - 1] - entry_q) * side, size, stop_loss, take_profit,
+                commission, 4, balance, pip_value
+            )
+            n_trades += 1
+            break
+
+        balance = _record_trade(
+            trades, n_trades, entry_i, exit_i, side, entry_price, close[exit_i],
+            (close_q[exit_i] - entry_q) * side, size, stop_loss, take_profit,
+            commission, reason, balance, pip_value
+        )
+        n_trades += 1
+        equity_curve[exit_i + 1] = balance
+        i = exit_i + 1
+
+    return equity_curve, trades, n_trades, balance
+
+
+# Prefer the ahead-of-time build (python _simulate_aot.py) so runs skip JIT warmup;
+# rebuild it after changing the kernel
+try:
+    from backtest_core import simulate as _simulate
+except ImportError:
+    _simulate = _simulate_njit
 
 
 class Backtester:
@@ -49,12 +271,17 @@ class Backtester:
         Initialize backtester
 
         Args:
-            data: DataFrame with OHLCV data
+            data: DataFrame with OHLCV data (pandas, or polars with a
+                'time'/'timestamp'/'date' column). Pandas frames are kept by
+                reference, not copied; do not mutate them while backtesting.
             initial_balance: Starting account balance
             risk_per_trade: Risk per trade (decimal)
             commission_per_lot: Commission cost per lot
         """
-        self.data = data.copy()
+        if pl is not None and isinstance(data, pl.DataFrame):
+            self.data = _from_polars(data)
+        else:
+            self.data = data
         self.initial_balance = initial_balance
         self.risk_per_trade = risk_per_trade
         self.commission_per_lot = commission_per_lot
@@ -62,13 +289,38 @@ class Backtester:
         # Trading state
         self.balance = initial_balance
         self.equity = initial_balance
-        self.trades = []
-        self.equity_curve = []
+        self._trade_cols = {}
+        self._ntrades = 0
+        self.equity_curve = np.empty(0)
+
+        # Set by from_parquet so run_many workers can map the file themselves
+        self._parquet_path = None
 
         # Constants
         self.pip_value = 10  # $10 per pip per standard lot
         self.pip_size = 0.0001
 
+    @classmethod
+    def from_parquet(cls, path: str, **kwargs) -> "Backtester":
+        """
+        Create a backtester over a memory-mapped Parquet file (needs pyarrow)
+
+        The OS pages the columns in on demand. run_many() sends worker
+        processes the path instead of the pickled frame, so every worker
+        maps the same file and shares the page cache.
+
+        Args:
+            path: Parquet file with OHLCV data (DatetimeIndex, or a
+                'time'/'timestamp'/'date' column)
+            **kwargs: Other Backtester arguments (initial_balance, ...)
+
+        Returns:
+            Backtester instance
+        """
+        backtester = cls(_read_parquet(path), **kwargs)
+        backtester._parquet_path = path
+        return backtester
+
     def run(
         self,
         strategy,
@@ -90,12 +342,9 @@ class Backtester:
         print(f"Running Backtest: {strategy.name}")
         print(f"{'='*60}")
 
-        # Filter data by date range
-        data = self.data.copy()
-        if start_date:
-            data = data[data.index >= start_date]
-        if end_date:
-            data = data[data.index <= end_date]
+        # Filter data by date range. Strategies only add columns, so a shallow
+        # copy keeps them off self.data without duplicating the OHLCV values
+        data = self._date_range(start_date, end_date).copy(deep=False)
 
         print(f"Period: {data.index[0]} to {data.index[-1]}")
         print(f"Total bars: {len(data)}")
@@ -103,52 +352,46 @@ class Backtester:
         # Reset state
         self.balance = self.initial_balance
         self.equity = self.initial_balance
-        self.trades = []
-        self.equity_curve = [self.initial_balance]
 
         # Calculate signals
         data = strategy.calculate_signals(data)
 
-        # Track open position
-        position = None
-
-        # Iterate through data
-        for i in range(len(data)):
-            current = data.iloc[i]
-
-            # Skip if not enough data for indicators
-            if pd.isna(current.get('signal', np.nan)):
-                self.equity_curve.append(self.equity)
-                continue
-
-            # Check if we have an open position
-            if position is not None:
-                # Check for exit conditions
-                exit_signal = self._check_exit(position, current, data.iloc[:i+1], strategy)
-
-                if exit_signal:
-                    # Close position
-                    self._close_position(position, current, exit_signal)
-                    position = None
-
-            # Check for new entry signals
-            elif current['signal'] != 0:
-                # Open new position
-                position = self._open_position(current, strategy, data.iloc[:i+1])
-
-            # Update equity curve
-            if position:
-                # Mark-to-market
-                self.equity = self.balance + self._calculate_unrealized_pnl(position, current)
-            else:
-                self.equity = self.balance
-
-            self.equity_curve.append(self.equity)
-
-        # Close any remaining open position
-        if position is not None:
-            last_bar = data.iloc[-1]
-            self._close_position(position, last_bar, 'end_of_data')
+        # Extract contiguous arrays once for the simulation kernel
+        view = StrategyView.from_frame(data)
+        # float32 is ample for SL/TP hit tests (prices ~1.5, steps of 1e-5)
+        # and halves the memory the exit scan streams through
+        high = view.high.astype(np.float32)
+        low = view.low.astype(np.float32)
+        close = view.close.astype(np.float64, copy=False)
+        close_q = np.rint(close * (TICKS_PER_PIP / self.pip_size)).astype(np.int64)
+        if 'signal' in data.columns and view.columns['signal'].dtype == np.int8:
+            sig = view.columns['signal']  # strategies emit int8 (no NaN) already, no copy
+        elif 'signal' in data.columns:
+            signal = data['signal'].to_numpy(dtype=np.float64)
+            sig = np.where(np.isnan(signal), SIG_NONE, signal).astype(np.int8)
+        else:
+            sig = np.full(len(data), SIG_NONE, dtype=np.int8)
+        exit_long = self._bool_column(view, 'exit_long')
+        exit_short = self._bool_column(view, 'exit_short')
+
+        # Strategy levels are resolved up front so the kernel needs no callbacks
+        sl_arr, tp_arr = self._precompute_sl_tp(strategy, view, close, sig)
+
+        # Drop checks this strategy can never trigger so the JIT kernel is
+        # specialized without them (the AOT build has one fixed signature)
+        if _simulate is _simulate_njit:
+            if not (exit_long.any() or exit_short.any()):
+                exit_long = exit_short = None
+            if np.isnan(tp_arr).all():
+                tp_arr = None
+
+        self.equity_curve, trades, self._ntrades, self.balance = _simulate(
+            high, low, close, close_q, sig, exit_long, exit_short, sl_arr, tp_arr,
+            float(self.initial_balance), float(self.risk_per_trade),
+            float(self.pip_value), self.pip_size, float(self.commission_per_lot)
+        )
+        self.equity = self.equity_curve[-1]
+        self._trade_cols = self._trade_columns(trades[:, :self._ntrades], data.index)
 
         # Calculate results
         results = self._calculate_results()
@@ -157,152 +400,157 @@ class Backtester:
 
         return results
 
-    def _open_position(
-        self,
-        bar: pd.Series,
-        strategy,
-        historical_data: pd.DataFrame
-    ) -> Dict:
-        """Open new position"""
-        action = 'BUY' if bar['signal'] == 1 else 'SELL'
-        entry_price = bar['close']
-
-        # Get stop loss and take profit from strategy
-        stop_loss = strategy.get_stop_loss(historical_data, entry_price, action)
-        take_profit = strategy.get_take_profit(historical_data, entry_price, action)
-
-        # Calculate position size
-        stop_pips = abs(entry_price - stop_loss) / self.pip_size
-        risk_amount = self.balance * self.risk_per_trade
-        position_size = self._calculate_position_size(risk_amount, stop_pips)
-
-        # Calculate commission
-        lots = position_size / 100000
-        commission = lots * self.commission_per_lot
-
-        position = {
-            'entry_time': bar.name,
-            'entry_price': entry_price,
-            'action': action,
-            'position_size': position_size,
-            'stop_loss': stop_loss,
-            'take_profit': take_profit,
-            'risk_amount': risk_amount,
-            'commission': commission
-        }
-
-        return position
-
-    def _close_position(
-        self,
-        position: Dict,
-        bar: pd.Series,
-        exit_reason: str
-    ):
-        """Close position and record trade"""
-        exit_price = bar['close']
-        exit_time = bar.name
-
-        # Calculate P&L
-        if position['action'] == 'BUY':
-            pnl_pips = (exit_price - position['entry_price']) / self.pip_size
-        else:  # SELL
-            pnl_pips = (position['entry_price'] - exit_price) / self.pip_size
-
-        lots = position['position_size'] / 100000
-        gross_pnl = pnl_pips * self.pip_value * lots
-        net_pnl = gross_pnl - position['commission']
-
-        # Update balance
-        self.balance += net_pnl
-
-        # Record trade
-        trade = {
-            'entry_time': position['entry_time'],
-            'exit_time': exit_time,
-            'duration': (exit_time - position['entry_time']).total_seconds() / 3600,  # hours
-            'action': position['action'],
-            'entry_price': position['entry_price'],
-            'exit_price': exit_price,
-            'position_size': position['position_size'],
-            'stop_loss': position['stop_loss'],
-            'take_profit': position['take_profit'],
-            'pnl_pips': pnl_pips,
-            'gross_pnl': gross_pnl,
-            'commission': position['commission'],
-            'net_pnl': net_pnl,
-            'exit_reason': exit_reason,
-            'balance_after': self.balance
-        }
-
-        self.trades.append(trade)
-
-    def _check_exit(
+    def run_many(
         self,
-        position: Dict,
-        bar: pd.Series,
-        historical_data: pd.DataFrame,
-        strategy
-    ) -> Optional[str]:
-        """Check if position should be exited"""
-        # Check stop loss
-        if position['action'] == 'BUY':
-            if bar['low'] <= position['stop_loss']:
-                return 'stop_loss'
-        else:  # SELL
-            if bar['high'] >= position['stop_loss']:
-                return 'stop_loss'
-
-        # Check take profit
-        if position['take_profit']:
-            if position['action'] == 'BUY':
-                if bar['high'] >= position['take_profit']:
-                    return 'take_profit'
-            else:  # SELL
-                if bar['low'] <= position['take_profit']:
-                    return 'take_profit'
-
-        # Check strategy exit signals
-        if position['action'] == 'BUY' and bar.get('exit_long', False):
-            return 'strategy_signal'
-        elif position['action'] == 'SELL' and bar.get('exit_short', False):
-            return 'strategy_signal'
-
-        # Check opposite signal
-        if position['action'] == 'BUY' and bar.get('signal', 0) == -1:
-            return 'opposite_signal'
-        elif position['action'] == 'SELL' and bar.get('signal', 0) == 1:
-            return 'opposite_signal'
-
-        return None
-
-    def _calculate_unrealized_pnl(self, position: Dict, bar: pd.Series) -> float:
-        """Calculate unrealized P&L for open position"""
-        current_price = bar['close']
-
-        if position['action'] == 'BUY':
-            pnl_pips = (current_price - position['entry_price']) / self.pip_size
-        else:
-            pnl_pips = (position['entry_price'] - current_price) / self.pip_size
+        strategies: Sequence,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[object, BacktestResult]]:
+        """
+        Backtest several strategies (or parameter variants) in parallel
 
-        lots = position['position_size'] / 100000
-        return pnl_pips * self.pip_value * lots
+        Each strategy runs in its own worker process. The price data is sent
+        to each worker once, not once per strategy; a backtester created by
+        from_parquet only sends the file path.
 
-    def _calculate_position_size(self, risk_amount: float, stop_pips: float) -> int:
-        """Calculate position size in units"""
-        risk_per_lot = self.pip_value * stop_pips
-        lots = risk_amount / risk_per_lot
-        position_size = int(lots * 100000)
+        Args:
+            strategies: Strategy objects to evaluate (must be picklable)
+            start_date: Start date for backtest (optional)
+            end_date: End date for backtest (optional)
+            max_workers: Number of worker processes (default: CPU count)
 
-        # Round to nearest 1000 units
-        position_size = round(position_size / 1000) * 1000
+        Yields:
+            (strategy, BacktestResult) tuples in completion order
+        """
+        settings = (
+            self.initial_balance, self.risk_per_trade, self.commission_per_lot,
+            start_date, end_date
+        )
 
-        # Minimum 1000 units
-        return max(position_size, 1000)
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self._parquet_path or self.data,)
+        ) as executor:
+            futures = {
+                executor.submit(_run_one, strategy, settings): strategy
+                for strategy in strategies
+            }
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    def _date_range(self, start_date, end_date) -> pd.DataFrame:
+        """Bars with start_date <= index <= end_date (either bound optional)"""
+        index = self.data.index
+        start = self._index_timestamp(index, start_date) if start_date else None
+        end = self._index_timestamp(index, end_date) if end_date else None
+
+        if index.is_monotonic_increasing:
+            return self.data.loc[start:end]  # binary search, no row copy
+
+        mask = np.ones(len(index), dtype=np.bool_)
+        if start is not None:
+            mask &= index >= start
+        if end is not None:
+            mask &= index <= end
+        return self.data[mask]
+
+    @staticmethod
+    def _index_timestamp(index: pd.DatetimeIndex, value) -> pd.Timestamp:
+        """Parse a date bound as an exact Timestamp in the index's timezone"""
+        timestamp = pd.Timestamp(value)
+        if index.tz is not None and timestamp.tz is None:
+            timestamp = timestamp.tz_localize(index.tz)
+        return timestamp
+
+    @staticmethod
+    def _bool_column(view: StrategyView, name: str) -> np.ndarray:
+        """Optional boolean signal column as an array (all False if absent)"""
+        values = view.columns.get(name)
+        if values is None:
+            return np.zeros(len(view.close), dtype=np.bool_)
+        if values.dtype == np.bool_:
+            return values  # already extracted by the view, no copy
+        return np.where(pd.isna(values), False, values).astype(np.bool_)
+
+    @staticmethod
+    def _precompute_sl_tp(
+        strategy,
+        view: StrategyView,
+        close: np.ndarray,
+        sig: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Resolve stop loss / take profit for every signal bar"""
+        sl_arr = np.full(len(close), np.nan)
+        tp_arr = np.full(len(close), np.nan)
+        signal_bars = (sig != 0) & (sig != SIG_NONE)
+
+        # Vectorized path: pick the long or short level on each signal bar
+        precompute = getattr(strategy, 'precompute_sl_tp', None)
+        levels = precompute(view.frame) if precompute is not None else None
+        if levels is not None:
+            sl_long, sl_short, tp_long, tp_short = levels
+            is_long = sig == 1
+            sl_arr[signal_bars] = np.where(is_long, sl_long, sl_short)[signal_bars]
+            tp_arr[signal_bars] = np.where(is_long, tp_long, tp_short)[signal_bars]
+            return sl_arr, tp_arr
+
+        for i in np.flatnonzero(signal_bars):
+            action = 'BUY' if sig[i] == 1 else 'SELL'
+            sl_arr[i] = strategy.get_stop_loss_at(view, i, close[i], action)
+            take_profit = strategy.get_take_profit_at(view, i, close[i], action)
+            tp_arr[i] = np.nan if take_profit is None else take_profit
+
+        return sl_arr, tp_arr
+
+    @staticmethod
+    def _trade_columns(
+        trades: np.ndarray,
+        times: pd.DatetimeIndex
+    ) -> Dict[str, Union[np.ndarray, pd.Categorical]]:
+        """Name the kernel's trade fields (zero-copy views) and decode the rest"""
+        times = times.to_numpy(dtype='datetime64[ns]')
+        entry_time = times[trades[T_ENTRY_I].astype(np.int64)]
+        exit_time = times[trades[T_EXIT_I].astype(np.int64)]
+        duration_ns = (exit_time - entry_time).astype(np.int64)
+
+        return {
+            'entry_time': entry_time,
+            'exit_time': exit_time,
+            'duration': duration_ns / 1e9 / 3600,  # hours
+            'action': pd.Categorical.from_codes(
+                (trades[T_SIDE] < 0).astype(np.int8), categories=TRADE_ACTIONS
+            ),
+            'entry_price': trades[T_ENTRY_PRICE],
+            'exit_price': trades[T_EXIT_PRICE],
+            'position_size': trades[T_SIZE].astype(np.int64),
+            'stop_loss': trades[T_STOP_LOSS],
+            'take_profit': trades[T_TAKE_PROFIT],
+            'pnl_pips': trades[T_PNL_PIPS],
+            'gross_pnl': trades[T_GROSS_PNL],
+            'commission': trades[T_COMMISSION],
+            'net_pnl': trades[T_NET_PNL],
+            'exit_reason': pd.Categorical.from_codes(
+                trades[T_REASON].astype(np.int8), categories=EXIT_REASONS
+            ),
+            'balance_after': trades[T_BALANCE_AFTER]
+        }
 
     def _calculate_results(self) -> BacktestResult:
         """Calculate backtest statistics"""
-        if not self.trades:
+        n = self._ntrades
+        # Every column already has its final dtype, so nothing is inferred or copied
+        trades_df = pd.DataFrame(self._trade_cols, copy=False)
+        # The kernel fills every slot of the preallocated curve; wrap without copying
+        equity_series = pd.Series(self.equity_curve, copy=False)
+
+        # Drawdown curve (also reused by plot_results)
+        running_max = np.maximum.accumulate(self.equity_curve)
+        drawdown = self.equity_curve - running_max
+        drawdown_pct = drawdown / running_max * 100
+
+        if n == 0:
             return BacktestResult(
                 total_trades=0,
                 winning_trades=0,
@@ -319,48 +567,51 @@ class Backtester:
                 max_drawdown=0.0,
                 max_drawdown_percent=0.0,
                 avg_trade_duration=0.0,
-                trades=[],
-                equity_curve=pd.Series(self.equity_curve)
+                trades=trades_df,
+                equity_curve=equity_series,
+                running_max=running_max,
+                drawdown_pct=drawdown_pct
             )
 
-        trades_df = pd.DataFrame(self.trades)
+        # One mask drives every win/loss statistic
+        pnl = self._trade_cols['net_pnl'][:n]
+        win_mask = pnl > 0
+        winners = pnl[win_mask]
+        losers = pnl[~win_mask]
 
         # Basic stats
-        total_trades = len(trades_df)
-        winning_trades = len(trades_df[trades_df['net_pnl'] > 0])
-        losing_trades = len(trades_df[trades_df['net_pnl'] <= 0])
-        win_rate = (winning_trades / total_trades) * 100 if total_trades > 0 else 0
+        total_trades = n
+        winning_trades = winners.size
+        losing_trades = losers.size
+        win_rate = (winning_trades / total_trades) * 100
 
         # P&L stats
-        total_pnl = trades_df['net_pnl'].sum()
+        total_pnl = pnl.sum()
         total_pnl_percent = (total_pnl / self.initial_balance) * 100
 
-        winners = trades_df[trades_df['net_pnl'] > 0]['net_pnl']
-        losers = trades_df[trades_df['net_pnl'] <= 0]['net_pnl']
-
-        avg_win = winners.mean() if len(winners) > 0 else 0
-        avg_loss = losers.mean() if len(losers) > 0 else 0
-        largest_win = winners.max() if len(winners) > 0 else 0
-        largest_loss = losers.min() if len(losers) > 0 else 0
+        total_wins = winners.sum()
+        loss_sum = losers.sum()
+        total_losses = abs(loss_sum)
+        avg_win = total_wins / winners.size if winners.size else 0.0
+        avg_loss = loss_sum / losers.size if losers.size else 0.0
+        largest_win = winners.max() if winners.size else 0.0
+        largest_loss = losers.min() if losers.size else 0.0
 
         # Profit factor
-        total_wins = winners.sum() if len(winners) > 0 else 0
-        total_losses = abs(losers.sum()) if len(losers) > 0 else 0
         profit_factor = total_wins / total_losses if total_losses > 0 else 0
 
         # Sharpe ratio (simplified)
-        returns = trades_df['net_pnl'] / self.initial_balance
-        sharpe_ratio = (returns.mean() / returns.std()) * np.sqrt(252) if returns.std() > 0 else 0
+        returns = pnl / self.initial_balance
+        returns_std = returns.std(ddof=1) if n > 1 else 0.0
+        sharpe_ratio = (returns.mean() / returns_std) * np.sqrt(252) if returns_std > 0 else 0
 
         # Drawdown
-        equity_series = pd.Series(self.equity_curve)
-        running_max = equity_series.expanding().max()
-        drawdown = equity_series - running_max
-        max_drawdown = drawdown.min()
-        max_drawdown_percent = (max_drawdown / running_max[drawdown.idxmin()]) * 100
+        dd_idx = drawdown.argmin()
+        max_drawdown = drawdown[dd_idx]
+        max_drawdown_percent = drawdown_pct[dd_idx]
 
         # Average trade duration
-        avg_duration = trades_df['duration'].mean()
+        avg_duration = self._trade_cols['duration'][:n].mean()
 
         return BacktestResult(
             total_trades=total_trades,
@@ -378,8 +629,10 @@ class Backtester:
             max_drawdown=max_drawdown,
             max_drawdown_percent=max_drawdown_percent,
             avg_trade_duration=avg_duration,
-            trades=self.trades,
-            equity_curve=equity_series
+            trades=trades_df,
+            equity_curve=equity_series,
+            running_max=running_max,
+            drawdown_pct=drawdown_pct
         )
 
     def _print_results(self, results: BacktestResult):
@@ -469,8 +722,10 @@ class Backtester:
             print("✗ STRATEGY NOT READY - REQUIRES MAJOR IMPROVEMENTS")
         print("-" * 60 + "\n")
 
-    def plot_results(self, results: BacktestResult):
+    def plot_results(self, results: BacktestResult, dpi: int = 100):
         """Plot equity curve and drawdown"""
+        import matplotlib.pyplot as plt  # deferred: only needed when plotting
+
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
 
         # Equity curve
@@ -483,10 +738,9 @@ class Backtester:
         ax1.legend()
 
         # Drawdown
-        running_max = results.equity_curve.expanding().max()
-        drawdown = ((results.equity_curve - running_max) / running_max) * 100
-        drawdown.plot(ax=ax2, color='red', linewidth=2, label='Drawdown')
-        ax2.fill_between(drawdown.index, 0, drawdown, color='red', alpha=0.3)
+        drawdown = results.drawdown_pct
+        ax2.plot(drawdown, color='red', linewidth=2, label='Drawdown')
+        ax2.fill_between(np.arange(len(drawdown)), 0, drawdown, color='red', alpha=0.3)
         ax2.set_title('Drawdown', fontsize=14, fontweight='bold')
         ax2.set_xlabel('Trade Number')
         ax2.set_ylabel('Drawdown (%)')
@@ -494,10 +748,64 @@ class Backtester:
         ax2.legend()
 
         plt.tight_layout()
-        plt.savefig('backtest_results.png', dpi=300, bbox_inches='tight')
+        plt.savefig('backtest_results.png', dpi=dpi, bbox_inches='tight')
         print("✓ Chart saved as 'backtest_results.png'")
 
 
+def _time_column(columns, source: str) -> str:
+    """Name of the timestamp column of an index-less OHLCV table"""
+    for time_column in ('time', 'timestamp', 'date'):
+        if time_column in columns:
+            return time_column
+    raise ValueError(f"{source} data needs a 'time', 'timestamp' or 'date' column")
+
+
+def _from_polars(data: "pl.DataFrame") -> pd.DataFrame:
+    """Convert a polars OHLCV frame to the DatetimeIndex-ed pandas layout"""
+    time_column = _time_column(data.columns, "Polars")
+    data = data.sort(time_column)
+    frame = data.drop(time_column).to_pandas()
+    frame.index = pd.DatetimeIndex(data[time_column].to_pandas(), name=time_column)
+    return frame
+
+
+def _read_parquet(path: str) -> pd.DataFrame:
+    """Memory-map a Parquet OHLCV file into the DatetimeIndex-ed pandas layout"""
+    import pyarrow.parquet as pq  # optional dependency, only needed here
+
+    table = pq.read_table(path, memory_map=True)
+    # One block per column lets numeric columns stay on the mapped buffers
+    frame = table.to_pandas(split_blocks=True)
+
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        time_column = _time_column(frame.columns, "Parquet")
+        frame = frame.set_index(pd.DatetimeIndex(frame.pop(time_column), name=time_column))
+        frame = frame.sort_index()
+    return frame
+
+
+# Price data shared by every task in a run_many worker process
+_worker_data: Optional[pd.DataFrame] = None
+
+
+def _init_worker(data):
+    """ProcessPoolExecutor initializer: receive the price data (or its Parquet path) once"""
+    global _worker_data
+    _worker_data = _read_parquet(data) if isinstance(data, (str, os.PathLike)) else data
+
+
+def _run_one(strategy, settings: tuple) -> BacktestResult:
+    """Run a single backtest inside a run_many worker"""
+    initial_balance, risk_per_trade, commission_per_lot, start_date, end_date = settings
+    backtester = Backtester(
+        data=_worker_data,
+        initial_balance=initial_balance,
+        risk_per_trade=risk_per_trade,
+        commission_per_lot=commission_per_lot
+    )
+    return backtester.run(strategy, start_date, end_date)
+
+
 # Example usage
 if __name__ == "__main__":
     # Generate sample data
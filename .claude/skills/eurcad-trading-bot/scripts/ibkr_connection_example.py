@@ -3,10 +3,23 @@ IBKR Connection Example for EUR/CAD Trading Bot
 Demonstrates secure connection setup for both paper and live trading
 """
 
-from ib_insync import IB, Forex, MarketOrder, StopOrder, Order
+from ib_insync import IB, Forex, MarketOrder, StopOrder, Order, Position, Trade, util
+import asyncio
+import logging
+import signal
 import time
-from datetime import datetime
-from typing import Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
+
+from _retry import backoff_delay
+
+log = logging.getLogger(__name__)
+
+
+# Account summary values kept up to date by IBKR pushes
+ACCOUNT_TAGS = ('NetLiquidation', 'AvailableFunds', 'BuyingPower')
+
+# IBKR models EUR/CAD as symbol 'EUR' quoted in currency 'CAD'
+EURCAD_KEY = ('EUR', 'CAD')
 
 
 class IBKRConnection:
@@ -14,13 +27,17 @@ class IBKRConnection:
     IBKR connection manager with safety checks and error handling
     """
 
-    def __init__(self, paper_trading: bool = True, client_id: int = 1):
+    PIP_SIZE = 0.0001  # EUR/CAD
+
+    def __init__(self, paper_trading: bool = True, client_id: int = 1, calendar=None):
         """
         Initialize IBKR connection
 
         Args:
             paper_trading: True for paper trading (port 7497), False for live (port 7496)
             client_id: Unique client ID for this connection (1-128)
+            calendar: Optional news calendar (e.g. EconomicCalendar) whose async
+                refresh() runs alongside reconnects after a disconnect
         """
         self.ib = IB()
         self.paper_trading = paper_trading
@@ -29,6 +46,24 @@ class IBKRConnection:
         self.host = '127.0.0.1'
         self.connected = False
         self.eurcad = None
+        self._account = ''  # managed account id, cached on connect
+        self.calendar = calendar
+        self._recovery: Optional[asyncio.Task] = None
+        self.ib.disconnectedEvent += self._on_disconnected
+
+        # Streaming quote, refreshed by IBKR tick callbacks
+        self.ticker = None
+        self._last_quote = None  # (bid, ask, mid)
+        self._quote_time = 0.0  # time.monotonic() of _last_quote
+
+        # Pushed account summary: tag -> value (account base currency)
+        self._acct: Dict[str, float] = {}
+        self._acct_currency = ''
+        self.ib.accountSummaryEvent += self._on_account_summary
+
+        # Pushed FX positions: (symbol, currency) -> Position
+        self._positions: Dict[Tuple[str, str], Position] = {}
+        self.ib.positionEvent += self._on_position
 
         # Safety settings
         self.max_daily_loss = 500  # Maximum daily loss in account currency
@@ -37,7 +72,20 @@ class IBKRConnection:
 
     def connect(self, timeout: int = 20, retries: int = 3) -> bool:
         """
-        Connect to IBKR with retry logic
+        Connect to IBKR with retry logic (blocking wrapper around connect_async)
+
+        Args:
+            timeout: Connection timeout in seconds
+            retries: Number of connection attempts
+
+        Returns:
+            True if connected successfully, False otherwise
+        """
+        return util.run(self.connect_async(timeout, retries))
+
+    async def connect_async(self, timeout: int = 20, retries: int = 3) -> bool:
+        """
+        Connect to IBKR with retry logic, without blocking the event loop
 
         Args:
             timeout: Connection timeout in seconds
@@ -48,11 +96,10 @@ class IBKRConnection:
         """
         for attempt in range(retries):
             try:
-                print(f"[{datetime.now()}] Connecting to IBKR (attempt {attempt + 1}/{retries})...")
-                print(f"Mode: {'PAPER' if self.paper_trading else 'LIVE'} trading")
-                print(f"Port: {self.port}")
+                log.info("Connecting to IBKR (attempt %d/%d, %s trading, port %d)",
+                         attempt + 1, retries, 'PAPER' if self.paper_trading else 'LIVE', self.port)
 
-                self.ib.connect(
+                await self.ib.connectAsync(
                     host=self.host,
                     port=self.port,
                     clientId=self.client_id,
@@ -61,90 +108,205 @@ class IBKRConnection:
 
                 # Verify connection
                 if self.ib.isConnected():
-                    self.connected = True
-                    print(f"✓ Connected successfully to IBKR")
+                    self._account = self.ib.managedAccounts()[0]
+                    log.info("Connected to IBKR")
 
                     # Setup EUR/CAD contract
                     self.eurcad = Forex('EURCAD')
-                    self.ib.qualifyContracts(self.eurcad)
-                    print(f"✓ EUR/CAD contract qualified")
+                    await self.ib.qualifyContractsAsync(self.eurcad)
+                    log.info("EUR/CAD contract qualified")
+
+                    # One persistent quote subscription for all price reads
+                    self._subscribe_market_data()
+
+                    # Account summary subscription (fills self._acct, then keeps it current)
+                    await self.ib.reqAccountSummaryAsync()
+
+                    # Positions arrive during connect; positionEvent keeps them current
+                    self._positions.clear()
+                    for pos in self.ib.positions(self._account):
+                        self._on_position(pos)
 
-                    # Setup disconnection handler
-                    self.ib.disconnectedEvent += self._on_disconnected
+                    # Only now can a disconnect trigger recovery
+                    self.connected = True
 
                     # Get account summary
                     self._print_account_info()
 
                     return True
 
-            except Exception as e:
-                print(f"✗ Connection attempt {attempt + 1} failed: {str(e)}")
+            except (OSError, asyncio.TimeoutError) as e:
+                # Refused/reset sockets and handshake timeouts are worth retrying
+                log.warning("Connection attempt %d failed: %s", attempt + 1, e)
+                self.ib.disconnect()  # start the next attempt from a closed socket
                 if attempt < retries - 1:
-                    wait_time = 5 * (attempt + 1)
-                    print(f"Waiting {wait_time} seconds before retry...")
-                    time.sleep(wait_time)
+                    wait_time = backoff_delay(attempt, base=2.0, cap=30.0)
+                    log.info("Waiting %.1f seconds before retry", wait_time)
+                    await asyncio.sleep(wait_time)
 
-        print("✗ Failed to connect after all retries")
+            except Exception as e:
+                # Anything else (bad contract, rejected client id, ...) won't fix itself
+                log.error("Connection attempt %d failed: %s", attempt + 1, e)
+                # The socket may already be up (e.g. qualifying the contract
+                # failed); close it, since disconnect() is a no-op when not connected
+                self.ib.disconnect()
+                break
+
+        log.error("Failed to connect after all retries")
         return False
 
+    def _subscribe_market_data(self):
+        """Start (or restart after reconnect) the streaming EUR/CAD quote"""
+        if self.ticker is not None:
+            self.ticker.updateEvent -= self._on_tick
+
+        self.ticker = self.ib.reqMktData(self.eurcad, '', False, False)
+        self.ticker.updateEvent += self._on_tick
+
+    def _on_tick(self, ticker):
+        """Cache the latest two-sided quote (bid/ask are NaN until known)"""
+        if ticker.bid > 0 and ticker.ask > 0:
+            self._last_quote = (ticker.bid, ticker.ask, (ticker.bid + ticker.ask) / 2)
+            self._quote_time = time.monotonic()
+
+    def _on_account_summary(self, value):
+        """Cache the account summary tags used by safety checks"""
+        if value.tag in ACCOUNT_TAGS and value.account == self._account:
+            try:
+                self._acct[value.tag] = float(value.value)
+                self._acct_currency = value.currency
+            except ValueError:
+                pass
+
+    def _on_position(self, pos: Position):
+        """Track FX positions for this account by exact (symbol, currency)"""
+        if pos.account != self._account or pos.contract.secType != 'CASH':
+            return
+
+        key = (pos.contract.symbol, pos.contract.currency)
+        if pos.position:
+            self._positions[key] = pos
+        else:
+            self._positions.pop(key, None)
+
     def _on_disconnected(self):
         """Handle disconnection event"""
-        print(f"\n[{datetime.now()}] ⚠ DISCONNECTED FROM IBKR!")
+        # Failed handshakes and our own disconnect() also emit this event
+        if not self.connected:
+            return
+
+        log.warning("Disconnected from IBKR")
         self.connected = False
 
-        # Close all positions if disconnected (safety)
-        print("Attempting to reconnect...")
-        if self.connect(retries=2):
-            print("Reconnected successfully")
+        if self._recovery is None or self._recovery.done():
+            self._recovery = asyncio.ensure_future(self._recover())
+
+    async def _recover(self):
+        """Reconnect and refresh the news calendar concurrently"""
+        log.info("Attempting to reconnect")
+
+        # return_exceptions: a failing news feed must not cancel the reconnect
+        reconnected, _ = await asyncio.gather(
+            self.connect_async(retries=2),
+            self._refresh_calendar(),
+            return_exceptions=True
+        )
+
+        if reconnected is True:
+            log.info("Reconnected successfully")
         else:
-            print("Failed to reconnect. Manual intervention required.")
+            if isinstance(reconnected, BaseException):
+                log.error("Reconnect raised: %s", reconnected)
+            log.error("Failed to reconnect. Manual intervention required.")
+
+    async def _refresh_calendar(self):
+        """Refresh the news calendar, if any, logging (not raising) its errors"""
+        if self.calendar is None:
+            return
+        try:
+            await self.calendar.refresh()
+        except Exception as e:
+            log.warning("News calendar refresh failed: %s", e)
 
     def _print_account_info(self):
         """Print account information"""
-        try:
-            account = self.ib.managedAccounts()[0]
-            account_values = self.ib.accountValues(account)
+        print("\n=== Account Information ===")
+        print(f"Account: {self._account}")
 
-            print("\n=== Account Information ===")
-            print(f"Account: {account}")
+        for tag in ACCOUNT_TAGS:
+            if tag in self._acct:
+                print(f"{tag}: {self._acct[tag]} {self._acct_currency}")
 
-            for item in account_values:
-                if item.tag in ['NetLiquidation', 'AvailableFunds', 'BuyingPower']:
-                    print(f"{item.tag}: {item.value} {item.currency}")
+        print("===========================\n")
 
-            print("===========================\n")
-        except Exception as e:
-            print(f"Could not retrieve account info: {e}")
-
-    def get_current_price(self) -> Optional[Tuple[float, float, float]]:
+    async def get_current_price(
+        self,
+        max_age: float = 5.0
+    ) -> Optional[Tuple[float, float, float]]:
         """
-        Get current market price for EUR/CAD
+        Get current market price for EUR/CAD from the streaming quote
+
+        Args:
+            max_age: Seconds after which the cached quote counts as stale and
+                the next tick is awaited (up to 1 second)
 
         Returns:
             Tuple of (bid, ask, mid) or None if data unavailable
         """
         if not self.connected:
-            print("Not connected to IBKR")
+            log.error("Not connected to IBKR")
             return None
 
+        if self._last_quote and time.monotonic() - self._quote_time < max_age:
+            return self._last_quote
+
         try:
-            ticker = self.ib.reqMktData(self.eurcad, '', False, False)
-            self.ib.sleep(2)  # Wait for data to populate
-
-            if ticker.bid and ticker.ask:
-                bid = ticker.bid
-                ask = ticker.ask
-                mid = (bid + ask) / 2
-                return (bid, ask, mid)
-            else:
-                print("Market data not available")
-                return None
+            await asyncio.wait_for(self.ticker.updateEvent, 1.0)
+        except asyncio.TimeoutError:
+            pass
+
+        if self._last_quote and time.monotonic() - self._quote_time < max_age:
+            return self._last_quote
+
+        log.warning("Market data not available")
+        return None
+
+    @staticmethod
+    async def _wait_for(
+        trade: Trade,
+        condition: Callable[[Trade], bool],
+        timeout: float
+    ) -> bool:
+        """
+        Wait until condition(trade) holds, woken by the trade's status events
 
-        except Exception as e:
-            print(f"Error getting market data: {e}")
-            return None
+        Args:
+            trade: Trade returned by placeOrder
+            condition: Predicate checked on every status update
+            timeout: Maximum wait in seconds
 
-    def place_market_order(
+        Returns:
+            True if the condition was met, False on timeout
+        """
+        if condition(trade):
+            return True
+
+        reached = asyncio.Event()
+
+        def on_status(t: Trade):
+            if condition(t):
+                reached.set()
+
+        trade.statusEvent += on_status
+        try:
+            await asyncio.wait_for(reached.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            trade.statusEvent -= on_status
+
+    async def place_market_order(
         self,
         action: str,
         quantity: int,
@@ -162,7 +324,7 @@ class IBKRConnection:
             Order object or None if order failed
         """
         if not self.connected:
-            print("Not connected to IBKR")
+            log.error("Not connected to IBKR")
             return None
 
         # Safety checks
@@ -171,18 +333,16 @@ class IBKRConnection:
 
         try:
             # Get current price
-            price_data = self.get_current_price()
+            price_data = await self.get_current_price()
             if not price_data:
-                print("Cannot place order: No market data")
+                log.error("Cannot place order: no market data")
                 return None
 
             bid, ask, mid = price_data
             entry_price = ask if action == 'BUY' else bid
 
-            print(f"\n=== Placing Order ===")
-            print(f"Action: {action}")
-            print(f"Quantity: {quantity} units ({quantity / 100000:.2f} lots)")
-            print(f"Entry Price: {entry_price:.5f}")
+            log.info("Placing order: %s %d units (%.2f lots), entry %.5f",
+                     action, quantity, quantity / 100000, entry_price)
 
             # Create market order
             order = MarketOrder(action, quantity)
@@ -190,32 +350,28 @@ class IBKRConnection:
             # Place order
             trade = self.ib.placeOrder(self.eurcad, order)
 
-            # Wait for order to fill
-            timeout = 30
-            elapsed = 0
-            while not trade.isDone() and elapsed < timeout:
-                self.ib.sleep(0.5)
-                elapsed += 0.5
+            # Wait for the order to fill (or be cancelled/rejected)
+            await self._wait_for(trade, Trade.isDone, timeout=30)
 
             if trade.orderStatus.status == 'Filled':
                 filled_price = trade.orderStatus.avgFillPrice
-                print(f"✓ Order filled at {filled_price:.5f}")
+                log.info("Order filled at %.5f", filled_price)
 
                 # Place stop loss if specified
                 if stop_loss_pips:
-                    self._place_stop_loss(action, quantity, filled_price, stop_loss_pips)
+                    await self._place_stop_loss(action, quantity, filled_price, stop_loss_pips)
 
                 return trade.order
 
             else:
-                print(f"✗ Order not filled: {trade.orderStatus.status}")
+                log.error("Order not filled: %s", trade.orderStatus.status)
                 return None
 
         except Exception as e:
-            print(f"✗ Error placing order: {e}")
+            log.error("Error placing order: %s", e)
             return None
 
-    def _place_stop_loss(
+    async def _place_stop_loss(
         self,
         original_action: str,
         quantity: int,
@@ -224,26 +380,32 @@ class IBKRConnection:
     ):
         """Place stop loss order"""
         try:
-            # Calculate stop price
-            pip_size = 0.0001
-            stop_action = 'SELL' if original_action == 'BUY' else 'BUY'
-
-            if original_action == 'BUY':
-                stop_price = entry_price - (stop_pips * pip_size)
-            else:
-                stop_price = entry_price + (stop_pips * pip_size)
+            # Calculate stop price: below entry for longs, above for shorts
+            is_long = original_action == 'BUY'
+            stop_action = 'SELL' if is_long else 'BUY'
+            offset = stop_pips * self.PIP_SIZE
+            stop_price = round(entry_price - offset if is_long else entry_price + offset, 5)
 
-            print(f"Placing stop loss at {stop_price:.5f} ({stop_pips} pips)")
+            log.info("Placing stop loss at %.5f (%s pips)", stop_price, stop_pips)
 
             # Create stop order
             stop_order = StopOrder(stop_action, quantity, stop_price)
 
-            # Place stop order
+            # Place stop order and wait for IBKR to acknowledge it
             stop_trade = self.ib.placeOrder(self.eurcad, stop_order)
-            print(f"✓ Stop loss placed successfully")
+            accepted = await self._wait_for(
+                stop_trade,
+                lambda t: t.orderStatus.status in ('PreSubmitted', 'Submitted') or t.isDone(),
+                timeout=5
+            )
+
+            if accepted and not stop_trade.isDone():
+                log.info("Stop loss placed")
+            else:
+                log.error("Stop loss not confirmed: %s", stop_trade.orderStatus.status)
 
         except Exception as e:
-            print(f"✗ Error placing stop loss: {e}")
+            log.error("Error placing stop loss: %s", e)
 
     def _safety_checks(self, quantity: int) -> bool:
         """
@@ -257,135 +419,129 @@ class IBKRConnection:
         """
         # Check if live trading
         if not self.paper_trading:
-            print("\n⚠ WARNING: LIVE TRADING MODE")
-            print("Performing additional safety checks...")
+            log.warning("LIVE TRADING MODE: performing additional safety checks")
 
         # Check position size
         if quantity > self.max_position_size:
-            print(f"✗ Position size {quantity} exceeds maximum {self.max_position_size}")
+            log.error("Position size %d exceeds maximum %d", quantity, self.max_position_size)
             return False
 
         # Check daily loss limit
         if abs(self.daily_pnl) >= self.max_daily_loss:
-            print(f"✗ Daily loss limit reached: {self.daily_pnl}")
+            log.error("Daily loss limit reached: %s", self.daily_pnl)
             return False
 
-        # Check account margin
-        try:
-            account = self.ib.managedAccounts()[0]
-            account_values = self.ib.accountValues(account)
-
-            buying_power = 0
-            for item in account_values:
-                if item.tag == 'BuyingPower':
-                    buying_power = float(item.value)
-                    break
-
-            if buying_power < 1000:  # Minimum margin requirement
-                print(f"✗ Insufficient buying power: {buying_power}")
-                return False
-
-        except Exception as e:
-            print(f"⚠ Could not verify margin: {e}")
+        # Check account margin (pushed by the account summary subscription)
+        buying_power = self._acct.get('BuyingPower', 0.0)
+        if buying_power < 1000:  # Minimum margin requirement
+            log.error("Insufficient buying power: %s", buying_power)
+            return False
 
         return True
 
     def get_positions(self):
-        """Get current open positions"""
+        """Get current open EUR/CAD positions (from the pushed position cache)"""
         if not self.connected:
-            print("Not connected to IBKR")
+            log.error("Not connected to IBKR")
             return []
 
-        try:
-            positions = self.ib.positions()
+        pos = self._positions.get(EURCAD_KEY)
+        positions = [pos] if pos is not None else []
 
-            print("\n=== Current Positions ===")
-            if not positions:
-                print("No open positions")
-            else:
-                for pos in positions:
-                    if 'EUR' in pos.contract.symbol and 'CAD' in pos.contract.symbol:
-                        print(f"{pos.contract.symbol}: {pos.position} units @ {pos.avgCost:.5f}")
-            print("=========================\n")
-
-            return positions
+        print("\n=== Current Positions ===")
+        if not positions:
+            print("No open positions")
+        else:
+            for pos in positions:
+                print(f"{pos.contract.localSymbol or pos.contract.symbol}: {pos.position} units @ {pos.avgCost:.5f}")
+        print("=========================\n")
 
-        except Exception as e:
-            print(f"Error getting positions: {e}")
-            return []
+        return positions
 
-    def close_all_positions(self):
+    async def close_all_positions(self):
         """Emergency: Close all EUR/CAD positions"""
         if not self.connected:
-            print("Not connected to IBKR")
+            log.error("Not connected to IBKR")
             return
 
-        print("\n⚠ CLOSING ALL EUR/CAD POSITIONS ⚠")
+        log.warning("Closing all EUR/CAD positions")
 
         try:
-            positions = self.ib.positions()
+            pos = self._positions.get(EURCAD_KEY)
 
-            for pos in positions:
-                if 'EUR' in pos.contract.symbol and 'CAD' in pos.contract.symbol:
-                    quantity = abs(pos.position)
-                    action = 'SELL' if pos.position > 0 else 'BUY'
+            if pos is not None:
+                quantity = abs(pos.position)
+                action = 'SELL' if pos.position > 0 else 'BUY'
 
-                    print(f"Closing {pos.position} units of {pos.contract.symbol}")
+                log.info("Closing %s units of %s", pos.position, pos.contract.localSymbol or pos.contract.symbol)
 
-                    order = MarketOrder(action, quantity)
-                    trade = self.ib.placeOrder(pos.contract, order)
+                # Position contracts lack an exchange; route via the qualified one
+                order = MarketOrder(action, quantity)
+                trade = self.ib.placeOrder(self.eurcad, order)
 
-                    # Wait for fill
-                    timeout = 30
-                    elapsed = 0
-                    while not trade.isDone() and elapsed < timeout:
-                        self.ib.sleep(0.5)
-                        elapsed += 0.5
+                # Wait for fill
+                await self._wait_for(trade, Trade.isDone, timeout=30)
 
-                    if trade.orderStatus.status == 'Filled':
-                        print(f"✓ Position closed")
-                    else:
-                        print(f"✗ Failed to close position: {trade.orderStatus.status}")
+                if trade.orderStatus.status == 'Filled':
+                    log.info("Position closed")
+                else:
+                    log.error("Failed to close position: %s", trade.orderStatus.status)
 
         except Exception as e:
-            print(f"Error closing positions: {e}")
+            log.error("Error closing positions: %s", e)
 
     def disconnect(self):
         """Disconnect from IBKR"""
         if self.connected:
-            print(f"\n[{datetime.now()}] Disconnecting from IBKR...")
+            log.info("Disconnecting from IBKR")
+            self.connected = False  # before ib.disconnect(), so no recovery is attempted
+            if self.ticker is not None:
+                self.ib.cancelMktData(self.eurcad)
             self.ib.disconnect()
-            self.connected = False
-            print("Disconnected successfully")
+            log.info("Disconnected")
 
 
 # Example usage
-if __name__ == "__main__":
+async def main():
     # Initialize connection (paper trading)
     ibkr = IBKRConnection(paper_trading=True, client_id=1)
 
     # Connect
-    if ibkr.connect():
-        # Get current price
-        price = ibkr.get_current_price()
-        if price:
-            bid, ask, mid = price
-            print(f"\nEUR/CAD Price: Bid={bid:.5f}, Ask={ask:.5f}, Mid={mid:.5f}")
+    if not await ibkr.connect_async():
+        print("Failed to establish connection")
+        return
 
-        # Check current positions
-        ibkr.get_positions()
+    # Get current price
+    price = await ibkr.get_current_price()
+    if price:
+        bid, ask, mid = price
+        print(f"\nEUR/CAD Price: Bid={bid:.5f}, Ask={ask:.5f}, Mid={mid:.5f}")
 
-        # Example: Place a market order (commented out for safety)
-        # ibkr.place_market_order('BUY', 20000, stop_loss_pips=25)
+    # Check current positions
+    ibkr.get_positions()
 
-        # Keep connection alive
-        print("\nConnection established. Press Ctrl+C to exit.")
-        try:
-            while True:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print("\n\nShutting down...")
-            ibkr.close_all_positions()  # Optional: close positions on exit
-            ibkr.disconnect()
-    else:
-        print("Failed to establish connection")
+    # Example: Place a market order (commented out for safety)
+    # await ibkr.place_market_order('BUY', 20000, stop_loss_pips=25)
+
+    # Keep connection alive: sleep until Ctrl+C sets the event (no polling)
+    stop = asyncio.Event()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGINT, stop.set)
+    except NotImplementedError:
+        pass  # Windows: Ctrl+C cancels this task instead
+
+    print("\nConnection established. Press Ctrl+C to exit.")
+    try:
+        await stop.wait()
+    finally:
+        print("\n\nShutting down...")
+        await ibkr.close_all_positions()  # Optional: close positions on exit
+        ibkr.disconnect()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -3,82 +3,277 @@ News Parser Example for EUR/CAD Trading Bot
 Fetches and parses economic calendar data to avoid trading during high-impact events
 """
 
-import requests
+import asyncio
 import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import os
 import time
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads  # errors subclass json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import ijson
+    _JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
+from _retry import retry_async
+
+# Calendar events worth tracking for EUR/CAD
+_COUNTRIES = frozenset(('EUR', 'CAD'))
+_IMPACTS = frozenset(('high', 'medium'))
+
+
+def _is_tracked(event: Dict) -> bool:
+    """True for EUR/CAD events of medium or high impact"""
+    # Missing or null country/impact fall through as '' and are dropped
+    return ((event.get('impact') or '').lower() in _IMPACTS
+            and (event.get('country') or '').upper() in _COUNTRIES)
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Network blips, timeouts, 5xx and 429 are worth retrying; other HTTP errors are not"""
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status >= 500 or exc.status == 429
+    return isinstance(exc, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+def _parse_event_time(value: str) -> Optional[datetime]:
+    """
+    Parse a calendar timestamp into naive local time
+
+    Accepts 'YYYY-MM-DDTHH:MM:SS' or 'YYYY-MM-DD HH:MM:SS', with or without
+    a UTC offset (Forex Factory sends e.g. '2024-01-08T08:30:00-05:00').
+
+    Returns:
+        datetime comparable with datetime.now(), or None if unparseable
+    """
+    try:
+        event_time = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+    if event_time.tzinfo is not None:
+        event_time = event_time.astimezone().replace(tzinfo=None)
+    return event_time
 
 
 class EconomicCalendar:
     """
     Economic calendar parser for Forex Factory and Trading Economics
     Filters high-impact EUR and CAD events
+
+    All network calls are coroutines: run them on the same event loop as the
+    IBKR connection so a calendar refresh never stalls tick handling.
     """
 
     def __init__(self):
         self.forex_factory_url = "https://nfs.faireconomy.media/ff_calendar_thisweek.json"
-        self.events_cache = []
+        self.events_cache = []  # sorted by event['_ts']
+        self._ts_keys = []  # parallel epoch seconds, for bisect
+        self._event_records = []  # parallel display records, see _index_events
         self.cache_time = None
         self.cache_duration = 3600  # Cache for 1 hour
 
-    def fetch_forex_factory_events(self) -> List[Dict]:
+        # Per-tick memo of get_upcoming_events: hours_ahead -> (monotonic time, events)
+        self._upcoming_cache: Dict[int, Tuple[float, List[Dict]]] = {}
+        self.upcoming_ttl = 1.0
+        self._refresh_lock = asyncio.Lock()
+        self._session = None  # aiohttp.ClientSession, opened on first fetch
+
+        # Conditional GET state; persisted so a restart can still get a 304
+        self.feed_cache_path = os.path.join(os.path.expanduser('~'), '.cache', 'eurcad_bot', 'ff.json')
+        self._etag = None
+        self._last_modified = None
+        self._feed_events = None  # last full feed body, parsed
+
+        # Circuit breaker: after failure_threshold failed fetches in a row, skip
+        # the network for min(300, 2**failures) seconds and serve the stale feed
+        self.failure_threshold = 3
+        self._consecutive_failures = 0
+        self._breaker_open_until = 0.0  # time.monotonic()
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """Return the shared HTTP session, creating it on the running loop"""
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for calendar fetches (pip install aiohttp)")
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={'Accept-Encoding': 'gzip'},
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def _load_feed_cache(self):
+        """Restore the last feed and its validators from disk, if present"""
+        try:
+            with open(self.feed_cache_path, 'rb') as f:
+                cached = _json_loads(f.read())
+        except (OSError, ValueError):
+            return
+
+        self._etag = cached.get('etag')
+        self._last_modified = cached.get('last_modified')
+        self._feed_events = cached.get('events')
+
+    def _save_feed_cache(self):
+        """Persist the current feed and its validators (best effort)"""
+        tmp_path = self.feed_cache_path + '.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.feed_cache_path), exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump({
+                    'etag': self._etag,
+                    'last_modified': self._last_modified,
+                    'events': self._feed_events
+                }, f)
+            os.replace(tmp_path, self.feed_cache_path)
+        except OSError as e:
+            print(f"⚠ Could not write calendar cache: {e}")
+
+    async def fetch_forex_factory_events(self) -> List[Dict]:
         """
         Fetch events from Forex Factory calendar
 
+        Sends If-None-Match / If-Modified-Since from the previous response, so
+        an unchanged feed comes back as 304 with no body and the events parsed
+        last time are returned without downloading or decoding anything.
+        Transient failures are retried with exponential backoff and jitter.
+
+        With ijson installed the body is decoded incrementally and only
+        tracked EUR/CAD events are ever built (and cached); otherwise the
+        whole feed is decoded in one go.
+
+        On failure, or while the circuit breaker is open, the last good feed
+        (empty if there is none) is returned instead.
+
         Returns:
             List of economic events
         """
+        if self._feed_events is None:
+            self._load_feed_cache()
+        stale = self._feed_events if self._feed_events is not None else []
+
+        if time.monotonic() < self._breaker_open_until:
+            return stale
+
+        session = self._get_session()
+
+        headers = {}
+        if self._feed_events is not None:
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+
+        async def request():
+            async with session.get(self.forex_factory_url, headers=headers) as response:
+                if response.status == 304:
+                    return None
+
+                response.raise_for_status()
+                if ijson is not None:
+                    # Decode while the body streams in, keeping only tracked events
+                    events = [
+                        event
+                        async for event in ijson.items(response.content, 'item', use_float=True)
+                        if _is_tracked(event)
+                    ]
+                else:
+                    events = await response.json(loads=_json_loads, content_type=None)
+                self._etag = response.headers.get('ETag')
+                self._last_modified = response.headers.get('Last-Modified')
+                return events
+
         try:
             print("Fetching events from Forex Factory...")
-            response = requests.get(self.forex_factory_url, timeout=10)
-            response.raise_for_status()
+            events = await retry_async(request, recoverable=_is_transient)
+            self._consecutive_failures = 0
+
+            if events is None:
+                print("✓ Calendar unchanged since last fetch")
+                return self._feed_events
 
-            events = response.json()
             print(f"✓ Fetched {len(events)} events")
 
+            self._feed_events = events
+            self._save_feed_cache()
+
             return events
 
-        except requests.exceptions.RequestException as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             print(f"✗ Error fetching Forex Factory data: {e}")
-            return []
-        except json.JSONDecodeError as e:
+        except _JSON_ERRORS as e:
             print(f"✗ Error parsing JSON: {e}")
-            return []
+
+        self._record_failure()
+        return stale
+
+    def _record_failure(self):
+        """Count a failed fetch and open the breaker once past the threshold"""
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.failure_threshold:
+            open_for = min(300, 2 ** self._consecutive_failures)
+            self._breaker_open_until = time.monotonic() + open_for
+            print(f"⚠ Calendar fetch failing; skipping fetches for {open_for}s")
 
     def filter_high_impact_events(self, events: List[Dict]) -> List[Dict]:
         """
         Filter for high-impact EUR and CAD events
 
+        Each kept event's date is parsed once here and stored as '_time'
+        (naive local datetime) and '_ts' (epoch seconds), with the lowercased
+        impact as '_impact' and '_high' for impact == 'high'. Events with an
+        unparseable date are dropped.
+
         Args:
             events: List of all events
 
         Returns:
-            Filtered list of high-impact EUR/CAD events
+            Filtered list of high-impact EUR/CAD events, sorted by time
         """
         filtered = []
-
         for event in events:
-            try:
-                # Check if event has required fields
-                if 'country' not in event or 'impact' not in event:
-                    continue
+            # Missing or null country/impact fall through as '' and are dropped
+            impact = (event.get('impact') or '').lower()
+            if impact not in _IMPACTS or (event.get('country') or '').upper() not in _COUNTRIES:
+                continue
 
-                country = event.get('country', '').upper()
-                impact = event.get('impact', '').lower()
+            event_time = _parse_event_time(event.get('date'))
+            if event_time is None:
+                continue
 
-                # Filter for EUR and CAD high-impact events
-                if country in ['EUR', 'CAD'] and impact in ['high', 'medium']:
-                    filtered.append(event)
+            event['_time'] = event_time
+            event['_ts'] = event_time.timestamp()
+            event['_impact'] = impact
+            event['_high'] = impact == 'high'
+            filtered.append(event)
 
-            except Exception as e:
-                print(f"Error processing event: {e}")
-                continue
+        filtered.sort(key=lambda e: e['_ts'])
 
         print(f"Filtered to {len(filtered)} high-impact EUR/CAD events")
         return filtered
 
-    def get_upcoming_events(self, hours_ahead: int = 24) -> List[Dict]:
+    async def get_upcoming_events(self, hours_ahead: int = 24) -> List[Dict]:
         """
         Get upcoming high-impact events within specified timeframe
 
@@ -86,70 +281,90 @@ class EconomicCalendar:
             hours_ahead: Look ahead window in hours
 
         Returns:
-            List of upcoming events
+            List of upcoming events (shared between callers within
+            upcoming_ttl seconds; do not mutate)
         """
+        # Several checks run per trading decision; answer them from one pass
+        now = time.monotonic()
+        memo = self._upcoming_cache.get(hours_ahead)
+        if memo is not None and now - memo[0] < self.upcoming_ttl:
+            return memo[1]
+
         # Check cache
-        if self.cache_time and self.events_cache:
-            time_since_cache = (datetime.now() - self.cache_time).total_seconds()
-            if time_since_cache < self.cache_duration:
-                print("Using cached events")
-                return self._filter_by_time(self.events_cache, hours_ahead)
+        if self._cache_fresh():
+            print("Using cached events")
+        else:
+            await self.refresh(force=False)
 
-        # Fetch fresh data
-        all_events = self.fetch_forex_factory_events()
-        filtered_events = self.filter_high_impact_events(all_events)
+        upcoming = self._filter_by_time(hours_ahead)
+        self._upcoming_cache[hours_ahead] = (time.monotonic(), upcoming)
+        return upcoming
 
-        # Update cache
-        self.events_cache = filtered_events
-        self.cache_time = datetime.now()
+    def _cache_fresh(self) -> bool:
+        """True if the event cache is populated and younger than cache_duration"""
+        if not (self.cache_time and self.events_cache):
+            return False
+        return (datetime.now() - self.cache_time).total_seconds() < self.cache_duration
 
-        return self._filter_by_time(filtered_events, hours_ahead)
+    async def refresh(self, force: bool = True):
+        """
+        Fetch the feed and rebuild the event index
 
-    def _filter_by_time(self, events: List[Dict], hours_ahead: int) -> List[Dict]:
-        """Filter events by time window"""
-        now = datetime.now()
-        future_cutoff = now + timedelta(hours=hours_ahead)
+        Serialized by a lock so concurrent callers (a trading check and a
+        post-reconnect refresh) never fetch twice at once. With force=False a
+        caller that waited on the lock skips the fetch if the cache is fresh.
+        """
+        async with self._refresh_lock:
+            if not force and self._cache_fresh():
+                return
 
-        upcoming = []
-        for event in events:
-            try:
-                # Parse event time
-                event_time_str = event.get('date', '')
-                if not event_time_str:
-                    continue
-
-                # Try different date formats
-                for fmt in ['%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S']:
-                    try:
-                        event_time = datetime.strptime(event_time_str, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    # If no format worked, skip
-                    continue
-
-                # Check if event is in time window
-                if now <= event_time <= future_cutoff:
-                    upcoming.append({
-                        'title': event.get('title', 'Unknown'),
-                        'country': event.get('country', ''),
-                        'impact': event.get('impact', ''),
-                        'time': event_time,
-                        'forecast': event.get('forecast', ''),
-                        'previous': event.get('previous', '')
-                    })
-
-            except Exception as e:
-                print(f"Error parsing event time: {e}")
-                continue
+            all_events = await self.fetch_forex_factory_events()
+            filtered_events = self.filter_high_impact_events(all_events)
 
-        # Sort by time
-        upcoming.sort(key=lambda x: x['time'])
+            # Update cache
+            self._index_events(filtered_events)
+            self.cache_time = datetime.now()
+            self._upcoming_cache.clear()
 
-        return upcoming
+    def _index_events(self, events: List[Dict]):
+        """
+        Build the shared, time-sorted arrays every window query slices
 
-    def is_safe_to_trade(self, blackout_before_mins: int = 5, blackout_after_mins: int = 2) -> tuple:
+        Called once per refresh; 1h/2h/24h lookups then differ only in the
+        bisect bounds, with no per-query parsing, sorting or dict building.
+        """
+        self.events_cache = events
+        self._ts_keys = [event['_ts'] for event in events]
+        self._event_records = [
+            {
+                'title': event.get('title', 'Unknown'),
+                'country': event.get('country', ''),
+                'impact': event.get('impact', ''),
+                'time': event['_time'],
+                'forecast': event.get('forecast', ''),
+                'previous': event.get('previous', ''),
+                '_high': event['_high']
+            }
+            for event in events
+        ]
+
+    def _events_between(self, start_ts: float, end_ts: float) -> List[Dict]:
+        """
+        Cached events with start_ts <= epoch time <= end_ts, in time order
+
+        Two bisects on the sorted keys; a boolean mask over every event would
+        be O(N) per query where this is O(log N + k).
+        """
+        lo = bisect_left(self._ts_keys, start_ts)
+        hi = bisect_right(self._ts_keys, end_ts)
+        return self._event_records[lo:hi]
+
+    def _filter_by_time(self, hours_ahead: int) -> List[Dict]:
+        """Slice the cached, time-sorted events to [now, now + hours_ahead]"""
+        now_ts = time.time()
+        return self._events_between(now_ts, now_ts + hours_ahead * 3600)
+
+    async def is_safe_to_trade(self, blackout_before_mins: int = 5, blackout_after_mins: int = 2) -> tuple:
         """
         Check if it's safe to trade (no high-impact news nearby)
 
@@ -160,26 +375,28 @@ class EconomicCalendar:
         Returns:
             Tuple (is_safe: bool, reason: str, next_event: Optional[Dict])
         """
-        upcoming_events = self.get_upcoming_events(hours_ahead=2)
-
-        if not upcoming_events:
-            return (True, "No high-impact events in next 2 hours", None)
+        upcoming_events = await self.get_upcoming_events(hours_ahead=2)
 
         now = datetime.now()
 
-        for event in upcoming_events:
-            event_time = event['time']
-            time_diff_minutes = (event_time - now).total_seconds() / 60
-
-            # Check if we're in blackout period before event
-            if 0 <= time_diff_minutes <= blackout_before_mins:
+        # Any event inside [now - after, now + before] blocks trading; read the
+        # window straight off the sorted index (this also sees events that
+        # just happened, which upcoming_events starts after)
+        now_ts = now.timestamp()
+        blackout = self._events_between(now_ts - blackout_after_mins * 60,
+                                        now_ts + blackout_before_mins * 60)
+        if blackout:
+            event = blackout[0]
+            time_diff_minutes = (event['time'] - now).total_seconds() / 60
+
+            if time_diff_minutes >= 0:
                 reason = f"{event['country']} {event['impact']}-impact event '{event['title']}' in {time_diff_minutes:.1f} minutes"
-                return (False, reason, event)
-
-            # Check if event just happened (still in blackout after)
-            if -blackout_after_mins <= time_diff_minutes < 0:
+            else:
                 reason = f"{event['country']} {event['impact']}-impact event '{event['title']}' happened {abs(time_diff_minutes):.1f} minutes ago"
-                return (False, reason, event)
+            return (False, reason, event)
+
+        if not upcoming_events:
+            return (True, "No high-impact events in next 2 hours", None)
 
         # Safe to trade
         next_event = upcoming_events[0] if upcoming_events else None
@@ -191,9 +408,9 @@ class EconomicCalendar:
 
         return (True, reason, next_event)
 
-    def print_upcoming_events(self, hours_ahead: int = 24):
+    async def print_upcoming_events(self, hours_ahead: int = 24):
         """Print upcoming events in readable format"""
-        events = self.get_upcoming_events(hours_ahead)
+        events = await self.get_upcoming_events(hours_ahead)
 
         if not events:
             print(f"No high-impact EUR/CAD events in next {hours_ahead} hours")
@@ -230,14 +447,14 @@ class NewsAwareTrader:
         self.trading_allowed = True
         self.last_check_time = None
 
-    def check_trading_status(self) -> bool:
+    async def check_trading_status(self) -> bool:
         """
         Check if trading is currently allowed
 
         Returns:
             True if safe to trade, False otherwise
         """
-        is_safe, reason, next_event = self.calendar.is_safe_to_trade()
+        is_safe, reason, next_event = await self.calendar.is_safe_to_trade()
 
         self.last_check_time = datetime.now()
         self.trading_allowed = is_safe
@@ -249,14 +466,14 @@ class NewsAwareTrader:
 
         return is_safe
 
-    def should_increase_stops(self) -> tuple:
+    async def should_increase_stops(self) -> tuple:
         """
         Check if stop losses should be widened due to nearby news
 
         Returns:
             Tuple (should_widen: bool, multiplier: float)
         """
-        upcoming_events = self.calendar.get_upcoming_events(hours_ahead=1)
+        upcoming_events = await self.calendar.get_upcoming_events(hours_ahead=1)
 
         if not upcoming_events:
             return (False, 1.0)
@@ -267,26 +484,26 @@ class NewsAwareTrader:
 
         # If high-impact event within 15-60 minutes, widen stops
         if 15 <= time_to_event <= 60:
-            if nearest_event['impact'].lower() == 'high':
+            if nearest_event['_high']:
                 return (True, 1.5)  # Widen stops by 50%
             else:
                 return (True, 1.25)  # Widen stops by 25%
 
         return (False, 1.0)
 
-    def get_position_size_adjustment(self) -> float:
+    async def get_position_size_adjustment(self) -> float:
         """
         Get position size adjustment factor based on upcoming news
 
         Returns:
             Multiplier for position size (0.5 = half size, 1.0 = normal)
         """
-        upcoming_events = self.calendar.get_upcoming_events(hours_ahead=2)
+        upcoming_events = await self.calendar.get_upcoming_events(hours_ahead=2)
 
         if not upcoming_events:
             return 1.0
 
-        high_impact_count = sum(1 for e in upcoming_events if e['impact'].lower() == 'high')
+        high_impact_count = sum(e['_high'] for e in upcoming_events)
 
         if high_impact_count >= 2:
             return 0.5  # Half position if multiple high-impact events
@@ -295,7 +512,7 @@ class NewsAwareTrader:
         else:
             return 0.9  # 90% position for medium impact
 
-    def wait_for_trading_window(self, check_interval: int = 60):
+    async def wait_for_trading_window(self, check_interval: int = 60):
         """
         Wait until trading is allowed
 
@@ -304,26 +521,26 @@ class NewsAwareTrader:
         """
         print("Waiting for safe trading window...")
 
-        while not self.check_trading_status():
+        while not await self.check_trading_status():
             print(f"Checking again in {check_interval} seconds...")
-            time.sleep(check_interval)
+            await asyncio.sleep(check_interval)
 
         print("✓ Trading window opened!")
 
 
 # Example usage and testing
-if __name__ == "__main__":
+async def main():
     print("=== EUR/CAD News-Aware Trading System ===\n")
 
     # Initialize calendar
     calendar = EconomicCalendar()
 
     # Show upcoming events
-    calendar.print_upcoming_events(hours_ahead=24)
+    await calendar.print_upcoming_events(hours_ahead=24)
 
     # Check if safe to trade
     print("\n=== Current Trading Status ===")
-    is_safe, reason, next_event = calendar.is_safe_to_trade()
+    is_safe, reason, next_event = await calendar.is_safe_to_trade()
 
     if is_safe:
         print(f"✓ SAFE TO TRADE")
@@ -336,10 +553,10 @@ if __name__ == "__main__":
     print("\n=== News-Aware Trader Example ===")
     trader = NewsAwareTrader()
 
-    if trader.check_trading_status():
+    if await trader.check_trading_status():
         # Check if should adjust risk
-        should_widen, stop_multiplier = trader.should_increase_stops()
-        size_adjustment = trader.get_position_size_adjustment()
+        should_widen, stop_multiplier = await trader.should_increase_stops()
+        size_adjustment = await trader.get_position_size_adjustment()
 
         if should_widen:
             print(f"⚠ Widen stops by {(stop_multiplier - 1) * 100:.0f}%")
@@ -350,7 +567,7 @@ if __name__ == "__main__":
         print("\n✓ Ready to trade with risk adjustments")
     else:
         print("\n✗ Trading blocked due to news")
-        # trader.wait_for_trading_window()  # Uncomment to wait
+        # await trader.wait_for_trading_window()  # Uncomment to wait
 
     print("\n=== Integration with Trading Bot ===")
     print("""
@@ -358,13 +575,13 @@ To integrate with your trading bot:
 
 1. Check before each trade:
    trader = NewsAwareTrader()
-   if trader.check_trading_status():
+   if await trader.check_trading_status():
        # Place trade
        pass
 
 2. Adjust risk based on news:
-   should_widen, multiplier = trader.should_increase_stops()
-   size_adj = trader.get_position_size_adjustment()
+   should_widen, multiplier = await trader.should_increase_stops()
+   size_adj = await trader.get_position_size_adjustment()
 
    stop_loss = calculate_stop() * multiplier
    position_size = calculate_size() * size_adj
@@ -372,7 +589,17 @@ To integrate with your trading bot:
 3. Monitor continuously:
    # Check every 5 minutes
    while trading:
-       if not trader.check_trading_status():
+       if not await trader.check_trading_status():
            close_positions()
-       time.sleep(300)
+       await asyncio.sleep(300)
+
+   Run on the IBKR event loop (util.run / ib.run) so calendar
+   fetches overlap with market data instead of blocking it.
     """)
+
+    await calendar.close()
+    await trader.calendar.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -3,10 +3,57 @@ Risk Manager for EUR/CAD Trading Bot
 Handles position sizing, risk calculations, and account protection
 """
 
-import pandas as pd
-from typing import Dict, Optional, Tuple
+import logging
+import math
+import time
+import numpy as np
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
 from datetime import datetime, date
 from dataclasses import dataclass
+from enum import IntEnum
+
+from _njit import njit
+
+log = logging.getLogger(__name__)
+
+HISTORY_DAYS = 30  # past days of trade count / P&L kept in RiskManager._history
+
+_BANNER = "=" * 60
+_BANNER_SMALL = "=" * 50
+_BREAKER_HEADER = f"\n{_BANNER_SMALL}\n⚠ CIRCUIT BREAKER TRIGGERED ⚠"
+_SUMMARY_HEADER = f"\n{_BANNER}\nRISK MANAGEMENT SUMMARY\n{_BANNER}"
+
+
+class RejectReason(IntEnum):
+    """Outcome codes returned by RiskManager.can_open_position"""
+    OK = 0
+    TRADING_DISABLED = 1
+    CONSECUTIVE_LOSSES = 2
+    MAX_POSITIONS = 3
+    TRADE_RISK = 4
+    DAILY_TRADES = 5
+    DAILY_LOSS = 6
+    EXPOSURE = 7
+    INVALID_RISK = 8
+
+
+_REJECTION_MESSAGES = {
+    RejectReason.OK: "Position approved",
+    RejectReason.TRADING_DISABLED: "Trading is disabled (circuit breaker triggered)",
+    RejectReason.CONSECUTIVE_LOSSES: "Max consecutive losses reached ({})",
+    RejectReason.MAX_POSITIONS: "Maximum positions reached ({}/{})",
+    RejectReason.TRADE_RISK: "Trade risk too high ({:.1%} > {:.1%})",
+    RejectReason.DAILY_TRADES: "Daily trade limit reached ({}/{})",
+    RejectReason.DAILY_LOSS: "Daily loss limit reached (${:.2f})",
+    RejectReason.EXPOSURE: "Total exposure would exceed limit (${:.2f} > ${:.2f})",
+    RejectReason.INVALID_RISK: "Invalid trade risk (${} / {})",
+}
+
+
+def format_rejection(reason: RejectReason, args: tuple = ()) -> str:
+    """Human-readable message for a can_open_position result (format only when shown)"""
+    return _REJECTION_MESSAGES[reason].format(*args)
 
 
 @dataclass
@@ -21,12 +68,103 @@ class TradeRisk:
     reward_risk_ratio: Optional[float] = None
 
 
+@njit(cache=True)
+def _position_size_core(entry_price, stop_loss_price, risk_amount, pip_size, pip_value_per_unit):
+    """
+    Fixed-risk position sizing arithmetic
+
+    Returns:
+        (position_size in units, stop_loss_pips, actual risk amount)
+    """
+    stop_loss_pips = abs(entry_price - stop_loss_price) / pip_size
+
+    # Risk = Position Size × Pip Value × Stop Loss in Pips
+    # Position Size = Risk / (Pip Value × Stop Loss in Pips)
+    risk_per_unit = pip_value_per_unit * stop_loss_pips
+    position_size = int(risk_amount / risk_per_unit)
+
+    # Round to nearest 1000 units (0.01 lot, halves up), minimum 1000
+    position_size = (position_size + 500) // 1000 * 1000
+    position_size = max(position_size, 1000)
+
+    # Actual risk with the rounded position
+    return position_size, stop_loss_pips, position_size * risk_per_unit
+
+
+@njit(cache=True)
+def _position_sizes_core(entry_prices, stop_loss_prices, risk_amount, pip_size, pip_value_per_unit):
+    """_position_size_core over arrays of candidate trades, in one compiled loop"""
+    n = len(entry_prices)
+    position_sizes = np.empty(n, dtype=np.int64)
+    stop_loss_pips = np.empty(n, dtype=np.float64)
+    risk_amounts = np.empty(n, dtype=np.float64)
+
+    for i in range(n):
+        position_sizes[i], stop_loss_pips[i], risk_amounts[i] = _position_size_core(
+            entry_prices[i], stop_loss_prices[i], risk_amount, pip_size, pip_value_per_unit
+        )
+
+    return position_sizes, stop_loss_pips, risk_amounts
+
+
+@njit(cache=True)
+def _volatility_adjust_core(position_size, stop_loss_pips, volatility_ratio, pip_value_per_unit):
+    """
+    Scale a position by normal/current ATR, clamped to [0.5, 1.5]
+
+    Returns:
+        (adjusted position_size in units, risk amount)
+    """
+    # Limit adjustment to [0.5, 1.5]; compare-and-select, no min/max calls
+    # (a NaN ratio falls to 0.5, as max(0.5, min(nan, 1.5)) did)
+    volatility_ratio = 1.5 if volatility_ratio > 1.5 else (volatility_ratio if volatility_ratio > 0.5 else 0.5)
+
+    adjusted_size = int(position_size * volatility_ratio)
+    adjusted_size = (adjusted_size + 500) // 1000 * 1000  # Round to 1000, halves up
+
+    return adjusted_size, adjusted_size * pip_value_per_unit * stop_loss_pips
+
+
+def _require_positive(name: str, value: float):
+    """
+    Raise ValueError unless value is finite and > 0
+
+    Sizing inputs are checked before the compiled kernels, which would turn
+    a NaN stop (e.g. a missing ATR) into an enormous position, not an error.
+    """
+    if not (math.isfinite(value) and value > 0):
+        raise ValueError(f"{name} must be finite and > 0, got {value}")
+
+
+# Ahead-of-time build of the kernels above (python _risk_aot.py), if present
+try:
+    from risk_core import (
+        position_size as _position_size,
+        position_sizes as _position_sizes,
+        volatility_adjust as _volatility_adjust
+    )
+except ImportError:
+    _position_size = _position_size_core
+    _position_sizes = _position_sizes_core
+    _volatility_adjust = _volatility_adjust_core
+
+
 class RiskManager:
     """
     Comprehensive risk management system
     Enforces position sizing, daily limits, and account protection
     """
 
+    __slots__ = (
+        'account_balance', 'starting_balance', 'max_risk_per_trade', 'max_daily_risk',
+        'max_total_exposure', 'max_positions', 'max_trades_per_day', 'max_consecutive_losses',
+        'open_positions', '_risk_amounts', '_sizes', '_opened_at', '_free_slots',
+        '_current_exposure', '_history', '_today', '_today_trades',
+        '_today_pnl', 'consecutive_losses', 'trading_allowed', 'pip_value_per_lot',
+        'pip_size', '_pip_value_per_unit', '_max_daily_loss', '_max_exposure',
+        '_breaker_loss_limit', '_default_risk_amount'
+    )
+
     def __init__(
         self,
         account_balance: float,
@@ -59,15 +197,40 @@ class RiskManager:
         self.max_consecutive_losses = max_consecutive_losses
 
         # Trading state
-        self.open_positions = []
-        self.daily_trades = {}  # date -> count
-        self.daily_pnl = {}  # date -> pnl
+        # Open positions as parallel arrays, one slot per position
+        self.open_positions: Dict[str, int] = {}  # trade_id -> slot
+        self._risk_amounts = np.zeros(max_positions, dtype=np.float64)
+        self._sizes = np.zeros(max_positions, dtype=np.int64)
+        self._opened_at = np.zeros(max_positions, dtype=np.float64)  # epoch seconds
+        self._free_slots = list(range(max_positions - 1, -1, -1))  # pop() yields slot 0 first
+        self._current_exposure = 0.0  # _risk_amounts.sum(), refreshed on open/close
+        # (date, trades, pnl) for the last HISTORY_DAYS traded days; today is in _today_*
+        self._history: Deque[Tuple[date, int, float]] = deque(maxlen=HISTORY_DAYS)
+        self._today = date.today()
+        self._today_trades = 0
+        self._today_pnl = 0.0
         self.consecutive_losses = 0
         self.trading_allowed = True
 
         # Constants
         self.pip_value_per_lot = 10  # $10 per pip for standard lot
         self.pip_size = 0.0001
+        self._pip_value_per_unit = self.pip_value_per_lot / 100000
+
+        # Balance-derived limits, refreshed whenever account_balance changes
+        self._max_daily_loss = 0.0
+        self._max_exposure = 0.0
+        self._default_risk_amount = 0.0
+        self._refresh_limits()
+
+        # The circuit breaker measures daily loss against the starting balance
+        self._breaker_loss_limit = self.starting_balance * self.max_daily_risk
+
+    def _refresh_limits(self):
+        """Recompute the limits that scale with account_balance"""
+        self._max_daily_loss = self.account_balance * self.max_daily_risk
+        self._max_exposure = self.account_balance * self.max_total_exposure
+        self._default_risk_amount = self.account_balance * self.max_risk_per_trade
 
     def calculate_position_size(
         self,
@@ -86,37 +249,17 @@ class RiskManager:
         Returns:
             TradeRisk object with position sizing details
         """
+        # Calculate risk amount in dollars (the default is precomputed)
         if risk_percent is None:
-            risk_percent = self.max_risk_per_trade
-
-        # Calculate risk amount in dollars
-        risk_amount = self.account_balance * risk_percent
-
-        # Calculate stop loss in pips
-        stop_loss_pips = abs(entry_price - stop_loss_price) / self.pip_size
-
-        # Calculate position size
-        # Risk = Position Size × Pip Value × Stop Loss in Pips
-        # Position Size = Risk / (Pip Value × Stop Loss in Pips)
-
-        # First, calculate for 1 standard lot (100,000 units)
-        risk_per_lot = self.pip_value_per_lot * stop_loss_pips
-
-        # Calculate number of lots
-        lots = risk_amount / risk_per_lot
-
-        # Convert to units (1 lot = 100,000 units)
-        position_size = int(lots * 100000)
-
-        # Round to nearest 1000 units (0.01 lot)
-        position_size = round(position_size / 1000) * 1000
-
-        # Ensure minimum position (1000 units = 0.01 lot)
-        position_size = max(position_size, 1000)
+            risk_amount = self._default_risk_amount
+        else:
+            risk_amount = self.account_balance * risk_percent
+        _require_positive("Stop loss distance", abs(entry_price - stop_loss_price))
+        _require_positive("Risk amount", risk_amount)
 
-        # Calculate actual risk with rounded position
-        actual_lots = position_size / 100000
-        actual_risk_amount = actual_lots * risk_per_lot
+        position_size, stop_loss_pips, actual_risk_amount = _position_size(
+            entry_price, stop_loss_price, risk_amount, self.pip_size, self._pip_value_per_unit
+        )
         actual_risk_percent = actual_risk_amount / self.account_balance
 
         return TradeRisk(
@@ -127,6 +270,49 @@ class RiskManager:
             risk_percent=actual_risk_percent
         )
 
+    def calculate_position_sizes(
+        self,
+        entry_prices: np.ndarray,
+        stop_loss_prices: np.ndarray,
+        risk_percent: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Size many candidate trades at once (parameter sweeps, scans)
+
+        Same arithmetic as calculate_position_size, without a TradeRisk per
+        candidate; build one only for the trade actually taken.
+
+        Args:
+            entry_prices: Planned entry prices
+            stop_loss_prices: Planned stop loss prices (same length)
+            risk_percent: Override default risk percent (optional)
+
+        Returns:
+            Tuple (position_sizes, stop_loss_pips, risk_amounts) of arrays
+        """
+        if risk_percent is None:
+            risk_amount = self._default_risk_amount
+        else:
+            risk_amount = self.account_balance * risk_percent
+
+        entry_prices = np.ascontiguousarray(entry_prices, dtype=np.float64)
+        stop_loss_prices = np.ascontiguousarray(stop_loss_prices, dtype=np.float64)
+        stop_distances = np.abs(entry_prices - stop_loss_prices)
+        invalid = ~(np.isfinite(stop_distances) & (stop_distances > 0))
+        if invalid.any():
+            i = int(np.argmax(invalid))
+            raise ValueError(f"Stop loss distance must be finite and > 0, got "
+                             f"{stop_distances[i]} at index {i} ({int(invalid.sum())} invalid)")
+        _require_positive("Risk amount", risk_amount)
+
+        return _position_sizes(
+            entry_prices,
+            stop_loss_prices,
+            risk_amount,
+            self.pip_size,
+            self._pip_value_per_unit
+        )
+
     def calculate_volatility_adjusted_size(
         self,
         entry_price: float,
@@ -146,22 +332,20 @@ class RiskManager:
         Returns:
             TradeRisk object with volatility-adjusted sizing
         """
-        # Calculate base position size
-        base_risk = self.calculate_position_size(entry_price, stop_loss_price)
+        # Calculate base position size (no intermediate TradeRisk; stop_loss_pips is reused)
+        _require_positive("Stop loss distance", abs(entry_price - stop_loss_price))
+        _require_positive("Risk amount", self._default_risk_amount)
+        position_size, stop_loss_pips, _ = _position_size(
+            entry_price, stop_loss_price, self._default_risk_amount,
+            self.pip_size, self._pip_value_per_unit
+        )
 
         # Adjust for volatility
         # If ATR is higher than normal, reduce position size
         # If ATR is lower than normal, can increase (but capped)
-        volatility_ratio = normal_atr / current_atr
-        volatility_ratio = max(0.5, min(volatility_ratio, 1.5))  # Limit adjustment
-
-        adjusted_size = int(base_risk.position_size * volatility_ratio)
-        adjusted_size = round(adjusted_size / 1000) * 1000  # Round to 1000
-
-        # Recalculate risk with adjusted size
-        actual_lots = adjusted_size / 100000
-        stop_loss_pips = abs(entry_price - stop_loss_price) / self.pip_size
-        risk_amount = actual_lots * self.pip_value_per_lot * stop_loss_pips
+        adjusted_size, risk_amount = _volatility_adjust(
+            position_size, stop_loss_pips, normal_atr / current_atr, self._pip_value_per_unit
+        )
 
         return TradeRisk(
             position_size=adjusted_size,
@@ -171,7 +355,7 @@ class RiskManager:
             risk_percent=risk_amount / self.account_balance
         )
 
-    def can_open_position(self, new_position_risk: TradeRisk) -> Tuple[bool, str]:
+    def can_open_position(self, new_position_risk: TradeRisk) -> Tuple[bool, RejectReason, tuple]:
         """
         Check if new position can be opened based on risk rules
 
@@ -179,48 +363,52 @@ class RiskManager:
             new_position_risk: Risk parameters for new position
 
         Returns:
-            Tuple (can_open: bool, reason: str)
+            Tuple (can_open: bool, reason: RejectReason, args: tuple);
+            format_rejection(reason, args) gives the message
         """
-        today = date.today()
+        # Checks run cheapest first and stop at the first failure
 
         # Check if trading is allowed
         if not self.trading_allowed:
-            return (False, "Trading is disabled (circuit breaker triggered)")
+            return (False, RejectReason.TRADING_DISABLED, ())
 
         # Check consecutive losses
         if self.consecutive_losses >= self.max_consecutive_losses:
-            return (False, f"Max consecutive losses reached ({self.consecutive_losses})")
-
-        # Check daily trade limit
-        today_trades = self.daily_trades.get(today, 0)
-        if today_trades >= self.max_trades_per_day:
-            return (False, f"Daily trade limit reached ({today_trades}/{self.max_trades_per_day})")
-
-        # Check daily loss limit
-        today_pnl = self.daily_pnl.get(today, 0)
-        max_daily_loss = self.account_balance * self.max_daily_risk
-
-        if today_pnl <= -max_daily_loss:
-            return (False, f"Daily loss limit reached (${abs(today_pnl):.2f})")
+            self.trading_allowed = False
+            return (False, RejectReason.CONSECUTIVE_LOSSES, (self.consecutive_losses,))
 
         # Check maximum positions
         if len(self.open_positions) >= self.max_positions:
-            return (False, f"Maximum positions reached ({len(self.open_positions)}/{self.max_positions})")
-
-        # Check total exposure
-        current_exposure = sum(pos['risk_amount'] for pos in self.open_positions)
-        total_exposure = current_exposure + new_position_risk.risk_amount
-        max_exposure = self.account_balance * self.max_total_exposure
+            return (False, RejectReason.MAX_POSITIONS, (len(self.open_positions), self.max_positions))
 
-        if total_exposure > max_exposure:
-            return (False, f"Total exposure would exceed limit (${total_exposure:.2f} > ${max_exposure:.2f})")
+        # NaN / inf risk would slip through every comparison below
+        if not (math.isfinite(new_position_risk.risk_amount)
+                and math.isfinite(new_position_risk.risk_percent)):
+            return (False, RejectReason.INVALID_RISK,
+                    (new_position_risk.risk_amount, new_position_risk.risk_percent))
 
         # Check individual trade risk
         if new_position_risk.risk_percent > self.max_risk_per_trade:
-            return (False, f"Trade risk too high ({new_position_risk.risk_percent*100:.1f}% > {self.max_risk_per_trade*100:.1f}%)")
+            return (False, RejectReason.TRADE_RISK, (new_position_risk.risk_percent, self.max_risk_per_trade))
+
+        # Daily limits need the current day's counters
+        self._roll_day()
+
+        # Check daily trade limit
+        if self._today_trades >= self.max_trades_per_day:
+            return (False, RejectReason.DAILY_TRADES, (self._today_trades, self.max_trades_per_day))
+
+        # Check daily loss limit
+        if self._today_pnl <= -self._max_daily_loss:
+            return (False, RejectReason.DAILY_LOSS, (abs(self._today_pnl),))
+
+        # Check total exposure
+        total_exposure = self._current_exposure + new_position_risk.risk_amount
+        if total_exposure > self._max_exposure:
+            return (False, RejectReason.EXPOSURE, (total_exposure, self._max_exposure))
 
         # All checks passed
-        return (True, "Position approved")
+        return (True, RejectReason.OK, ())
 
     def register_trade(self, trade_risk: TradeRisk, trade_id: str):
         """
@@ -230,22 +418,36 @@ class RiskManager:
             trade_risk: Risk parameters for the trade
             trade_id: Unique identifier for trade
         """
-        today = date.today()
+        self._roll_day()
+
+        # Add to open positions (re-registering an id reuses its slot)
+        slot = self.open_positions.get(trade_id)
+        if slot is None:
+            if not self._free_slots:
+                self._grow_slots()
+            slot = self._free_slots.pop()
+            self.open_positions[trade_id] = slot
 
-        # Add to open positions
-        self.open_positions.append({
-            'trade_id': trade_id,
-            'risk_amount': trade_risk.risk_amount,
-            'position_size': trade_risk.position_size,
-            'timestamp': datetime.now()
-        })
+        self._risk_amounts[slot] = trade_risk.risk_amount
+        self._sizes[slot] = trade_risk.position_size
+        self._opened_at[slot] = time.time()
+        self._current_exposure = float(self._risk_amounts.sum())
 
         # Update daily trade count
-        self.daily_trades[today] = self.daily_trades.get(today, 0) + 1
+        self._today_trades += 1
 
-        print(f"✓ Trade {trade_id} registered")
-        print(f"  Risk: ${trade_risk.risk_amount:.2f} ({trade_risk.risk_percent*100:.2f}%)")
-        print(f"  Open positions: {len(self.open_positions)}")
+        if log.isEnabledFor(logging.INFO):
+            log.info("✓ Trade %s registered\n  Risk: $%.2f (%.2f%%)\n  Open positions: %d",
+                     trade_id, trade_risk.risk_amount, trade_risk.risk_percent * 100,
+                     len(self.open_positions))
+
+    def _grow_slots(self):
+        """Double slot capacity (trades registered beyond max_positions)"""
+        n = max(len(self._risk_amounts), 1)
+        self._risk_amounts = np.concatenate([self._risk_amounts, np.zeros(n, dtype=np.float64)])
+        self._sizes = np.concatenate([self._sizes, np.zeros(n, dtype=np.int64)])
+        self._opened_at = np.concatenate([self._opened_at, np.zeros(n, dtype=np.float64)])
+        self._free_slots.extend(range(len(self._risk_amounts) - 1, len(self._risk_amounts) - n - 1, -1))
 
     def close_trade(
         self,
@@ -261,19 +463,22 @@ class RiskManager:
             pnl: Profit/loss amount
             is_winner: True if profitable trade
         """
-        today = date.today()
+        self._roll_day()
 
-        # Remove from open positions
-        self.open_positions = [
-            pos for pos in self.open_positions
-            if pos['trade_id'] != trade_id
-        ]
+        # Remove from open positions (free slots hold zeros)
+        slot = self.open_positions.pop(trade_id, None)
+        if slot is not None:
+            self._risk_amounts[slot] = 0.0
+            self._sizes[slot] = 0
+            self._free_slots.append(slot)
+            self._current_exposure = float(self._risk_amounts.sum())
 
         # Update daily P&L
-        self.daily_pnl[today] = self.daily_pnl.get(today, 0) + pnl
+        self._today_pnl += pnl
 
         # Update account balance
         self.account_balance += pnl
+        self._refresh_limits()
 
         # Update consecutive losses
         if is_winner:
@@ -284,48 +489,59 @@ class RiskManager:
         # Check circuit breaker
         self._check_circuit_breaker()
 
-        print(f"✓ Trade {trade_id} closed")
-        print(f"  P&L: ${pnl:.2f}")
-        print(f"  New balance: ${self.account_balance:.2f}")
-        print(f"  Daily P&L: ${self.daily_pnl[today]:.2f}")
-        print(f"  Consecutive losses: {self.consecutive_losses}")
+        if log.isEnabledFor(logging.INFO):
+            log.info("✓ Trade %s closed\n  P&L: $%.2f\n  New balance: $%.2f\n"
+                     "  Daily P&L: $%.2f\n  Consecutive losses: %d",
+                     trade_id, pnl, self.account_balance, self._today_pnl,
+                     self.consecutive_losses)
+
+    def _roll_day(self):
+        """Archive the day's counters into _history when the date changes"""
+        today = date.today()
+        if today == self._today:
+            return
+
+        if self._today_trades or self._today_pnl:
+            self._history.append((self._today, self._today_trades, self._today_pnl))
+
+        self._today = today
+        self._today_trades = 0
+        self._today_pnl = 0.0
 
     def _check_circuit_breaker(self):
         """Check if circuit breaker should be triggered"""
-        today = date.today()
-        today_pnl = self.daily_pnl.get(today, 0)
-        max_daily_loss = self.starting_balance * self.max_daily_risk
+        # Already tripped; only reset_daily_limits turns trading back on
+        if not self.trading_allowed:
+            return
 
         # Trigger if daily loss exceeds limit
-        if today_pnl <= -max_daily_loss:
-            self.trading_allowed = False
-            print("\n" + "="*50)
-            print("⚠ CIRCUIT BREAKER TRIGGERED ⚠")
-            print(f"Daily loss: ${abs(today_pnl):.2f}")
-            print(f"Limit: ${max_daily_loss:.2f}")
-            print("Trading disabled for the day")
-            print("="*50 + "\n")
+        if self._today_pnl <= -self._breaker_loss_limit:
+            self._trip(
+                f"Daily loss: ${abs(self._today_pnl):.2f}",
+                f"Limit: ${self._breaker_loss_limit:.2f}",
+                "Trading disabled for the day"
+            )
 
         # Trigger if max consecutive losses reached
         if self.consecutive_losses >= self.max_consecutive_losses:
-            self.trading_allowed = False
-            print("\n" + "="*50)
-            print("⚠ CIRCUIT BREAKER TRIGGERED ⚠")
-            print(f"Consecutive losses: {self.consecutive_losses}")
-            print("Trading disabled")
-            print("="*50 + "\n")
+            self._trip(
+                f"Consecutive losses: {self.consecutive_losses}",
+                "Trading disabled"
+            )
+
+    def _trip(self, *details: str):
+        """Disable trading and print the circuit breaker banner"""
+        self.trading_allowed = False
+        print("\n".join([_BREAKER_HEADER, *details, _BANNER_SMALL + "\n"]))
 
     def get_risk_summary(self) -> Dict:
         """Get current risk status summary"""
-        today = date.today()
+        self._roll_day()
 
-        current_exposure = sum(pos['risk_amount'] for pos in self.open_positions)
-        max_exposure = self.account_balance * self.max_total_exposure
+        current_exposure = self._current_exposure
+        max_exposure = self._max_exposure
         exposure_percent = (current_exposure / max_exposure) * 100 if max_exposure > 0 else 0
 
-        today_trades = self.daily_trades.get(today, 0)
-        today_pnl = self.daily_pnl.get(today, 0)
-
         return {
             'account_balance': self.account_balance,
             'starting_balance': self.starting_balance,
@@ -334,8 +550,8 @@ class RiskManager:
             'open_positions': len(self.open_positions),
             'current_exposure': current_exposure,
             'exposure_used_percent': exposure_percent,
-            'daily_trades': today_trades,
-            'daily_pnl': today_pnl,
+            'daily_trades': self._today_trades,
+            'daily_pnl': self._today_pnl,
             'consecutive_losses': self.consecutive_losses,
             'trading_allowed': self.trading_allowed
         }
@@ -344,31 +560,24 @@ class RiskManager:
         """Print formatted risk summary"""
         summary = self.get_risk_summary()
 
-        print("\n" + "="*60)
-        print("RISK MANAGEMENT SUMMARY")
-        print("="*60)
-        print(f"Account Balance:        ${summary['account_balance']:,.2f}")
-        print(f"Starting Balance:       ${summary['starting_balance']:,.2f}")
-        print(f"Total P&L:              ${summary['total_pnl']:,.2f} ({summary['total_pnl_percent']:+.2f}%)")
-        print(f"\nOpen Positions:         {summary['open_positions']}/{self.max_positions}")
-        print(f"Current Exposure:       ${summary['current_exposure']:.2f}")
-        print(f"Exposure Used:          {summary['exposure_used_percent']:.1f}%")
-        print(f"\nToday's Trades:         {summary['daily_trades']}/{self.max_trades_per_day}")
-        print(f"Today's P&L:            ${summary['daily_pnl']:,.2f}")
-        print(f"Consecutive Losses:     {summary['consecutive_losses']}/{self.max_consecutive_losses}")
-        print(f"\nTrading Status:         {'✓ ENABLED' if summary['trading_allowed'] else '✗ DISABLED'}")
-        print("="*60 + "\n")
+        print("\n".join([
+            _SUMMARY_HEADER,
+            f"Account Balance:        ${summary['account_balance']:,.2f}",
+            f"Starting Balance:       ${summary['starting_balance']:,.2f}",
+            f"Total P&L:              ${summary['total_pnl']:,.2f} ({summary['total_pnl_percent']:+.2f}%)",
+            f"\nOpen Positions:         {summary['open_positions']}/{self.max_positions}",
+            f"Current Exposure:       ${summary['current_exposure']:.2f}",
+            f"Exposure Used:          {summary['exposure_used_percent']:.1f}%",
+            f"\nToday's Trades:         {summary['daily_trades']}/{self.max_trades_per_day}",
+            f"Today's P&L:            ${summary['daily_pnl']:,.2f}",
+            f"Consecutive Losses:     {summary['consecutive_losses']}/{self.max_consecutive_losses}",
+            f"\nTrading Status:         {'✓ ENABLED' if summary['trading_allowed'] else '✗ DISABLED'}",
+            _BANNER + "\n",
+        ]))
 
     def reset_daily_limits(self):
         """Reset daily limits (call at start of new trading day)"""
-        today = date.today()
-        yesterday = today - pd.Timedelta(days=1)
-
-        # Clear old daily data
-        if yesterday in self.daily_trades:
-            del self.daily_trades[yesterday]
-        if yesterday in self.daily_pnl:
-            del self.daily_pnl[yesterday]
+        self._roll_day()
 
         # Reset circuit breaker if new day
         if self.consecutive_losses < self.max_consecutive_losses:
@@ -379,6 +588,8 @@ class RiskManager:
 
 # Example usage
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     print("=== Risk Manager Example ===\n")
 
     # Initialize risk manager with $10,000 account
@@ -410,9 +621,9 @@ if __name__ == "__main__":
     print("\n\nExample 2: Position Approval Check")
     print("-" * 40)
 
-    can_open, reason = rm.can_open_position(trade_risk)
+    can_open, reason, args = rm.can_open_position(trade_risk)
     print(f"Can open position: {can_open}")
-    print(f"Reason: {reason}")
+    print(f"Reason: {format_rejection(reason, args)}")
 
     if can_open:
         rm.register_trade(trade_risk, "TRADE_001")
@@ -451,9 +662,9 @@ if __name__ == "__main__":
     # Try to open 3 more positions
     for i in range(3):
         trade_risk_new = rm.calculate_position_size(1.4500, 1.4475)
-        can_open, reason = rm.can_open_position(trade_risk_new)
+        can_open, reason, args = rm.can_open_position(trade_risk_new)
 
-        print(f"\nTrade {i+2}: {can_open} - {reason}")
+        print(f"\nTrade {i+2}: {can_open} - {format_rejection(reason, args)}")
 
         if can_open:
             rm.register_trade(trade_risk_new, f"TRADE_00{i+2}")
@@ -7,9 +7,90 @@ import pandas as pd
 import numpy as np
 import talib
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Tuple
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple, Type
 from datetime import datetime
 
+from _indicator_cache import cached_atr
+from _kernels import ema_cross_kernel, mean_reversion_kernel, rolling_max_min, trend_signal_kernel
+
+
+def _as_f64(s: pd.Series) -> np.ndarray:
+    """Column as a contiguous float64 array, the layout TA-Lib works on"""
+    return np.ascontiguousarray(s.to_numpy(), dtype=np.float64)
+
+
+def _pct_change_pct(a: np.ndarray) -> np.ndarray:
+    """Bar-over-bar change in percent (pandas pct_change() * 100, NaN first bar)"""
+    out = np.empty_like(a)
+    out[:1] = np.nan
+    np.divide(a[1:], a[:-1], out=out[1:])
+    out[1:] -= 1.0
+    out *= 100.0
+    return out
+
+
+def _signal_column(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """int8 signal column: 1 on buy bars, -1 on sell bars, 0 elsewhere"""
+    return np.select([buy, sell], [np.int8(1), np.int8(-1)], default=np.int8(0))
+
+
+def _with_columns(df: pd.DataFrame, columns: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    df plus the given columns, added with one concat
+
+    Each df[col] = ... rebuilds the column index and inserts into the
+    BlockManager separately; one concat of a frame holding all the new columns
+    does that once. Columns already in df are replaced.
+    """
+    new = pd.DataFrame(columns, index=df.index, copy=False)
+    existing = df.columns.intersection(new.columns)
+    if len(existing):
+        df = df.drop(columns=existing)
+    return pd.concat([df, new], axis=1, copy=False)
+
+
+def _warmup_output(
+    df: pd.DataFrame,
+    nan_columns: Tuple[str, ...],
+    zero_columns: Dict[str, type]
+) -> pd.DataFrame:
+    """
+    Output columns for a frame shorter than a strategy's indicator warm-up
+
+    No bar can carry a signal yet, so the indicators are not computed:
+    indicator columns are all NaN, signal / exit columns all zero (False).
+    """
+    n = len(df)
+    columns = {name: np.full(n, np.nan) for name in nan_columns}
+    columns.update((name, np.zeros(n, dtype=dtype)) for name, dtype in zero_columns.items())
+    return _with_columns(df, columns)
+
+
+class StrategyView(NamedTuple):
+    """
+    NumPy arrays of a signals DataFrame, built once per backtest
+    Per-bar strategy callbacks index these with an explicit bar number
+    instead of receiving a fresh DataFrame slice on every call
+    """
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    columns: Mapping[str, np.ndarray]
+    frame: pd.DataFrame
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "StrategyView":
+        columns = {name: df[name].to_numpy() for name in df.columns}
+        return cls(
+            open=columns.get('open'),
+            high=columns['high'],
+            low=columns['low'],
+            close=columns['close'],
+            columns=columns,
+            frame=df
+        )
+
 
 class BaseStrategy(ABC):
     """
@@ -17,6 +98,8 @@ class BaseStrategy(ABC):
     All strategies must implement these methods
     """
 
+    __slots__ = ('name', 'positions', 'signals', 'performance', '_last_frame', '_last_values')
+
     def __init__(self, name: str):
         self.name = name
         self.positions = []
@@ -28,6 +111,9 @@ class BaseStrategy(ABC):
             'total_pnl': 0.0,
             'win_rate': 0.0
         }
+        # Last-bar values of the frame calculate_signals returned most recently
+        self._last_frame = None
+        self._last_values = {}
 
     @abstractmethod
     def calculate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -38,7 +124,8 @@ class BaseStrategy(ABC):
             df: DataFrame with OHLCV data
 
         Returns:
-            DataFrame with added signal columns
+            DataFrame with added signal columns; may be a new frame rather
+            than df itself, so callers use the return value
         """
         pass
 
@@ -72,6 +159,91 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def _cache_last_bar(self, df: pd.DataFrame, **columns: np.ndarray):
+        """
+        Remember the last bar of the columns get_stop_loss / get_take_profit read
+
+        Called at the end of calculate_signals with the arrays just written to
+        df, so the per-trade calls on that frame are plain dict lookups instead
+        of pandas indexing.
+        """
+        if len(df) == 0:
+            self._last_frame = None
+            return
+        self._last_frame = df
+        self._last_values = {name: float(a[-1]) for name, a in columns.items()}
+
+    def _last_bar(self, df: pd.DataFrame, column: str) -> float:
+        """Last-bar value of a signal column; cached for the frame calculate_signals returned"""
+        if df is self._last_frame:
+            return self._last_values[column]
+        return float(df[column].iat[-1])
+
+    def get_stop_loss_at(
+        self,
+        view: StrategyView,
+        i: int,
+        entry_price: float,
+        action: str
+    ) -> float:
+        """
+        Calculate stop loss price for bar i from pre-extracted column arrays
+
+        The default passes the frame up to bar i (a view, no data copy) to
+        get_stop_loss. Strategies override this with direct array indexing.
+
+        Args:
+            view: Column arrays of the signals DataFrame
+            i: Bar index the position is opened on
+            entry_price: Entry price
+            action: 'BUY' or 'SELL'
+
+        Returns:
+            Stop loss price
+        """
+        return self.get_stop_loss(view.frame.iloc[:i + 1], entry_price, action)
+
+    def get_take_profit_at(
+        self,
+        view: StrategyView,
+        i: int,
+        entry_price: float,
+        action: str
+    ) -> float:
+        """
+        Calculate take profit price for bar i from pre-extracted column arrays
+
+        Args:
+            view: Column arrays of the signals DataFrame
+            i: Bar index the position is opened on
+            entry_price: Entry price
+            action: 'BUY' or 'SELL'
+
+        Returns:
+            Take profit price
+        """
+        return self.get_take_profit(view.frame.iloc[:i + 1], entry_price, action)
+
+    def precompute_sl_tp(
+        self,
+        df: pd.DataFrame
+    ) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Calculate stop loss / take profit for every bar in one vectorized pass
+
+        Assumes entry at the bar's close. Strategies whose levels depend on
+        rolling indicators override this so the backtester never has to call
+        back into the strategy per signal.
+
+        Args:
+            df: DataFrame returned by calculate_signals
+
+        Returns:
+            (sl_long, sl_short, tp_long, tp_short) arrays, or None to fall
+            back to get_stop_loss_at / get_take_profit_at per signal
+        """
+        return None
+
 
 class MeanReversionStrategy(BaseStrategy):
     """
@@ -80,6 +252,10 @@ class MeanReversionStrategy(BaseStrategy):
     Best for: Range-bound markets
     """
 
+    __slots__ = ('bb_period', 'bb_std', 'rsi_period', 'rsi_oversold', 'rsi_overbought')
+
+    _ATR_STOP_MULT = 2.0  # stop distance in ATRs
+
     def __init__(
         self,
         bb_period: int = 20,
@@ -103,56 +279,76 @@ class MeanReversionStrategy(BaseStrategy):
         - BUY: Price touches lower band AND RSI < 30
         - SELL: Price touches upper band AND RSI > 70
         """
-        # Calculate Bollinger Bands
-        upper, middle, lower = talib.BBANDS(
-            df['close'],
-            timeperiod=self.bb_period,
-            nbdevup=self.bb_std,
-            nbdevdn=self.bb_std
+        # Signals and exits all need the bands, valid from bar bb_period
+        if len(df) < self.bb_period:
+            return _warmup_output(
+                df, ('bb_middle', 'atr'),
+                {'signal': np.int8, 'exit_long': np.bool_, 'exit_short': np.bool_}
+            )
+
+        close = _as_f64(df['close'])
+        high = _as_f64(df['high'])
+        low = _as_f64(df['low'])
+
+        # Bollinger Bands, RSI and ATR (for stop loss) in one pass over the bars
+        upper, middle, lower, rsi, atr = mean_reversion_kernel(
+            close, high, low,
+            self.bb_period, float(self.bb_std), self.rsi_period, 14
         )
 
-        df['bb_upper'] = upper
-        df['bb_middle'] = middle
-        df['bb_lower'] = lower
-
-        # Calculate RSI
-        df['rsi'] = talib.RSI(df['close'], timeperiod=self.rsi_period)
-
-        # Calculate ATR for stop loss
-        df['atr'] = talib.ATR(df['high'], df['low'], df['close'], timeperiod=14)
-
-        # Generate signals
-        df['signal'] = 0
-
         # Buy signal: Price at or below lower band + RSI oversold
-        buy_condition = (df['close'] <= df['bb_lower']) & (df['rsi'] < self.rsi_oversold)
-        df.loc[buy_condition, 'signal'] = 1
+        buy_condition = (close <= lower) & (rsi < self.rsi_oversold)
 
         # Sell signal: Price at or above upper band + RSI overbought
-        sell_condition = (df['close'] >= df['bb_upper']) & (df['rsi'] > self.rsi_overbought)
-        df.loc[sell_condition, 'signal'] = -1
-
-        # Exit signal: Price returns to middle band
-        df['exit_long'] = df['close'] >= df['bb_middle']
-        df['exit_short'] = df['close'] <= df['bb_middle']
-
+        sell_condition = (close >= upper) & (rsi > self.rsi_overbought)
+
+        # Only columns the stop loss / take profit / exits read are kept
+        df = _with_columns(df, {
+            'bb_middle': middle,
+            'atr': atr,
+            'signal': _signal_column(buy_condition, sell_condition),
+            # Exit signal: Price returns to middle band
+            'exit_long': close >= middle,
+            'exit_short': close <= middle,
+        })
+
+        self._cache_last_bar(df, atr=atr, bb_middle=middle)
         return df
 
     def get_stop_loss(self, df: pd.DataFrame, entry_price: float, action: str) -> float:
         """Stop loss at 2x ATR"""
-        atr = df['atr'].iloc[-1]
-        pip_size = 0.0001
+        return self._stop_loss(self._last_bar(df, 'atr'), entry_price, action)
 
+    def get_stop_loss_at(self, view, i, entry_price, action) -> float:
+        """Stop loss at 2x ATR (array version)"""
+        return self._stop_loss(view.columns['atr'][i], entry_price, action)
+
+    def _stop_loss(self, atr: float, entry_price: float, action: str) -> float:
         if action == 'BUY':
-            stop_loss = entry_price - (2 * atr)
+            stop_loss = entry_price - self._ATR_STOP_MULT * atr
         else:  # SELL
-            stop_loss = entry_price + (2 * atr)
+            stop_loss = entry_price + self._ATR_STOP_MULT * atr
 
         return round(stop_loss, 5)
 
     def get_take_profit(self, df: pd.DataFrame, entry_price: float, action: str) -> float:
         """Take profit at middle Bollinger Band"""
-        return df['bb_middle'].iloc[-1]
+        return self._last_bar(df, 'bb_middle')
+
+    def get_take_profit_at(self, view, i, entry_price, action) -> float:
+        """Take profit at middle Bollinger Band (array version)"""
+        return view.columns['bb_middle'][i]
+
+    def precompute_sl_tp(self, df: pd.DataFrame):
+        """2x ATR stops and middle band targets for every bar"""
+        close = df['close'].to_numpy(dtype=np.float64)
+        atr = df['atr'].to_numpy(dtype=np.float64)
+        bb_middle = df['bb_middle'].to_numpy(dtype=np.float64)
+
+        stop = self._ATR_STOP_MULT * atr
+        sl_long = np.round(close - stop, 5)
+        sl_short = np.round(close + stop, 5)
+        return sl_long, sl_short, bb_middle, bb_middle
 
 
 class TrendFollowingStrategy(BaseStrategy):
@@ -162,6 +358,10 @@ class TrendFollowingStrategy(BaseStrategy):
     Best for: Trending markets
     """
 
+    __slots__ = ('ema_fast', 'ema_slow', 'macd_signal', 'adx_period', 'adx_threshold')
+
+    _ATR_STOP_MULT = 2.0  # stop distance in ATRs
+
     def __init__(
         self,
         ema_fast: int = 12,
@@ -185,83 +385,74 @@ class TrendFollowingStrategy(BaseStrategy):
         - BUY: Fast EMA crosses above Slow EMA + MACD bullish + ADX > 25
         - SELL: Fast EMA crosses below Slow EMA + MACD bearish + ADX > 25
         """
+        # Signals and exits all need an EMA cross, which needs both EMAs on
+        # the previous bar too
+        if len(df) <= max(self.ema_fast, self.ema_slow):
+            return _warmup_output(
+                df, ('ema_slow', 'atr'),
+                {'ema_cross': np.int8, 'signal': np.int8,
+                 'exit_long': np.bool_, 'exit_short': np.bool_}
+            )
+
+        close = _as_f64(df['close'])
+        high = _as_f64(df['high'])
+        low = _as_f64(df['low'])
+
         # Calculate EMAs
-        df['ema_fast'] = talib.EMA(df['close'], timeperiod=self.ema_fast)
-        df['ema_slow'] = talib.EMA(df['close'], timeperiod=self.ema_slow)
-
-        # Calculate MACD
-        macd, macd_signal, macd_hist = talib.MACD(
-            df['close'],
-            fastperiod=self.ema_fast,
-            slowperiod=self.ema_slow,
-            signalperiod=self.macd_signal
-        )
+        ema_fast = talib.EMA(close, timeperiod=self.ema_fast)
+        ema_slow = talib.EMA(close, timeperiod=self.ema_slow)
 
-        df['macd'] = macd
-        df['macd_signal'] = macd_signal
-        df['macd_hist'] = macd_hist
+        # MACD from the EMAs above rather than talib.MACD, which would
+        # compute both again
+        macd = ema_fast - ema_slow
+        macd_signal = talib.EMA(macd, timeperiod=self.macd_signal)
 
         # Calculate ADX
-        df['adx'] = talib.ADX(
-            df['high'],
-            df['low'],
-            df['close'],
-            timeperiod=self.adx_period
-        )
+        adx = talib.ADX(high, low, close, timeperiod=self.adx_period)
 
         # Calculate ATR for stop loss
-        df['atr'] = talib.ATR(df['high'], df['low'], df['close'], timeperiod=14)
-
-        # Detect EMA crossovers
-        df['ema_cross'] = 0
-        df.loc[
-            (df['ema_fast'] > df['ema_slow']) &
-            (df['ema_fast'].shift(1) <= df['ema_slow'].shift(1)),
-            'ema_cross'
-        ] = 1  # Bullish crossover
-
-        df.loc[
-            (df['ema_fast'] < df['ema_slow']) &
-            (df['ema_fast'].shift(1) >= df['ema_slow'].shift(1)),
-            'ema_cross'
-        ] = -1  # Bearish crossover
+        atr = cached_atr(high, low, close, 14)
 
-        # Generate signals
-        df['signal'] = 0
-
-        # Buy signal: Bullish EMA cross + MACD > Signal + ADX > threshold
-        buy_condition = (
-            (df['ema_cross'] == 1) &
-            (df['macd'] > df['macd_signal']) &
-            (df['adx'] > self.adx_threshold)
-        )
-        df.loc[buy_condition, 'signal'] = 1
+        # Detect EMA crossovers (1 bullish, -1 bearish)
+        ema_cross = ema_cross_kernel(ema_fast, ema_slow)
 
-        # Sell signal: Bearish EMA cross + MACD < Signal + ADX > threshold
-        sell_condition = (
-            (df['ema_cross'] == -1) &
-            (df['macd'] < df['macd_signal']) &
-            (df['adx'] > self.adx_threshold)
+        # Buy: bullish EMA cross + MACD > Signal + ADX > threshold
+        # Sell: bearish EMA cross + MACD < Signal + ADX > threshold
+        signal = trend_signal_kernel(
+            ema_cross, macd, macd_signal, adx, float(self.adx_threshold)
         )
-        df.loc[sell_condition, 'signal'] = -1
-
-        # Exit on opposite crossover
-        df['exit_long'] = df['ema_cross'] == -1
-        df['exit_short'] = df['ema_cross'] == 1
 
+        # Only columns the stop loss / take profit / exits read are kept
+        df = _with_columns(df, {
+            'ema_slow': ema_slow,
+            'atr': atr,
+            'ema_cross': ema_cross,
+            'signal': signal,
+            # Exit on opposite crossover
+            'exit_long': ema_cross == -1,
+            'exit_short': ema_cross == 1,
+        })
+
+        self._cache_last_bar(df, atr=atr, ema_slow=ema_slow)
         return df
 
     def get_stop_loss(self, df: pd.DataFrame, entry_price: float, action: str) -> float:
         """Stop loss at 2x ATR or below slow EMA"""
-        atr = df['atr'].iloc[-1]
-        ema_slow = df['ema_slow'].iloc[-1]
+        return self._stop_loss(
+            self._last_bar(df, 'atr'), self._last_bar(df, 'ema_slow'), entry_price, action
+        )
+
+    def get_stop_loss_at(self, view, i, entry_price, action) -> float:
+        """Stop loss at 2x ATR or below slow EMA (array version)"""
+        return self._stop_loss(view.columns['atr'][i], view.columns['ema_slow'][i], entry_price, action)
 
+    def _stop_loss(self, atr: float, ema_slow: float, entry_price: float, action: str) -> float:
         if action == 'BUY':
-            atr_stop = entry_price - (2 * atr)
+            atr_stop = entry_price - self._ATR_STOP_MULT * atr
             ema_stop = ema_slow - (0.5 * atr)
             stop_loss = max(atr_stop, ema_stop)  # More conservative
         else:  # SELL
-            atr_stop = entry_price + (2 * atr)
+            atr_stop = entry_price + self._ATR_STOP_MULT * atr
             ema_stop = ema_slow + (0.5 * atr)
             stop_loss = min(atr_stop, ema_stop)  # More conservative
 
@@ -270,6 +461,14 @@ class TrendFollowingStrategy(BaseStrategy):
     def get_take_profit(self, df: pd.DataFrame, entry_price: float, action: str) -> float:
         """Take profit at 3x risk (1:3 risk-reward)"""
         stop_loss = self.get_stop_loss(df, entry_price, action)
+        return self._take_profit(stop_loss, entry_price, action)
+
+    def get_take_profit_at(self, view, i, entry_price, action) -> float:
+        """Take profit at 3x risk (array version)"""
+        stop_loss = self.get_stop_loss_at(view, i, entry_price, action)
+        return self._take_profit(stop_loss, entry_price, action)
+
+    def _take_profit(self, stop_loss: float, entry_price: float, action: str) -> float:
         risk = abs(entry_price - stop_loss)
 
         if action == 'BUY':
@@ -279,6 +478,25 @@ class TrendFollowingStrategy(BaseStrategy):
 
         return round(take_profit, 5)
 
+    def precompute_sl_tp(self, df: pd.DataFrame):
+        """ATR/EMA stops and 1:3 targets for every bar"""
+        close = df['close'].to_numpy(dtype=np.float64)
+        atr = df['atr'].to_numpy(dtype=np.float64)
+        ema_slow = df['ema_slow'].to_numpy(dtype=np.float64)
+
+        # Same tie/NaN behaviour as max()/min() in _stop_loss
+        atr_stop = close - self._ATR_STOP_MULT * atr
+        ema_stop = ema_slow - 0.5 * atr
+        sl_long = np.round(np.where(ema_stop > atr_stop, ema_stop, atr_stop), 5)
+
+        atr_stop = close + self._ATR_STOP_MULT * atr
+        ema_stop = ema_slow + 0.5 * atr
+        sl_short = np.round(np.where(ema_stop < atr_stop, ema_stop, atr_stop), 5)
+
+        tp_long = np.round(close + 3 * np.abs(close - sl_long), 5)
+        tp_short = np.round(close - 3 * np.abs(close - sl_short), 5)
+        return sl_long, sl_short, tp_long, tp_short
+
 
 class OilCorrelationStrategy(BaseStrategy):
     """
@@ -288,6 +506,12 @@ class OilCorrelationStrategy(BaseStrategy):
     Best for: Strong oil price movements
     """
 
+    __slots__ = ('oil_threshold', 'correlation_lag')
+
+    # Fixed stop / target distances in price: 20 and 40 pips
+    _STOP_OFFSET = 20 * 0.0001
+    _TP_OFFSET = 40 * 0.0001
+
     def __init__(
         self,
         oil_threshold: float = 2.0,  # % oil price change
@@ -309,65 +533,70 @@ class OilCorrelationStrategy(BaseStrategy):
         """
         if 'oil_price' not in df.columns:
             print("Warning: No oil price data available")
-            df['signal'] = 0
+            df['signal'] = np.zeros(len(df), dtype=np.int8)
             return df
 
+        close = _as_f64(df['close'])
+
         # Calculate oil price change
-        df['oil_change_pct'] = df['oil_price'].pct_change() * 100
+        oil_change_pct = _pct_change_pct(_as_f64(df['oil_price']))
 
         # Calculate EUR/CAD change
-        df['eurcad_change_pct'] = df['close'].pct_change() * 100
+        eurcad_change_pct = _pct_change_pct(close)
 
         # Expected correlation: EUR/CAD should move opposite to oil
-        # Calculate expected vs actual divergence
-        df['expected_eurcad_change'] = -df['oil_change_pct']  # Negative correlation
-        df['divergence'] = df['eurcad_change_pct'] - df['expected_eurcad_change']
+        # (expected change = -oil change), so the divergence is the sum
+        divergence = eurcad_change_pct + oil_change_pct
 
         # Calculate ATR for stop loss
-        df['atr'] = talib.ATR(df['high'], df['low'], df['close'], timeperiod=14)
-
-        # Generate signals
-        df['signal'] = 0
+        df['atr'] = cached_atr(_as_f64(df['high']), _as_f64(df['low']), close, 14)
 
         # Strong oil up, EUR/CAD not reacting down enough → SHORT
         short_condition = (
-            (df['oil_change_pct'] > self.oil_threshold) &
-            (df['divergence'] > 0.5)  # EUR/CAD too high
+            (oil_change_pct > self.oil_threshold) &
+            (divergence > 0.5)  # EUR/CAD too high
         )
-        df.loc[short_condition, 'signal'] = -1
 
         # Strong oil down, EUR/CAD not reacting up enough → LONG
         long_condition = (
-            (df['oil_change_pct'] < -self.oil_threshold) &
-            (df['divergence'] < -0.5)  # EUR/CAD too low
+            (oil_change_pct < -self.oil_threshold) &
+            (divergence < -0.5)  # EUR/CAD too low
         )
-        df.loc[long_condition, 'signal'] = 1
+
+        # Generate signals
+        df['signal'] = _signal_column(long_condition, short_condition)
 
         return df
 
     def get_stop_loss(self, df: pd.DataFrame, entry_price: float, action: str) -> float:
         """Stop loss at 20 pips (tight for correlation trades)"""
-        pip_size = 0.0001
-        stop_pips = 20
-
         if action == 'BUY':
-            stop_loss = entry_price - (stop_pips * pip_size)
-        else:  # SELL
-            stop_loss = entry_price + (stop_pips * pip_size)
-
-        return round(stop_loss, 5)
+            return round(entry_price - self._STOP_OFFSET, 5)
+        return round(entry_price + self._STOP_OFFSET, 5)  # SELL
 
     def get_take_profit(self, df: pd.DataFrame, entry_price: float, action: str) -> float:
         """Take profit at 40 pips (2:1 reward-risk)"""
-        pip_size = 0.0001
-        profit_pips = 40
-
         if action == 'BUY':
-            take_profit = entry_price + (profit_pips * pip_size)
-        else:  # SELL
-            take_profit = entry_price - (profit_pips * pip_size)
+            return round(entry_price + self._TP_OFFSET, 5)
+        return round(entry_price - self._TP_OFFSET, 5)  # SELL
 
-        return round(take_profit, 5)
+    def get_stop_loss_at(self, view, i, entry_price, action) -> float:
+        """Fixed 20 pip stop; no market data needed"""
+        return self.get_stop_loss(None, entry_price, action)
+
+    def get_take_profit_at(self, view, i, entry_price, action) -> float:
+        """Fixed 40 pip target; no market data needed"""
+        return self.get_take_profit(None, entry_price, action)
+
+    def precompute_sl_tp(self, df: pd.DataFrame):
+        """Fixed 20 pip stops and 40 pip targets for every bar"""
+        close = df['close'].to_numpy(dtype=np.float64)
+
+        sl_long = np.round(close - self._STOP_OFFSET, 5)
+        sl_short = np.round(close + self._STOP_OFFSET, 5)
+        tp_long = np.round(close + self._TP_OFFSET, 5)
+        tp_short = np.round(close - self._TP_OFFSET, 5)
+        return sl_long, sl_short, tp_long, tp_short
 
 
 class BreakoutStrategy(BaseStrategy):
@@ -377,6 +606,8 @@ class BreakoutStrategy(BaseStrategy):
     Best for: Volatile market sessions (London open)
     """
 
+    __slots__ = ('range_period', 'breakout_threshold')
+
     def __init__(
         self,
         range_period: int = 50,  # periods to identify range
@@ -395,54 +626,77 @@ class BreakoutStrategy(BaseStrategy):
         - Buy on breakout above range with volume
         - Sell on breakdown below range with volume
         """
+        # Signals need the range (range_period bars) and average volume (20)
+        if len(df) < max(self.range_period, 20):
+            return _warmup_output(
+                df, ('range_high', 'range_low', 'range_size', 'atr'), {'signal': np.int8}
+            )
+
+        close = _as_f64(df['close'])
+        high = _as_f64(df['high'])
+        low = _as_f64(df['low'])
+
         # Calculate range
-        df['range_high'] = df['high'].rolling(window=self.range_period).max()
-        df['range_low'] = df['low'].rolling(window=self.range_period).min()
-        df['range_size'] = df['range_high'] - df['range_low']
+        range_high, range_low = rolling_max_min(high, low, self.range_period)
+        range_size = range_high - range_low
 
         # Calculate volume (if available, otherwise use price range as proxy)
-        if 'volume' not in df.columns:
-            df['volume'] = df['high'] - df['low']  # Use range as volume proxy
+        if 'volume' in df.columns:
+            volume = _as_f64(df['volume'])
+        else:
+            volume = high - low  # Use range as volume proxy
 
-        df['avg_volume'] = df['volume'].rolling(window=20).mean()
+        avg_volume = pd.Series(volume).rolling(window=20).mean().to_numpy()
 
         # Calculate ATR
-        df['atr'] = talib.ATR(df['high'], df['low'], df['close'], timeperiod=14)
+        atr = cached_atr(high, low, close, 14)
 
-        # Generate signals
-        df['signal'] = 0
+        # Volume spike + minimum range, shared by both directions
+        active = (volume > avg_volume * 1.5) & (range_size > self.breakout_threshold)
 
         # Buy signal: Close above range high + volume spike + minimum range
-        buy_condition = (
-            (df['close'] > df['range_high']) &
-            (df['volume'] > df['avg_volume'] * 1.5) &
-            (df['range_size'] > self.breakout_threshold)
-        )
-        df.loc[buy_condition, 'signal'] = 1
+        buy_condition = (close > range_high) & active
 
         # Sell signal: Close below range low + volume spike + minimum range
-        sell_condition = (
-            (df['close'] < df['range_low']) &
-            (df['volume'] > df['avg_volume'] * 1.5) &
-            (df['range_size'] > self.breakout_threshold)
+        sell_condition = (close < range_low) & active
+
+        # Only columns the stop loss / take profit read are kept
+        df = _with_columns(df, {
+            'range_high': range_high,
+            'range_low': range_low,
+            'range_size': range_size,
+            'atr': atr,
+            'signal': _signal_column(buy_condition, sell_condition),
+        })
+
+        self._cache_last_bar(
+            df, range_high=range_high, range_low=range_low, range_size=range_size
         )
-        df.loc[sell_condition, 'signal'] = -1
-
         return df
 
     def get_stop_loss(self, df: pd.DataFrame, entry_price: float, action: str) -> float:
         """Stop loss at opposite side of range"""
         if action == 'BUY':
-            stop_loss = df['range_low'].iloc[-1]
+            stop_loss = self._last_bar(df, 'range_low')
         else:  # SELL
-            stop_loss = df['range_high'].iloc[-1]
+            stop_loss = self._last_bar(df, 'range_high')
+
+        return round(stop_loss, 5)
 
+    def get_stop_loss_at(self, view, i, entry_price, action) -> float:
+        """Stop loss at opposite side of range (array version)"""
+        stop_loss = view.columns['range_low'][i] if action == 'BUY' else view.columns['range_high'][i]
         return round(stop_loss, 5)
 
     def get_take_profit(self, df: pd.DataFrame, entry_price: float, action: str) -> float:
         """Take profit at range size projected from breakout"""
-        range_size = df['range_size'].iloc[-1]
+        return self._take_profit(self._last_bar(df, 'range_size'), entry_price, action)
 
+    def get_take_profit_at(self, view, i, entry_price, action) -> float:
+        """Take profit at range size projected from breakout (array version)"""
+        return self._take_profit(view.columns['range_size'][i], entry_price, action)
+
+    def _take_profit(self, range_size: float, entry_price: float, action: str) -> float:
         if action == 'BUY':
             take_profit = entry_price + range_size
         else:  # SELL
@@ -450,8 +704,27 @@ class BreakoutStrategy(BaseStrategy):
 
         return round(take_profit, 5)
 
+    def precompute_sl_tp(self, df: pd.DataFrame):
+        """Opposite-side-of-range stops and range-size targets for every bar"""
+        close = df['close'].to_numpy(dtype=np.float64)
+        range_size = df['range_size'].to_numpy(dtype=np.float64)
+
+        sl_long = np.round(df['range_low'].to_numpy(dtype=np.float64), 5)
+        sl_short = np.round(df['range_high'].to_numpy(dtype=np.float64), 5)
+        tp_long = np.round(close + range_size, 5)
+        tp_short = np.round(close - range_size, 5)
+        return sl_long, sl_short, tp_long, tp_short
+
 
 # Strategy factory
+_STRATEGIES: Dict[str, Type[BaseStrategy]] = {
+    'mean_reversion': MeanReversionStrategy,
+    'trend_following': TrendFollowingStrategy,
+    'oil_correlation': OilCorrelationStrategy,
+    'breakout': BreakoutStrategy
+}
+
+
 def get_strategy(strategy_name: str, **kwargs) -> BaseStrategy:
     """
     Factory function to create strategy instances
@@ -463,17 +736,11 @@ def get_strategy(strategy_name: str, **kwargs) -> BaseStrategy:
     Returns:
         Strategy instance
     """
-    strategies = {
-        'mean_reversion': MeanReversionStrategy,
-        'trend_following': TrendFollowingStrategy,
-        'oil_correlation': OilCorrelationStrategy,
-        'breakout': BreakoutStrategy
-    }
-
-    if strategy_name not in strategies:
+    strategy_cls = _STRATEGIES.get(strategy_name)
+    if strategy_cls is None:
         raise ValueError(f"Unknown strategy: {strategy_name}")
 
-    return strategies[strategy_name](**kwargs)
+    return strategy_cls(**kwargs)
 
 
 # Example usage
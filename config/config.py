@@ -1,107 +1,194 @@
 """
 Configuration settings for EUR/CAD Trading Bot
+
+Settings live on the frozen Config dataclass; edit the defaults below.
+The module-level names (config.MAX_RISK_PER_TRADE etc.) are the same values
+under their upper-case names, so existing `config.X` reads keep working.
 """
 
-# IBKR Connection Settings
-IBKR_HOST = '127.0.0.1'
-IBKR_PAPER_PORT = 7497  # Paper trading
-IBKR_LIVE_PORT = 7496   # Live trading
-IBKR_CLIENT_ID = 1
-
-# Trading Parameters
-INITIAL_CAPITAL = 1000
-PAPER_TRADING = True  # Start with paper trading
-
-# Risk Management
-MAX_RISK_PER_TRADE = 0.01  # 1% per trade
-MAX_RISK_PER_TRADE_AGGRESSIVE = 0.015  # 1.5% for trend following
-MAX_DRAWDOWN = 0.12  # 12% maximum drawdown
-MAX_DAILY_LOSS = 0.03  # 3% maximum daily loss
-MAX_CONCURRENT_TRADES = 3
-MAX_DAILY_TRADES = 10
-MAX_TOTAL_PORTFOLIO_RISK = 0.05  # 5% total risk
-
-# Circuit Breakers
-MAX_CONSECUTIVE_LOSSES = 5
-HALT_ON_DRAWDOWN = 0.15  # 15% emergency stop
-
-# Strategy Parameters
-MEAN_REVERSION_RISK = 0.01
-TREND_FOLLOWING_RISK = 0.015
-GRID_TRADING_RISK = 0.008
-
-# Market Regime Detection
-ADX_STRONG_TREND_THRESHOLD = 30
-ADX_WEAK_TREND_THRESHOLD = 20
-ATR_HIGH_VOLATILITY_MULTIPLIER = 1.5
-ATR_LOW_VOLATILITY_MULTIPLIER = 0.8
-BB_WIDTH_BREAKOUT_MULTIPLIER = 0.7
-BB_WIDTH_LOW_VOL_MULTIPLIER = 0.6
-
-# Technical Indicators
-EMA_FAST = 20
-EMA_MEDIUM = 50
-EMA_SLOW = 200
-RSI_PERIOD = 14
-RSI_OVERSOLD = 30
-RSI_OVERBOUGHT = 70
-MACD_FAST = 12
-MACD_SLOW = 26
-MACD_SIGNAL = 9
-BB_PERIOD = 20
-BB_STD = 2
-ATR_PERIOD = 14
-ADX_PERIOD = 14
-
-# Position Management
-TRAILING_STOP_ATR_MULTIPLE = 3
-STOP_LOSS_ATR_MULTIPLE = 2
-PARTIAL_PROFIT_PERCENTAGE = 0.5  # Close 50% at TP1
-
-# EUR/CAD Specific
-EURCAD_SYMBOL = 'EURCAD'
-EURCAD_PIP_VALUE = 0.0001
-EURCAD_TYPICAL_SPREAD_PIPS = 0.6
-EURCAD_COMMISSION_PIPS = 0.6
-
-# Data Settings
-HISTORICAL_DATA_DURATION = '2 W'  # 2 weeks for analysis (increased from 5 days)
-HISTORICAL_DATA_BARSIZE = '1 hour'  # 1-hour bars
-MIN_DATA_POINTS = 200  # Minimum data points for analysis
-
-# Trading Schedule (UTC hours)
-TRADING_START_HOUR = 8   # 8 AM GMT (London open)
-TRADING_END_HOUR = 20    # 8 PM GMT
-AVOID_TRADING_WEEKENDS = True
-
-# Logging
-LOG_FILE = 'eurcad_bot.log'
-LOG_LEVEL = 'INFO'
-LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-
-# Dashboard (Optional)
-ENABLE_DASHBOARD = True  # Auto-start dashboard with the bot
-DASHBOARD_PORT = 8050
-DASHBOARD_UPDATE_INTERVAL = 5000  # 5 seconds
-
-# Backtesting
-BACKTEST_TRAIN_PERIOD_MONTHS = 6
-BACKTEST_TEST_PERIOD_MONTHS = 1
-BACKTEST_COMMISSION_PIPS = 0.6
-
-# Grid Trading Specific
-GRID_SPACING_PIPS = 10
-GRID_NUM_GRIDS = 10
-GRID_CAPITAL_ALLOCATION = 0.7  # Use 70% of capital for grids
-
-# Alert Settings (optional - implement as needed)
-ENABLE_TELEGRAM_ALERTS = False
-TELEGRAM_BOT_TOKEN = ''
-TELEGRAM_CHAT_ID = ''
-
-ENABLE_EMAIL_ALERTS = False
-EMAIL_SMTP_SERVER = ''
-EMAIL_SMTP_PORT = 587
-EMAIL_FROM = ''
-EMAIL_TO = ''
-EMAIL_PASSWORD = ''
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Config:
+    """Bot settings, read-only once loaded"""
+
+    # IBKR Connection Settings
+    ibkr_host: str = '127.0.0.1'
+    ibkr_paper_port: int = 7497  # Paper trading
+    ibkr_live_port: int = 7496   # Live trading
+    ibkr_client_id: int = 1
+
+    # Trading Parameters
+    initial_capital: int = 1000
+    paper_trading: bool = True  # Start with paper trading
+
+    # Risk Management
+    max_risk_per_trade: float = 0.01  # 1% per trade
+    max_risk_per_trade_aggressive: float = 0.015  # 1.5% for trend following
+    max_drawdown: float = 0.12  # 12% maximum drawdown
+    max_daily_loss: float = 0.03  # 3% maximum daily loss
+    max_concurrent_trades: int = 3
+    max_daily_trades: int = 10
+    max_total_portfolio_risk: float = 0.05  # 5% total risk
+
+    # Circuit Breakers
+    max_consecutive_losses: int = 5
+    halt_on_drawdown: float = 0.15  # 15% emergency stop
+
+    # Strategy Parameters
+    mean_reversion_risk: float = 0.01
+    trend_following_risk: float = 0.015
+    grid_trading_risk: float = 0.008
+
+    # Market Regime Detection
+    adx_strong_trend_threshold: int = 30
+    adx_weak_trend_threshold: int = 20
+    atr_high_volatility_multiplier: float = 1.5
+    atr_low_volatility_multiplier: float = 0.8
+    bb_width_breakout_multiplier: float = 0.7
+    bb_width_low_vol_multiplier: float = 0.6
+
+    # Technical Indicators
+    ema_fast: int = 20
+    ema_medium: int = 50
+    ema_slow: int = 200
+    rsi_period: int = 14
+    rsi_oversold: int = 30
+    rsi_overbought: int = 70
+    macd_fast: int = 12
+    macd_slow: int = 26
+    macd_signal: int = 9
+    bb_period: int = 20
+    bb_std: int = 2
+    atr_period: int = 14
+    adx_period: int = 14
+
+    # Position Management
+    trailing_stop_atr_multiple: int = 3
+    stop_loss_atr_multiple: int = 2
+    partial_profit_percentage: float = 0.5  # Close 50% at TP1
+
+    # EUR/CAD Specific
+    eurcad_symbol: str = 'EURCAD'
+    eurcad_pip_value: float = 0.0001
+    eurcad_typical_spread_pips: float = 0.6
+    eurcad_commission_pips: float = 0.6
+
+    # Data Settings
+    historical_data_duration: str = '2 W'  # 2 weeks for analysis (increased from 5 days)
+    historical_data_barsize: str = '1 hour'  # 1-hour bars
+    min_data_points: int = 200  # Minimum data points for analysis
+
+    # Trading Schedule (UTC hours)
+    trading_start_hour: int = 8   # 8 AM GMT (London open)
+    trading_end_hour: int = 20    # 8 PM GMT
+    avoid_trading_weekends: bool = True
+
+    # Logging
+    log_file: str = 'eurcad_bot.log'
+    log_level: str = 'INFO'
+    log_format: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+    # Dashboard (Optional)
+    enable_dashboard: bool = True  # Auto-start dashboard with the bot
+    dashboard_port: int = 8050
+    dashboard_update_interval: int = 5000  # 5 seconds
+
+    # Backtesting
+    backtest_train_period_months: int = 6
+    backtest_test_period_months: int = 1
+    backtest_commission_pips: float = 0.6
+
+    # Grid Trading Specific
+    grid_spacing_pips: int = 10
+    grid_num_grids: int = 10
+    grid_capital_allocation: float = 0.7  # Use 70% of capital for grids
+
+    # Alert Settings (optional - implement as needed)
+    enable_telegram_alerts: bool = False
+    telegram_bot_token: str = field(default='', repr=False)  # kept out of repr / logs
+    telegram_chat_id: str = ''
+
+    enable_email_alerts: bool = False
+    email_smtp_server: str = ''
+    email_smtp_port: int = 587
+    email_from: str = ''
+    email_to: str = ''
+    email_password: str = field(default='', repr=False)  # kept out of repr / logs
+
+
+CONFIG = Config()
+
+# Legacy module-level names, so existing `config.X` reads keep working
+IBKR_HOST = CONFIG.ibkr_host
+IBKR_PAPER_PORT = CONFIG.ibkr_paper_port
+IBKR_LIVE_PORT = CONFIG.ibkr_live_port
+IBKR_CLIENT_ID = CONFIG.ibkr_client_id
+INITIAL_CAPITAL = CONFIG.initial_capital
+PAPER_TRADING = CONFIG.paper_trading
+MAX_RISK_PER_TRADE = CONFIG.max_risk_per_trade
+MAX_RISK_PER_TRADE_AGGRESSIVE = CONFIG.max_risk_per_trade_aggressive
+MAX_DRAWDOWN = CONFIG.max_drawdown
+MAX_DAILY_LOSS = CONFIG.max_daily_loss
+MAX_CONCURRENT_TRADES = CONFIG.max_concurrent_trades
+MAX_DAILY_TRADES = CONFIG.max_daily_trades
+MAX_TOTAL_PORTFOLIO_RISK = CONFIG.max_total_portfolio_risk
+MAX_CONSECUTIVE_LOSSES = CONFIG.max_consecutive_losses
+HALT_ON_DRAWDOWN = CONFIG.halt_on_drawdown
+MEAN_REVERSION_RISK = CONFIG.mean_reversion_risk
+TREND_FOLLOWING_RISK = CONFIG.trend_following_risk
+GRID_TRADING_RISK = CONFIG.grid_trading_risk
+ADX_STRONG_TREND_THRESHOLD = CONFIG.adx_strong_trend_threshold
+ADX_WEAK_TREND_THRESHOLD = CONFIG.adx_weak_trend_threshold
+ATR_HIGH_VOLATILITY_MULTIPLIER = CONFIG.atr_high_volatility_multiplier
+ATR_LOW_VOLATILITY_MULTIPLIER = CONFIG.atr_low_volatility_multiplier
+BB_WIDTH_BREAKOUT_MULTIPLIER = CONFIG.bb_width_breakout_multiplier
+BB_WIDTH_LOW_VOL_MULTIPLIER = CONFIG.bb_width_low_vol_multiplier
+EMA_FAST = CONFIG.ema_fast
+EMA_MEDIUM = CONFIG.ema_medium
+EMA_SLOW = CONFIG.ema_slow
+RSI_PERIOD = CONFIG.rsi_period
+RSI_OVERSOLD = CONFIG.rsi_oversold
+RSI_OVERBOUGHT = CONFIG.rsi_overbought
+MACD_FAST = CONFIG.macd_fast
+MACD_SLOW = CONFIG.macd_slow
+MACD_SIGNAL = CONFIG.macd_signal
+BB_PERIOD = CONFIG.bb_period
+BB_STD = CONFIG.bb_std
+ATR_PERIOD = CONFIG.atr_period
+ADX_PERIOD = CONFIG.adx_period
+TRAILING_STOP_ATR_MULTIPLE = CONFIG.trailing_stop_atr_multiple
+STOP_LOSS_ATR_MULTIPLE = CONFIG.stop_loss_atr_multiple
+PARTIAL_PROFIT_PERCENTAGE = CONFIG.partial_profit_percentage
+EURCAD_SYMBOL = CONFIG.eurcad_symbol
+EURCAD_PIP_VALUE = CONFIG.eurcad_pip_value
+EURCAD_TYPICAL_SPREAD_PIPS = CONFIG.eurcad_typical_spread_pips
+EURCAD_COMMISSION_PIPS = CONFIG.eurcad_commission_pips
+HISTORICAL_DATA_DURATION = CONFIG.historical_data_duration
+HISTORICAL_DATA_BARSIZE = CONFIG.historical_data_barsize
+MIN_DATA_POINTS = CONFIG.min_data_points
+TRADING_START_HOUR = CONFIG.trading_start_hour
+TRADING_END_HOUR = CONFIG.trading_end_hour
+AVOID_TRADING_WEEKENDS = CONFIG.avoid_trading_weekends
+LOG_FILE = CONFIG.log_file
+LOG_LEVEL = CONFIG.log_level
+LOG_FORMAT = CONFIG.log_format
+ENABLE_DASHBOARD = CONFIG.enable_dashboard
+DASHBOARD_PORT = CONFIG.dashboard_port
+DASHBOARD_UPDATE_INTERVAL = CONFIG.dashboard_update_interval
+BACKTEST_TRAIN_PERIOD_MONTHS = CONFIG.backtest_train_period_months
+BACKTEST_TEST_PERIOD_MONTHS = CONFIG.backtest_test_period_months
+BACKTEST_COMMISSION_PIPS = CONFIG.backtest_commission_pips
+GRID_SPACING_PIPS = CONFIG.grid_spacing_pips
+GRID_NUM_GRIDS = CONFIG.grid_num_grids
+GRID_CAPITAL_ALLOCATION = CONFIG.grid_capital_allocation
+ENABLE_TELEGRAM_ALERTS = CONFIG.enable_telegram_alerts
+TELEGRAM_BOT_TOKEN = CONFIG.telegram_bot_token
+TELEGRAM_CHAT_ID = CONFIG.telegram_chat_id
+ENABLE_EMAIL_ALERTS = CONFIG.enable_email_alerts
+EMAIL_SMTP_SERVER = CONFIG.email_smtp_server
+EMAIL_SMTP_PORT = CONFIG.email_smtp_port
+EMAIL_FROM = CONFIG.email_from
+EMAIL_TO = CONFIG.email_to
+EMAIL_PASSWORD = CONFIG.email_password
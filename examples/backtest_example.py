@@ -24,36 +24,29 @@ def generate_sample_historical_data(bars=2000):
     dates = pd.date_range(start='2023-01-01', periods=bars, freq='H')
 
     # Generate realistic EUR/CAD price movements
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
 
     # Base price around 1.45
     base_price = 1.4500
 
-    # Create trending periods and ranging periods
-    trend_periods = bars // 4
-    trends = []
+    # Four periods, each either trending (random walk) or ranging (noise
+    # around the base), drawn as one matrix instead of period by period
+    trend_periods = -(-bars // 4)
+    scales = np.where(rng.random(4) > 0.5, 0.0008, 0.0003)[:, None]
+    trends = rng.standard_normal((4, trend_periods)) * scales
+    trending = scales[:, 0] == 0.0008
+    trends[trending] = np.cumsum(trends[trending], axis=1)
 
-    for _ in range(4):
-        # Alternate between trending and ranging
-        if np.random.rand() > 0.5:
-            # Trending period
-            trend = np.cumsum(np.random.randn(trend_periods) * 0.0008)
-        else:
-            # Ranging period
-            trend = np.random.randn(trend_periods) * 0.0003
-
-        trends.extend(trend)
-
-    trends = np.array(trends[:bars])
-    close_prices = base_price + trends
+    close_prices = base_price + trends.ravel()[:bars]
 
-    # Generate OHLCV
+    # Generate OHLCV from one draw for the open / high / low noise
+    noise = rng.standard_normal((bars, 3))
     data = {
-        'open': close_prices + np.random.randn(bars) * 0.0002,
-        'high': close_prices + abs(np.random.randn(bars) * 0.0005),
-        'low': close_prices - abs(np.random.randn(bars) * 0.0005),
+        'open': close_prices + noise[:, 0] * 0.0002,
+        'high': close_prices + np.abs(noise[:, 1] * 0.0005),
+        'low': close_prices - np.abs(noise[:, 2] * 0.0005),
         'close': close_prices,
-        'volume': np.random.randint(1000, 10000, bars)
+        'volume': rng.integers(1000, 10000, bars)
     }
 
     df = pd.DataFrame(data, index=dates)
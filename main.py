@@ -5,18 +5,14 @@ Run this file to start the trading bot
 
 import sys
 import os
-import asyncio
-
-# Fix for Python 3.14 event loop compatibility
-try:
-    asyncio.get_event_loop()
-except RuntimeError:
-    asyncio.set_event_loop(asyncio.new_event_loop())
 
 # Add src directory to path
 sys.path.append(os.path.dirname(__file__))
 
-from src.bot import main
+# The bot is synchronous (ib_insync's blocking API). src.ibkr.connector sets
+# up the event loop ib_insync needs before importing it, so no loop is
+# created here.
+from src.bot import main as bot_main
 
 if __name__ == "__main__":
-    main()
+    bot_main()
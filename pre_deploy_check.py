@@ -12,9 +12,11 @@ print()
 
 all_passed = True
 
-# Check 1: Python syntax
-print("1. Checking Python syntax...")
 import py_compile
+import importlib
+import types
+from concurrent.futures import ThreadPoolExecutor
+
 files_to_check = [
     'src/ibkr/connector.py',
     'src/risk_management/emergency_stop.py',
@@ -23,52 +25,66 @@ files_to_check = [
     'main.py'
 ]
 
-for file in files_to_check:
-    try:
-        py_compile.compile(file, doraise=True)
+classes_to_import = [
+    ('src.ibkr.connector', 'IBKRConnector'),
+    ('src.risk_management.emergency_stop', 'EmergencyStopSystem'),
+    ('src.risk_management.risk_manager', 'RiskManager'),
+    ('src.bot', 'EURCADTradingBot')
+]
+
+# Files compile in a thread pool while the imports run here. The imports
+# themselves stay sequential: the risk_management modules import each other,
+# and importing them from two threads at once can deadlock on the import lock
+with ThreadPoolExecutor(max_workers=8) as pool:
+    compile_futures = [pool.submit(py_compile.compile, file, doraise=True)
+                       for file in files_to_check]
+
+    import_results = []
+    for module, name in classes_to_import:
+        try:
+            cls = getattr(importlib.import_module(module), name)
+            import_results.append((name, cls, None))
+        except Exception as e:
+            import_results.append((name, None, e))
+
+    compile_results = []
+    for file, future in zip(files_to_check, compile_futures):
+        try:
+            future.result()
+            compile_results.append((file, None))
+        except Exception as e:
+            compile_results.append((file, e))
+
+# Check 1: Python syntax
+print("1. Checking Python syntax...")
+for file, error in compile_results:
+    if error is None:
         print(f"   ✅ {file}")
-    except Exception as e:
-        print(f"   ❌ {file}: {e}")
+    else:
+        print(f"   ❌ {file}: {error}")
         all_passed = False
 
 print()
 
 # Check 2: Import all modules
+# Everything imported here is loaded once and shared by the later checks
 print("2. Checking imports...")
-try:
-    from src.ibkr.connector import IBKRConnector
-    print("   ✅ IBKRConnector")
-except Exception as e:
-    print(f"   ❌ IBKRConnector: {e}")
-    all_passed = False
-
-try:
-    from src.risk_management.emergency_stop import EmergencyStopSystem
-    print("   ✅ EmergencyStopSystem")
-except Exception as e:
-    print(f"   ❌ EmergencyStopSystem: {e}")
-    all_passed = False
-
-try:
-    from src.risk_management.risk_manager import RiskManager
-    print("   ✅ RiskManager")
-except Exception as e:
-    print(f"   ❌ RiskManager: {e}")
-    all_passed = False
-
-try:
-    from src.bot import EURCADTradingBot
-    print("   ✅ EURCADTradingBot")
-except Exception as e:
-    print(f"   ❌ EURCADTradingBot: {e}")
-    all_passed = False
+resources = types.SimpleNamespace()
+for name, cls, error in import_results:
+    if error is None:
+        setattr(resources, name, cls)
+        print(f"   ✅ {name}")
+    else:
+        print(f"   ❌ {name}: {error}")
+        all_passed = False
 
 print()
 
 # Check 3: Verify new methods exist
 print("3. Checking new reconnection methods...")
 try:
-    connector = IBKRConnector()
+    # Only constructed (no connect()), so no socket is opened
+    connector = resources.IBKRConnector()
 
     assert hasattr(connector, 'check_connection'), "Missing check_connection"
     print("   ✅ check_connection() method exists")
@@ -94,8 +110,8 @@ print()
 # Check 4: Verify error tracking
 print("4. Checking error tracking improvements...")
 try:
-    rm = RiskManager(10000)
-    es = EmergencyStopSystem(rm)
+    rm = resources.RiskManager(10000)
+    es = resources.EmergencyStopSystem(rm)
 
     assert hasattr(es, 'consecutive_api_errors'), "Missing consecutive_api_errors"
     print("   ✅ consecutive_api_errors attribute exists")
@@ -120,6 +120,11 @@ else
     log "requirements.txt unchanged, skipping dependency update"
 fi
 
+# Precompile the project's bytecode so the service start (and any
+# pre_deploy_check.py run) loads cached .pyc files instead of parsing sources
+log "Precompiling Python bytecode..."
+python -m compileall -q -j 0 src config main.py pre_deploy_check.py
+
 # Step 5: Run database migrations (if applicable)
 # Uncomment if you add database migrations in the future
 # log "Step 4: Running database migrations..."
@@ -5,6 +5,9 @@ Walk-forward analysis with out-of-sample testing
 
 import pandas as pd
 import numpy as np
+import hashlib
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import logging
@@ -14,6 +17,194 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 from config import config
 
+from ._njit import njit
+
+# Bars skipped at the start of every backtest while indicators warm up
+WARMUP_BARS = 100
+
+# Full-history signal frames kept by Backtester for walk-forward reuse
+SIGNALS_CACHE_SIZE = 8
+
+# Open positions are closed at market after this many bars (48 hours on 1H)
+MAX_HOLD_BARS = 48
+
+# Exit reason codes in the simulation's trade records
+EXIT_STOP_LOSS = 1
+EXIT_TAKE_PROFIT = 2
+EXIT_TIME = 3
+EXIT_REASONS = {
+    EXIT_STOP_LOSS: 'stop_loss',
+    EXIT_TAKE_PROFIT: 'take_profit',
+    EXIT_TIME: 'time_exit'
+}
+
+# Trade records filled in by _simulate (bar indices, direction 1 / -1 and
+# exit reason codes are turned into times and labels only for the result;
+# pnl_pct is derived from pnl and the capital the trade was sized on)
+TRADE_DTYPE = np.dtype([
+    ('entry_index', np.int64),
+    ('exit_index', np.int64),
+    ('direction', np.int8),
+    ('entry_price', np.float64),
+    ('exit_price', np.float64),
+    ('pnl', np.float64),
+    ('pre_capital', np.float64),
+    ('exit_reason', np.int8)
+])
+
+
+@njit(cache=True, nogil=True)
+def _check_exit(direction, stop_loss, take_profit, high, low):
+    """(exit reason, exit price) of a position on one bar; (0, 0.0) if it stays open"""
+    # Signed by direction, one test covers both sides: the adverse extreme
+    # is the low for a long and the high for a short, and vice versa
+    adverse = low if direction == 1 else high
+    favorable = high if direction == 1 else low
+    if direction * (adverse - stop_loss) <= 0:
+        return EXIT_STOP_LOSS, stop_loss
+    if direction * (favorable - take_profit) >= 0:
+        return EXIT_TAKE_PROFIT, take_profit
+    return 0, 0.0
+
+
+@njit(cache=True, nogil=True)
+def _trade_pnl(direction, entry_price, exit_price, size, commission_cost):
+    """Realized P&L of a closed position after commission"""
+    if direction == 1:
+        price_change = exit_price - entry_price
+    else:
+        price_change = entry_price - exit_price
+    return (price_change - commission_cost) * size
+
+
+@njit(cache=True, nogil=True)
+def _simulate(highs, lows, closes, direction, entry, stop_loss, take_profit,
+              start, initial_capital, commission_cost, equity, trades):
+    """
+    Bar-by-bar trade simulation over pre-extracted arrays
+
+    direction[i] is 1 / -1 where a long / short position would be opened on
+    bar i if flat (0 otherwise), at entry[i] with stop_loss[i] and
+    take_profit[i]. Positions risk 1% of capital, exit on the stop, the first
+    target or after MAX_HOLD_BARS bars, and pay commission_cost per unit.
+
+    Fills equity (the curve from bar start - 1, len(closes) - start + 1
+    values) and trades (TRADE_DTYPE records, room for one per bar) in place.
+
+    Module constants (MAX_HOLD_BARS, exit codes) are frozen into the compiled
+    code; per-run values such as commission_cost stay arguments so a single
+    disk-cached compilation serves every backtester.
+
+    Returns:
+        (number of trades, final capital)
+    """
+    n = closes.shape[0]
+    # The single open position (pos_direction 0 when flat)
+    pos_direction = 0
+    pos_entry = 0.0
+    pos_stop = 0.0
+    pos_target = 0.0
+    pos_size = 0.0
+    pos_index = 0
+    n_trades = 0
+    capital = initial_capital
+    equity[0] = capital
+
+    for i in range(start, n):
+        # Entry (only when flat)
+        if pos_direction == 0 and direction[i] != 0:
+            # Position size for 1% risk
+            risk_per_trade = capital * 0.01
+            stop_distance = abs(entry[i] - stop_loss[i])
+            if stop_distance == 0:
+                size = 0.0
+            else:
+                size = (risk_per_trade / stop_distance) * entry[i]
+
+            pos_direction = direction[i]
+            pos_entry = entry[i]
+            pos_stop = stop_loss[i]
+            pos_target = take_profit[i]
+            pos_size = size
+            pos_index = i
+
+        # Exit: stop loss first, then take profit, then time
+        if pos_direction != 0:
+            reason, exit_price = _check_exit(pos_direction, pos_stop, pos_target,
+                                             highs[i], lows[i])
+
+            if reason == 0 and i - pos_index > MAX_HOLD_BARS:
+                reason = EXIT_TIME
+                exit_price = closes[i]
+
+            if reason != 0:
+                pnl = _trade_pnl(pos_direction, pos_entry, exit_price, pos_size,
+                                 commission_cost)
+
+                trade = trades[n_trades]
+                trade['entry_index'] = pos_index
+                trade['exit_index'] = i
+                trade['direction'] = pos_direction
+                trade['entry_price'] = pos_entry
+                trade['exit_price'] = exit_price
+                trade['pnl'] = pnl
+                trade['pre_capital'] = capital
+                trade['exit_reason'] = reason
+                n_trades += 1
+
+                capital += pnl
+                pos_direction = 0
+
+        # Equity curve, open position marked at the close
+        unrealized = (pos_direction * (closes[i] - pos_entry) * pos_size
+                      if pos_direction != 0 else 0.0)
+        equity[i - start + 1] = capital + unrealized
+
+    return n_trades, capital
+
+
+@njit(cache=True, nogil=True)
+def _metrics_core(equity, pnls, returns):
+    """
+    Single-pass performance statistics
+
+    Returns:
+        (max drawdown, mean and population std of returns (Welford),
+         winning / losing trade counts, gross profit, gross loss)
+    """
+    # Max drawdown from the running peak
+    running_max = -np.inf
+    min_drawdown = 0.0
+    for k in range(equity.shape[0]):
+        if equity[k] > running_max:
+            running_max = equity[k]
+        drawdown = (equity[k] - running_max) / running_max
+        if drawdown < min_drawdown:
+            min_drawdown = drawdown
+
+    # Return mean / variance and win / loss accounting over the trades
+    mean = 0.0
+    m2 = 0.0
+    n_wins = 0
+    n_losses = 0
+    gross_profit = 0.0
+    gross_loss = 0.0
+    for k in range(returns.shape[0]):
+        delta = returns[k] - mean
+        mean += delta / (k + 1)
+        m2 += delta * (returns[k] - mean)
+
+        if pnls[k] > 0:
+            n_wins += 1
+            gross_profit += pnls[k]
+        elif pnls[k] < 0:
+            n_losses += 1
+            gross_loss -= pnls[k]
+
+    n = returns.shape[0]
+    std = np.sqrt(m2 / n) if n > 0 else 0.0
+    return abs(min_drawdown), mean, std, n_wins, n_losses, gross_profit, gross_loss
+
 
 class Backtester:
     """
@@ -21,6 +212,10 @@ class Backtester:
     Walk-forward analysis with comprehensive metrics
     """
 
+    # generate_signals output on full data sets, keyed by (data hash,
+    # strategy hash); shared by all instances so repeated runs reuse it
+    _signals_cache: Dict[Tuple[str, str], pd.DataFrame] = {}
+
     def __init__(self, initial_capital: float = None, commission_pips: float = None):
         """
         Initialize backtester
@@ -35,7 +230,8 @@ class Backtester:
         self.logger = logging.getLogger(__name__)
 
     def run_backtest(self, df: pd.DataFrame, strategy,
-                    start_date: str, end_date: str) -> Dict:
+                    start_date: str, end_date: str,
+                    signals: Optional[pd.DataFrame] = None) -> Dict:
         """
         Run backtest on historical data
 
@@ -44,188 +240,176 @@ class Backtester:
             strategy: Strategy instance
             start_date: Start date for backtest
             end_date: End date for backtest
+            signals: strategy.generate_signals output covering the date range
+                (e.g. on all of df); sliced instead of generating signals on
+                the date range alone
 
         Returns:
             Dictionary with backtest results
         """
         # Filter data
-        df_test = df[(df.index >= start_date) & (df.index <= end_date)].copy()
+        source = df if signals is None else signals
+        df_test = self._date_range(source, start_date, end_date)
 
-        if len(df_test) < 100:
+        if len(df_test) < WARMUP_BARS:
             self.logger.warning("Insufficient data for backtest")
             return {}
 
-        # Initialize tracking
-        capital = self.initial_capital
-        positions = []
-        trades = []
-        equity_curve = [capital]
-
         # Generate signals
-        df_test = strategy.generate_signals(df_test)
-
-        # Simulate trading
-        for i in range(100, len(df_test)):  # Skip first 100 bars for indicators
-            current_bar = df_test.iloc[i]
-
-            # Check for entry signals
-            if current_bar.get('long_signal', False) and len(positions) == 0:
-                entry_data = strategy.calculate_entry_exit(
-                    df_test.iloc[:i+1], 'long'
-                )
-
-                if entry_data:
-                    position = self._open_position(
-                        'long', current_bar, entry_data, capital, i
-                    )
-                    positions.append(position)
-
-            elif current_bar.get('short_signal', False) and len(positions) == 0:
-                entry_data = strategy.calculate_entry_exit(
-                    df_test.iloc[:i+1], 'short'
-                )
-
-                if entry_data:
-                    position = self._open_position(
-                        'short', current_bar, entry_data, capital, i
-                    )
-                    positions.append(position)
-
-            # Check for exit conditions
-            closed_positions = []
-            for pos in positions:
-                close_result = self._check_exit(pos, current_bar, i)
-
-                if close_result:
-                    pnl = self._calculate_pnl(pos, close_result)
-                    capital += pnl
-
-                    trades.append({
-                        'entry_time': pos['entry_time'],
-                        'exit_time': close_result['time'],
-                        'type': pos['type'],
-                        'entry_price': pos['entry_price'],
-                        'exit_price': close_result['price'],
-                        'pnl': pnl,
-                        'pnl_pct': (pnl / capital) * 100,
-                        'exit_reason': close_result['reason']
-                    })
-
-                    closed_positions.append(pos)
-
-            # Remove closed positions
-            positions = [p for p in positions if p not in closed_positions]
-
-            # Update equity curve
-            unrealized_pnl = sum([
-                self._calculate_unrealized_pnl(p, current_bar)
-                for p in positions
-            ])
-            equity_curve.append(capital + unrealized_pnl)
+        if signals is None:
+            df_test = strategy.generate_signals(df_test)
+
+        # Extract bar data once for the compiled simulation loop
+        highs = df_test['high'].to_numpy(dtype=np.float64)
+        lows = df_test['low'].to_numpy(dtype=np.float64)
+        closes = df_test['close'].to_numpy(dtype=np.float64)
+        direction, entry, stop_loss, take_profit = self._entry_levels(strategy, df_test)
+
+        # Simulate trading (skip the first bars for indicators)
+        n_bars = len(df_test)
+        equity_curve = np.empty(n_bars - WARMUP_BARS + 1)
+        trade_buffer = np.empty(n_bars - WARMUP_BARS, dtype=TRADE_DTYPE)
+        n_trades, capital = _simulate(
+            highs, lows, closes, direction, entry, stop_loss, take_profit,
+            WARMUP_BARS, float(self.initial_capital),
+            self.commission_pips * self.pip_value, equity_curve, trade_buffer
+        )
+        trades = self._trades_frame(trade_buffer[:n_trades], df_test.index)
 
         # Calculate metrics
         metrics = self._calculate_metrics(trades, equity_curve)
 
         return {
-            'trades': pd.DataFrame(trades) if trades else pd.DataFrame(),
+            'trades': trades,
             'metrics': metrics,
             'equity_curve': equity_curve,
             'final_capital': capital
         }
 
-    def _open_position(self, position_type: str, bar: pd.Series,
-                      entry_data: Dict, capital: float, index: int) -> Dict:
-        """Open a new position"""
-        # Calculate position size (1% risk)
-        risk_per_trade = capital * 0.01
-        stop_distance = abs(entry_data['entry'] - entry_data['stop_loss'])
-
-        if stop_distance == 0:
-            position_size = 0
-        else:
-            position_size = (risk_per_trade / stop_distance) * entry_data['entry']
-
-        return {
-            'type': position_type,
-            'entry_price': entry_data['entry'],
-            'entry_time': bar.name,
-            'entry_index': index,
-            'stop_loss': entry_data['stop_loss'],
-            'take_profit_1': entry_data['take_profit_1'],
-            'take_profit_2': entry_data.get('take_profit_2'),
-            'size': position_size,
-            'partial_closed': False
-        }
-
-    def _check_exit(self, position: Dict, bar: pd.Series,
-                   index: int) -> Optional[Dict]:
-        """Check if position should be closed"""
-        # Check stop loss
-        if position['type'] == 'long':
-            if bar['low'] <= position['stop_loss']:
-                return {
-                    'price': position['stop_loss'],
-                    'time': bar.name,
-                    'reason': 'stop_loss'
-                }
-
-            # Check take profit
-            if bar['high'] >= position['take_profit_1']:
-                return {
-                    'price': position['take_profit_1'],
-                    'time': bar.name,
-                    'reason': 'take_profit'
-                }
-
-        else:  # short
-            if bar['high'] >= position['stop_loss']:
-                return {
-                    'price': position['stop_loss'],
-                    'time': bar.name,
-                    'reason': 'stop_loss'
-                }
-
-            if bar['low'] <= position['take_profit_1']:
-                return {
-                    'price': position['take_profit_1'],
-                    'time': bar.name,
-                    'reason': 'take_profit'
-                }
-
-        # Time-based exit (optional - for mean reversion)
-        if index - position['entry_index'] > 48:  # 48 hours for 1H timeframe
-            return {
-                'price': bar['close'],
-                'time': bar.name,
-                'reason': 'time_exit'
-            }
-
-        return None
-
-    def _calculate_pnl(self, position: Dict, close_result: Dict) -> float:
-        """Calculate P&L for closed position"""
-        if position['type'] == 'long':
-            price_change = close_result['price'] - position['entry_price']
-        else:
-            price_change = position['entry_price'] - close_result['price']
-
-        # Subtract commission
-        pnl = ((price_change - (self.commission_pips * self.pip_value)) *
-               position['size'])
+    @staticmethod
+    def _date_range(df: pd.DataFrame, start_date, end_date) -> pd.DataFrame:
+        """
+        Rows with start_date <= index <= end_date
 
-        return pnl
+        Sorted indexes are cut with a binary search and no row copy; the
+        result is only read (strategies copy in generate_signals).
+        """
+        index = df.index
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date)
+        if index.tz is not None and start.tz is None:
+            start = start.tz_localize(index.tz)
+            end = end.tz_localize(index.tz)
+
+        if index.is_monotonic_increasing:
+            first = index.searchsorted(start, side='left')
+            last = index.searchsorted(end, side='right')
+            return df.iloc[first:last]
+
+        return df[(index >= start) & (index <= end)]
+
+    @staticmethod
+    def _trades_frame(records: np.ndarray, times: pd.Index) -> pd.DataFrame:
+        """Trade log DataFrame from _simulate's TRADE_DTYPE records"""
+        if len(records) == 0:
+            return pd.DataFrame()
+
+        reasons = np.array([EXIT_REASONS.get(code) for code in range(max(EXIT_REASONS) + 1)],
+                           dtype=object)
+        return pd.DataFrame({
+            'entry_time': times[records['entry_index']],
+            'exit_time': times[records['exit_index']],
+            'type': np.where(records['direction'] == 1, 'long', 'short').astype(object),
+            'entry_price': records['entry_price'],
+            'exit_price': records['exit_price'],
+            'pnl': records['pnl'],
+            'pnl_pct': records['pnl'] / records['pre_capital'] * 100,
+            'exit_reason': reasons[records['exit_reason']]
+        })
+
+    @staticmethod
+    def _signal_array(df: pd.DataFrame, column: str) -> np.ndarray:
+        """Signal column as a bool array (all False if the strategy has none)"""
+        if column not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+        return df[column].to_numpy(dtype=bool)
+
+    def _full_signals(self, df: pd.DataFrame, strategy) -> pd.DataFrame:
+        """
+        strategy.generate_signals(df), memoized on the data and the strategy
 
-    def _calculate_unrealized_pnl(self, position: Dict, bar: pd.Series) -> float:
-        """Calculate unrealized P&L"""
-        if position['type'] == 'long':
-            return (bar['close'] - position['entry_price']) * position['size']
-        else:
-            return (position['entry_price'] - bar['close']) * position['size']
+        The key hashes the bar data (values, index and column names) and the
+        pickled strategy (class and full state, __slots__ included), so a
+        changed data set or parameter never reuses stale signals. Strategies
+        that cannot be pickled are not cached.
+        """
+        try:
+            strategy_state = pickle.dumps(strategy, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return strategy.generate_signals(df)
+
+        data_hash = hashlib.blake2b(
+            pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes(),
+            digest_size=16
+        )
+        data_hash.update(repr(list(df.columns)).encode())
+        strategy_key = hashlib.blake2b(strategy_state, digest_size=16).hexdigest()
+        key = (data_hash.hexdigest(), strategy_key)
+
+        signals = self._signals_cache.get(key)
+        if signals is None:
+            signals = strategy.generate_signals(df)
+            if len(self._signals_cache) >= SIGNALS_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._signals_cache.pop(next(iter(self._signals_cache)))
+            self._signals_cache[key] = signals
+
+        return signals
+
+    def _entry_levels(self, strategy, df: pd.DataFrame
+                      ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Direction, entry, stop loss and first target for every signal bar
 
-    def _calculate_metrics(self, trades_list: List[Dict],
-                          equity_curve: List[float]) -> Dict:
+        Long signals take precedence on bars flagged both ways. Bars whose
+        entry levels are rejected (e.g. R:R too low) get direction 0.
+        Strategies with calculate_entry_exit_vectorized are evaluated in one
+        pass; others get calculate_entry_exit per signal bar.
+        """
+        long_sig = self._signal_array(df, 'long_signal')
+        short_sig = self._signal_array(df, 'short_signal') & ~long_sig
+
+        if hasattr(strategy, 'calculate_entry_exit_vectorized'):
+            entry, stop_loss, take_profit, _ = strategy.calculate_entry_exit_vectorized(df)
+            direction = long_sig.astype(np.int8) - short_sig.astype(np.int8)
+            direction[np.isnan(entry)] = 0
+            direction[:WARMUP_BARS] = 0
+            return direction, entry, stop_loss, take_profit
+
+        n = len(df)
+        direction = np.zeros(n, dtype=np.int8)
+        entry = np.full(n, np.nan)
+        stop_loss = np.full(n, np.nan)
+        take_profit = np.full(n, np.nan)
+
+        for i in np.flatnonzero(long_sig | short_sig):
+            if i < WARMUP_BARS:
+                continue
+            signal_type = 'long' if long_sig[i] else 'short'
+            entry_data = strategy.calculate_entry_exit(df.iloc[:i+1], signal_type)
+
+            if entry_data:
+                direction[i] = 1 if signal_type == 'long' else -1
+                entry[i] = entry_data['entry']
+                stop_loss[i] = entry_data['stop_loss']
+                take_profit[i] = entry_data['take_profit_1']
+
+        return direction, entry, stop_loss, take_profit
+
+    def _calculate_metrics(self, trades: pd.DataFrame,
+                          equity_curve: np.ndarray) -> Dict:
         """Calculate comprehensive performance metrics"""
-        if not trades_list:
+        if len(trades) == 0:
             return {
                 'total_trades': 0,
                 'win_rate': 0,
@@ -236,36 +420,31 @@ class Backtester:
                 'max_drawdown': 0,
                 'sharpe_ratio': 0,
                 'total_return': 0,
-                'final_equity': equity_curve[-1] if equity_curve else 0
+                'final_equity': equity_curve[-1] if len(equity_curve) > 0 else 0
             }
 
-        trades = pd.DataFrame(trades_list)
+        # Drawdown, return statistics and win / loss accounting in one pass
+        equity = equity_curve
+        (max_drawdown, mean_return, std_return, n_wins, n_losses,
+         gross_profit, gross_loss) = _metrics_core(
+            equity, trades['pnl'].to_numpy(dtype=np.float64),
+            trades['pnl_pct'].to_numpy(dtype=np.float64)
+        )
 
         # Win rate
-        winning_trades = trades[trades['pnl'] > 0]
-        losing_trades = trades[trades['pnl'] < 0]
-        win_rate = len(winning_trades) / len(trades) if len(trades) > 0 else 0
+        win_rate = n_wins / len(trades)
 
         # Profit factor
-        gross_profit = winning_trades['pnl'].sum() if len(winning_trades) > 0 else 0
-        gross_loss = abs(losing_trades['pnl'].sum()) if len(losing_trades) > 0 else 0
         profit_factor = (gross_profit / gross_loss if gross_loss > 0
                         else float('inf') if gross_profit > 0 else 0)
 
         # Average win/loss
-        avg_win = winning_trades['pnl'].mean() if len(winning_trades) > 0 else 0
-        avg_loss = losing_trades['pnl'].mean() if len(losing_trades) > 0 else 0
-
-        # Max drawdown
-        equity = np.array(equity_curve)
-        running_max = np.maximum.accumulate(equity)
-        drawdown = (equity - running_max) / running_max
-        max_drawdown = abs(np.min(drawdown))
+        avg_win = gross_profit / n_wins if n_wins > 0 else 0
+        avg_loss = -gross_loss / n_losses if n_losses > 0 else 0
 
         # Sharpe ratio
-        returns = trades['pnl_pct'].values
-        sharpe_ratio = (np.mean(returns) / np.std(returns) * np.sqrt(252)
-                       if len(returns) > 0 and np.std(returns) > 0 else 0)
+        sharpe_ratio = (mean_return / std_return * np.sqrt(252)
+                       if std_return > 0 else 0)
 
         # Total return
         total_return = ((equity[-1] - equity[0]) / equity[0]
@@ -286,7 +465,9 @@ class Backtester:
 
     def walk_forward_analysis(self, df: pd.DataFrame, strategy,
                              train_period_months: int = None,
-                             test_period_months: int = None) -> Tuple[List, pd.DataFrame]:
+                             test_period_months: int = None,
+                             parallel: bool = False,
+                             max_workers: Optional[int] = None) -> Tuple[List, pd.DataFrame]:
         """
         Walk-forward analysis: train on historical data, test on forward period
 
@@ -295,6 +476,10 @@ class Backtester:
             strategy: Strategy instance
             train_period_months: Training period in months
             test_period_months: Testing period in months
+            parallel: Run the test windows in worker processes. Folds are
+                cheap once signals are shared, so this only pays off on long
+                histories; leave off for debugging
+            max_workers: Worker processes when parallel (default: CPU count)
 
         Returns:
             Tuple of (results list, metrics DataFrame)
@@ -306,9 +491,15 @@ class Backtester:
 
         results = []
 
+        # Indicators are causal, so signals computed once on the full history
+        # serve every test window (and carry real history into each window)
+        signals = self._full_signals(df, strategy)
+
         start_date = df.index[0]
         end_date = df.index[-1]
 
+        # Lay out the test windows first so they can run in any order
+        windows = []
         current_date = start_date
 
         while current_date < end_date:
@@ -323,9 +514,30 @@ class Backtester:
             if test_end > end_date:
                 break
 
-            # Run backtest on test period
-            result = self.run_backtest(df, strategy, str(test_start), str(test_end))
+            windows.append((test_start, test_end))
 
+            # Move forward
+            current_date = test_end
+
+        if parallel and len(windows) > 1:
+            # Each worker gets only its own window's rows, not the full history
+            settings = (self.initial_capital, self.commission_pips)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                fold_results = list(executor.map(
+                    _run_fold,
+                    [(self._date_range(signals, test_start, test_end),
+                      strategy, settings, str(test_start), str(test_end))
+                     for test_start, test_end in windows]
+                ))
+        else:
+            fold_results = [
+                self.run_backtest(df, strategy, str(test_start), str(test_end),
+                                  signals=signals)
+                for test_start, test_end in windows
+            ]
+
+        # Collect in window order, whatever order the folds finished in
+        for (test_start, test_end), result in zip(windows, fold_results):
             if result:
                 results.append({
                     'test_start': test_start,
@@ -334,9 +546,6 @@ class Backtester:
                     'trades': result.get('trades')
                 })
 
-            # Move forward
-            current_date = test_end
-
         # Aggregate results
         if results:
             all_metrics = pd.DataFrame([r['metrics'] for r in results])
@@ -351,3 +560,14 @@ class Backtester:
             return results, all_metrics
         else:
             return [], pd.DataFrame()
+
+
+def _run_fold(task: tuple) -> Dict:
+    """Run one walk_forward_analysis test window inside a worker process"""
+    window, strategy, settings, start_date, end_date = task
+    initial_capital, commission_pips = settings
+    backtester = Backtester(initial_capital=initial_capital,
+                            commission_pips=commission_pips)
+    # The window's signal frame also holds its OHLCV columns
+    return backtester.run_backtest(window, strategy, start_date, end_date,
+                                   signals=window)
@@ -6,7 +6,7 @@ Uses Bollinger Bands + RSI + MACD + Volume confluence
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import sys
 import os
 
@@ -141,6 +141,48 @@ class MeanReversionStrategy:
             'risk_reward_2': reward_2 / risk if risk > 0 else 0
         }
 
+    def calculate_entry_exit_vectorized(
+        self, df: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        calculate_entry_exit for every bar at once, in the bar's signal direction
+
+        Args:
+            df: DataFrame from generate_signals
+
+        Returns:
+            (entry, stop_loss, take_profit_1, take_profit_2) arrays; NaN on bars
+            without a signal or whose trade calculate_entry_exit would reject.
+            Long levels are used on bars flagged both ways.
+        """
+        close = df['close'].to_numpy(dtype=np.float64)
+        atr = df['ATR'].to_numpy(dtype=np.float64)
+        bb_middle = df['BB_middle'].to_numpy(dtype=np.float64)
+        long_sig = df['long_signal'].to_numpy(dtype=bool)
+        short_sig = df['short_signal'].to_numpy(dtype=bool) & ~long_sig
+
+        stop_offset = config.STOP_LOSS_ATR_MULTIPLE * atr
+        stop_loss = np.where(long_sig, close - stop_offset, close + stop_offset)
+        take_profit_1 = bb_middle
+        take_profit_2 = np.where(
+            long_sig, df['BB_upper'].to_numpy(dtype=np.float64),
+            df['BB_lower'].to_numpy(dtype=np.float64)
+        )
+
+        # Same R/R filter as calculate_entry_exit (minimum 1.5:1)
+        risk = np.abs(close - stop_loss)
+        reward_1 = np.abs(take_profit_1 - close)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rejected = (risk == 0) | (reward_1 / risk < 1.5)
+
+        valid = (long_sig | short_sig) & ~rejected
+        return (
+            np.where(valid, close, np.nan),
+            np.where(valid, stop_loss, np.nan),
+            np.where(valid, take_profit_1, np.nan),
+            np.where(valid, take_profit_2, np.nan)
+        )
+
     def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate all technical indicators"""
         df = df.copy()
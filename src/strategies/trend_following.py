@@ -6,7 +6,7 @@ Enters on pullbacks during strong trends with trailing stops
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import sys
 import os
 
@@ -139,6 +139,45 @@ class TrendFollowingStrategy:
             'risk_reward_2': reward_2 / risk if risk > 0 else 0
         }
 
+    def calculate_entry_exit_vectorized(
+        self, df: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        calculate_entry_exit for every bar at once, in the bar's signal direction
+
+        Args:
+            df: DataFrame from generate_signals
+
+        Returns:
+            (entry, stop_loss, take_profit_1, take_profit_2) arrays; NaN on bars
+            without a signal or whose trade calculate_entry_exit would reject.
+            Long levels are used on bars flagged both ways.
+        """
+        close = df['close'].to_numpy(dtype=np.float64)
+        atr = df['ATR'].to_numpy(dtype=np.float64)
+        long_sig = df['long_signal'].to_numpy(dtype=bool)
+        short_sig = df['short_signal'].to_numpy(dtype=bool) & ~long_sig
+
+        # +1 long, -1 short: levels mirror around the entry
+        side = np.where(long_sig, 1.0, -1.0)
+        stop_loss = close - side * (2.5 * atr)
+        take_profit_1 = close + side * (2 * atr)
+        take_profit_2 = close + side * (4 * atr)
+
+        # Same R/R filter as calculate_entry_exit (minimum 1.5:1)
+        risk = np.abs(close - stop_loss)
+        reward_1 = np.abs(take_profit_1 - close)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rejected = (risk == 0) | (reward_1 / risk < 1.5)
+
+        valid = (long_sig | short_sig) & ~rejected
+        return (
+            np.where(valid, close, np.nan),
+            np.where(valid, stop_loss, np.nan),
+            np.where(valid, take_profit_1, np.nan),
+            np.where(valid, take_profit_2, np.nan)
+        )
+
     def _calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """Calculate trend indicators"""
         df = df.copy()
@@ -0,0 +1,137 @@
+"""
+Tests for the EUR/CAD backtester
+Signal caching and walk-forward analysis
+"""
+
+import sys
+import os
+import pandas as pd
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(__file__)))
+
+from src.backtesting.backtester import Backtester
+from src.strategies.mean_reversion import MeanReversionStrategy
+
+
+def generate_sample_data(bars=1000):
+    """Generate sample hourly EUR/CAD OHLCV data"""
+    dates = pd.date_range(start='2024-01-01', periods=bars, freq='h')
+    rng = np.random.RandomState(42)
+    close_prices = 1.4500 + np.cumsum(rng.randn(bars) * 0.0012)
+
+    data = {
+        'open': close_prices + rng.randn(bars) * 0.0002,
+        'high': close_prices + abs(rng.randn(bars) * 0.0015),
+        'low': close_prices - abs(rng.randn(bars) * 0.0015),
+        'close': close_prices,
+        'volume': rng.randint(1000, 10000, bars)
+    }
+
+    return pd.DataFrame(data, index=dates)
+
+
+class CountingStrategy(MeanReversionStrategy):
+    """Mean reversion with a signal threshold, counting generate_signals calls"""
+
+    calls = 0  # class attribute: not part of the strategy's cached state
+
+    def __init__(self, threshold: float = 0.5):
+        super().__init__()
+        self.threshold = threshold
+
+    def generate_signals(self, df):
+        CountingStrategy.calls += 1
+        df = super().generate_signals(df)
+        df['long_signal'] = df['RSI'] < 50 * self.threshold
+        return df
+
+
+class SlottedStrategy:
+    """Strategy without a __dict__, like the skill scripts' strategies"""
+
+    __slots__ = ('threshold',)
+    calls = 0
+
+    def __init__(self, threshold: float = 0.5):
+        self.threshold = threshold
+
+    def generate_signals(self, df):
+        SlottedStrategy.calls += 1
+        df = df.copy()
+        df['long_signal'] = df['close'].diff() > self.threshold * 0.001
+        df['short_signal'] = False
+        return df
+
+
+def test_signals_cache():
+    """Same data and strategy reuse signals; changed data or parameters miss"""
+    Backtester._signals_cache.clear()
+    CountingStrategy.calls = 0
+    backtester = Backtester(initial_capital=10000)
+    df = generate_sample_data(1000)
+
+    first = backtester._full_signals(df, CountingStrategy(0.5))
+    second = backtester._full_signals(df, CountingStrategy(0.5))
+    assert CountingStrategy.calls == 1
+    assert second is first
+
+    # Changed parameter
+    other = backtester._full_signals(df, CountingStrategy(0.8))
+    assert CountingStrategy.calls == 2
+    assert not other['long_signal'].equals(first['long_signal'])
+
+    # Changed data (one close price)
+    changed = df.copy()
+    changed.iloc[500, changed.columns.get_loc('close')] += 0.001
+    backtester._full_signals(changed, CountingStrategy(0.5))
+    assert CountingStrategy.calls == 3
+
+    print("Signals cache: PASS")
+
+
+def test_signals_cache_slotted_strategy():
+    """Strategies with __slots__ are cached by their slot values"""
+    Backtester._signals_cache.clear()
+    SlottedStrategy.calls = 0
+    backtester = Backtester(initial_capital=10000)
+    df = generate_sample_data(1000)
+
+    backtester._full_signals(df, SlottedStrategy(0.5))
+    backtester._full_signals(df, SlottedStrategy(0.5))
+    assert SlottedStrategy.calls == 1
+
+    backtester._full_signals(df, SlottedStrategy(0.2))
+    assert SlottedStrategy.calls == 2
+
+    print("Signals cache with __slots__: PASS")
+
+
+def test_walk_forward_parallel_matches_serial():
+    """Walk-forward folds run in worker processes give the serial results"""
+    df = generate_sample_data(12000)
+    backtester = Backtester(initial_capital=10000, commission_pips=0.6)
+    strategy = CountingStrategy(0.8)
+
+    serial, serial_metrics = backtester.walk_forward_analysis(
+        df, strategy, train_period_months=3, test_period_months=1
+    )
+    parallel, parallel_metrics = backtester.walk_forward_analysis(
+        df, strategy, train_period_months=3, test_period_months=1,
+        parallel=True, max_workers=2
+    )
+
+    assert len(serial) > 1 and serial_metrics['total_trades'].sum() > 0
+    pd.testing.assert_frame_equal(serial_metrics, parallel_metrics)
+    for a, b in zip(serial, parallel):
+        assert (a['test_start'], a['test_end']) == (b['test_start'], b['test_end'])
+        pd.testing.assert_frame_equal(a['trades'], b['trades'])
+
+    print("Parallel walk-forward: PASS")
+
+
+if __name__ == "__main__":
+    test_signals_cache()
+    test_signals_cache_slotted_strategy()
+    test_walk_forward_parallel_matches_serial()
@@ -0,0 +1,72 @@
+"""
+Tests for the EUR/CAD skill risk manager
+Invalid sizing inputs must fail instead of producing oversized trades
+"""
+
+import sys
+import os
+import numpy as np
+
+# Skill scripts import each other as top-level modules
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                                '.claude', 'skills', 'eurcad-trading-bot', 'scripts'))
+
+from risk_manager import RejectReason, RiskManager, TradeRisk
+
+
+def assert_raises_value_error(func, *args, **kwargs):
+    """Call func and require a ValueError"""
+    try:
+        func(*args, **kwargs)
+    except ValueError:
+        return
+    raise AssertionError(f"{func.__name__}{args} did not raise ValueError")
+
+
+def test_position_size_rejects_invalid_stop():
+    """NaN, infinite or zero stop distances and NaN risk raise ValueError"""
+    rm = RiskManager(10000)
+    nan = float('nan')
+
+    assert_raises_value_error(rm.calculate_position_size, 1.45, nan)
+    assert_raises_value_error(rm.calculate_position_size, 1.45, 1.45)
+    assert_raises_value_error(rm.calculate_position_size, float('inf'), 1.45)
+    assert_raises_value_error(rm.calculate_position_size, 1.45, 1.448, risk_percent=nan)
+    assert_raises_value_error(rm.calculate_position_sizes,
+                              np.array([1.45, 1.45]), np.array([1.448, nan]))
+    assert_raises_value_error(rm.calculate_volatility_adjusted_size, 1.45, nan, 0.001, 0.001)
+
+    # Valid inputs still size normally (2% of 10,000 over a 20 pip stop)
+    trade_risk = rm.calculate_position_size(1.45, 1.448)
+    assert trade_risk.position_size == 100000
+
+    print("Invalid stop rejection: PASS")
+
+
+def test_can_open_position_rejects_non_finite_risk():
+    """A TradeRisk with NaN / inf risk is never approved"""
+    rm = RiskManager(10000)
+    nan = float('nan')
+
+    for risk_amount, risk_percent in [(nan, nan), (nan, 0.01), (100.0, nan), (float('inf'), 0.01)]:
+        trade_risk = TradeRisk(
+            position_size=1000,
+            stop_loss_pips=20.0,
+            stop_loss_price=1.448,
+            risk_amount=risk_amount,
+            risk_percent=risk_percent
+        )
+        can_open, reason, _ = rm.can_open_position(trade_risk)
+        assert not can_open
+        assert reason == RejectReason.INVALID_RISK
+
+    valid_risk = rm.calculate_position_size(1.45, 1.448, risk_percent=0.01)
+    can_open, reason, _ = rm.can_open_position(valid_risk)
+    assert can_open and reason == RejectReason.OK
+
+    print("Non-finite risk rejection: PASS")
+
+
+if __name__ == "__main__":
+    test_position_size_rejects_invalid_stop()
+    test_can_open_position_rejects_non_finite_risk()
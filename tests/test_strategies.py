@@ -120,6 +120,58 @@ def test_trend_following_strategy():
     print("\nTrend Following Strategy: PASS")
 
 
+def assert_vectorized_entry_exit_matches(strategy, df):
+    """
+    calculate_entry_exit_vectorized must give calculate_entry_exit's levels
+    on every signal bar, and NaN where calculate_entry_exit rejects the trade
+    """
+    df_with_signals = strategy.generate_signals(df)
+
+    # Random signals on every kind of bar (including both ways at once), so
+    # accepted and R:R-rejected trades are both covered
+    rng = np.random.RandomState(7)
+    u = rng.rand(len(df_with_signals))
+    df_with_signals['long_signal'] = (u < 0.3) | (u > 0.95)
+    df_with_signals['short_signal'] = u > 0.6
+
+    entry, stop_loss, take_profit_1, take_profit_2 = (
+        strategy.calculate_entry_exit_vectorized(df_with_signals)
+    )
+
+    accepted = rejected = 0
+    for i in np.flatnonzero(df_with_signals['long_signal'] | df_with_signals['short_signal']):
+        signal_type = 'long' if df_with_signals['long_signal'].iloc[i] else 'short'
+        entry_data = strategy.calculate_entry_exit(df_with_signals.iloc[:i+1], signal_type)
+
+        if entry_data is None:
+            assert np.isnan(entry[i]), f"bar {i}: rejected {signal_type} has entry {entry[i]}"
+            rejected += 1
+        else:
+            np.testing.assert_equal(
+                [entry[i], stop_loss[i], take_profit_1[i], take_profit_2[i]],
+                [entry_data['entry'], entry_data['stop_loss'],
+                 entry_data['take_profit_1'], entry_data['take_profit_2']],
+                err_msg=f"bar {i} ({signal_type})"
+            )
+            accepted += 1
+
+    no_signal = ~(df_with_signals['long_signal'] | df_with_signals['short_signal']).to_numpy()
+    assert np.isnan(entry[no_signal]).all()
+    assert accepted > 0 and rejected > 0
+
+    print(f"{strategy.name}: {accepted} accepted / {rejected} rejected signal bars match")
+
+
+def test_mean_reversion_vectorized_entry_exit():
+    """Vectorized Mean Reversion levels match calculate_entry_exit"""
+    assert_vectorized_entry_exit_matches(MeanReversionStrategy(), generate_sample_data())
+
+
+def test_trend_following_vectorized_entry_exit():
+    """Vectorized Trend Following levels match calculate_entry_exit"""
+    assert_vectorized_entry_exit_matches(TrendFollowingStrategy(), generate_trending_data())
+
+
 def test_grid_trading_strategy():
     """Test Grid Trading Strategy"""
     print("\n" + "="*60)
@@ -241,6 +293,8 @@ def main():
     try:
         test_mean_reversion_strategy()
         test_trend_following_strategy()
+        test_mean_reversion_vectorized_entry_exit()
+        test_trend_following_vectorized_entry_exit()
         test_grid_trading_strategy()
         test_regime_detector()
 
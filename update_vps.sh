@@ -23,6 +23,9 @@ if [ "$ON_VPS" = true ]; then
     echo "Waiting 5 seconds..."
     sleep 5
 
+    echo "Precompiling bytecode..."
+    python3 -m compileall -q -j 0 src config main.py pre_deploy_check.py
+
     echo "Starting bot with new reconnection logic..."
     nohup python3 main.py > bot_output.log 2>&1 &
 
@@ -35,6 +38,7 @@ else
     echo ""
     echo "  cd /path/to/ForexBot"
     echo "  git pull origin main"
+    echo "  python3 -m compileall -q -j 0 src config main.py pre_deploy_check.py"
     echo "  pkill -f 'python.*main.py'"
     echo "  sleep 5"
     echo "  nohup python3 main.py > bot_output.log 2>&1 &"